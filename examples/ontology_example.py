@@ -4,51 +4,219 @@ Example: RDF/OWL Ontology Management
 This example demonstrates how to work with RDF graphs and OWL ontologies.
 """
 
+import hashlib
+import os
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 from dotenv import load_dotenv
 from owlrl import DeductiveClosure, RDFS_Semantics
 from rdflib import Graph, Literal, Namespace
 from rdflib.namespace import OWL, RDF, RDFS
+from rdflib.plugins.sparql import prepareQuery
+
+try:
+    import pyoxigraph
+
+    OXIGRAPH_AVAILABLE = True
+except ImportError:
+    OXIGRAPH_AVAILABLE = False
+
+CLOSURE_CACHE_DIR = Path(__file__).parent / "closure_cache"
+
+# Below this size the process start-up and N-Triples round trip cost more than
+# the closure itself
+PARALLEL_CLOSURE_THRESHOLD = 50_000
+
+# Custom namespace for the sample ontology
+EX = Namespace("http://example.org/ontology#")
+
+# Parsed and translated to algebra once at import, reused by every query_ontology call
+INSTANCES_QUERY = prepareQuery(
+    """
+    SELECT ?instance ?type WHERE {
+        ?instance rdf:type ?type .
+        FILTER(?type != owl:NamedIndividual)
+    }
+    """,
+    initNs={"rdf": RDF, "owl": OWL},
+)
 
 
 def create_sample_ontology():
     """Create a sample ontology with classes and properties."""
     g = Graph()
 
-    # Define custom namespace
-    EX = Namespace("http://example.org/ontology#")
     g.bind("ex", EX)
     g.bind("owl", OWL)
 
-    # Define classes
-    g.add((EX.Animal, RDF.type, OWL.Class))
-    g.add((EX.Mammal, RDF.type, OWL.Class))
-    g.add((EX.Dog, RDF.type, OWL.Class))
+    triples = [
+        # Define classes
+        (EX.Animal, RDF.type, OWL.Class),
+        (EX.Mammal, RDF.type, OWL.Class),
+        (EX.Dog, RDF.type, OWL.Class),
+        # Define class hierarchy
+        (EX.Mammal, RDFS.subClassOf, EX.Animal),
+        (EX.Dog, RDFS.subClassOf, EX.Mammal),
+        # Define properties
+        (EX.hasName, RDF.type, OWL.DatatypeProperty),
+        (EX.hasOwner, RDF.type, OWL.ObjectProperty),
+        # Add instances
+        (EX.Buddy, RDF.type, EX.Dog),
+        (EX.Buddy, EX.hasName, Literal("Buddy")),
+    ]
+    g.addN((s, p, o, g) for s, p, o in triples)
 
-    # Define class hierarchy
-    g.add((EX.Mammal, RDFS.subClassOf, EX.Animal))
-    g.add((EX.Dog, RDFS.subClassOf, EX.Mammal))
+    print(f"✅ Created sample ontology with {len(g)} triples")
+    return g
 
-    # Define properties
-    g.add((EX.hasName, RDF.type, OWL.DatatypeProperty))
-    g.add((EX.hasOwner, RDF.type, OWL.ObjectProperty))
 
-    # Add instances
-    g.add((EX.Buddy, RDF.type, EX.Dog))
-    g.add((EX.Buddy, EX.hasName, Literal("Buddy")))
+def _graph_digest(g: Graph) -> str:
+    """Hash the graph's triples independent of insertion order."""
+    lines = sorted(g.serialize(format="nt", encoding="utf-8").splitlines())
+    return hashlib.sha256(b"\n".join(lines)).hexdigest()
 
-    print(f"✅ Created sample ontology with {len(g)} triples")
-    return g
+
+def _uses_owl_predicates(g: Graph) -> bool:
+    """Return True if any predicate lives in the OWL namespace."""
+    owl_ns = str(OWL)
+    return any(str(p).startswith(owl_ns) for p in g.predicates(unique=True))
+
+
+def _transitive_supers(pairs):
+    """Map each node to all of its ancestors given (sub, super) pairs (Warshall)."""
+    supers = defaultdict(set)
+    for sub, sup in pairs:
+        supers[sub].add(sup)
+
+    for k in list(supers):
+        for i in supers:
+            if k in supers[i]:
+                supers[i] |= supers[k]
+    return supers
+
+
+def _hierarchy_triples(triples):
+    """RDFS-5 / RDFS-11: transitive subPropertyOf and subClassOf."""
+    triples = list(triples)
+    inferred = []
+    for pred in (RDFS.subPropertyOf, RDFS.subClassOf):
+        supers = _transitive_supers((s, o) for s, p, o in triples if p == pred)
+        inferred.extend((sub, pred, sup) for sub, sups in supers.items() for sup in sups)
+    return inferred
+
+
+def _domain_range_triples(triples):
+    """RDFS-2 / RDFS-3: type subjects and objects from rdfs:domain / rdfs:range."""
+    triples = list(triples)
+    domains, ranges = defaultdict(set), defaultdict(set)
+    for s, p, o in triples:
+        if p == RDFS.domain:
+            domains[s].add(o)
+        elif p == RDFS.range:
+            ranges[s].add(o)
+
+    inferred = []
+    for s, p, o in triples:
+        inferred.extend((s, RDF.type, cls) for cls in domains.get(p, ()))
+        if not isinstance(o, Literal):
+            inferred.extend((o, RDF.type, cls) for cls in ranges.get(p, ()))
+    return inferred
+
+
+def _to_nt(triples) -> str:
+    g = Graph()
+    g.addN((s, p, o, g) for s, p, o in triples)
+    return g.serialize(format="nt", encoding="utf-8").decode("utf-8")
 
 
-def apply_reasoning(g: Graph):
-    """Apply RDFS reasoning to infer new triples."""
+def _hierarchy_worker(nt: str) -> str:
+    return _to_nt(_hierarchy_triples(Graph().parse(data=nt, format="nt")))
+
+
+def _domain_range_worker(nt: str) -> str:
+    return _to_nt(_domain_range_triples(Graph().parse(data=nt, format="nt")))
+
+
+def _rdfs_closure(g: Graph, parallel: bool = False):
+    """Materialize a minimal RDFS closure (rules 2, 3, 5, 7, 9 and 11).
+
+    The hierarchy rules (5/11) and domain/range rules (2/3) read disjoint
+    parts of the graph, so with ``parallel=True`` they run in two worker
+    processes; partitions cross the process boundary as N-Triples. Rules 7
+    and 9 depend on both results and are applied afterwards in-process.
+    """
+    hierarchy = [t for t in g if t[1] in (RDFS.subClassOf, RDFS.subPropertyOf)]
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            hier_future = pool.submit(_hierarchy_worker, _to_nt(hierarchy))
+            dr_future = pool.submit(_domain_range_worker, _to_nt(g))
+            g.parse(data=hier_future.result(), format="nt")
+            g.parse(data=dr_future.result(), format="nt")
+    else:
+        g.addN((s, p, o, g) for s, p, o in _hierarchy_triples(hierarchy))
+        g.addN((s, p, o, g) for s, p, o in _domain_range_triples(g))
+
+    # RDFS-7: copy statements up the (now transitive) property hierarchy, then
+    # type the copies via domain/range since they use new predicates
+    super_props = defaultdict(set)
+    for sub, sup in g.subject_objects(RDFS.subPropertyOf):
+        super_props[sub].add(sup)
+    lifted = [
+        (s, sup, o) for s, p, o in g if p in super_props for sup in super_props[p] if sup != p
+    ]
+    g.addN((s, p, o, g) for s, p, o in lifted)
+    if lifted:
+        schema = [t for t in g if t[1] in (RDFS.domain, RDFS.range)]
+        g.addN((s, p, o, g) for s, p, o in _domain_range_triples(schema + lifted))
+
+    # RDFS-9: propagate types up the subclass hierarchy
+    super_classes = defaultdict(set)
+    for sub, sup in g.subject_objects(RDFS.subClassOf):
+        super_classes[sub].add(sup)
+    g.addN(
+        (inst, RDF.type, sup, g)
+        for inst, cls in list(g.subject_objects(RDF.type))
+        for sup in super_classes.get(cls, ())
+    )
+
+
+def apply_reasoning(g: Graph, cache_dir: Path | None = CLOSURE_CACHE_DIR):
+    """Apply RDFS reasoning to infer new triples.
+
+    The closure is cached under ``cache_dir`` keyed by a hash of the input
+    graph, so re-running on an unchanged graph skips saturation. It is pickled
+    rather than written as N-Triples because owlrl emits generalized triples
+    (e.g. literal subjects) that N-Triples cannot represent. Pass
+    ``cache_dir=None`` to always recompute.
+
+    Graphs without OWL predicates get a minimal RDFS closure, split across
+    two processes once they reach ``PARALLEL_CLOSURE_THRESHOLD`` triples;
+    anything else goes through owlrl.
+    """
     print("\n🧠 Applying RDFS reasoning...")
 
     # Get initial count
     initial_count = len(g)
 
-    # Apply RDFS reasoning
-    DeductiveClosure(RDFS_Semantics).expand(g)
+    cache_file = cache_dir / f"{_graph_digest(g)}.pickle" if cache_dir else None
+    if cache_file and cache_file.exists():
+        with cache_file.open("rb") as f:
+            for triple in pickle.load(f):
+                g.add(triple)
+        print(f"   Loaded cached closure from {cache_file.name}")
+    else:
+        # Apply RDFS reasoning
+        if _uses_owl_predicates(g):
+            DeductiveClosure(RDFS_Semantics).expand(g)
+        else:
+            _rdfs_closure(g, parallel=len(g) >= PARALLEL_CLOSURE_THRESHOLD)
+        if cache_file:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with cache_file.open("wb") as f:
+                pickle.dump(list(g), f)
 
     # Get new count
     final_count = len(g)
@@ -60,46 +228,90 @@ def apply_reasoning(g: Graph):
     return g
 
 
-def query_ontology(g: Graph):
-    """Query the ontology using SPARQL."""
-    print("\n🔍 Querying ontology...")
+# Same listing as INSTANCES_QUERY plus types_of(), expressed as a property path
+# so oxigraph's planner does the subclass walk
+OXIGRAPH_INSTANCE_TYPES_QUERY = """
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX owl: <http://www.w3.org/2002/07/owl#>
 
-    # Query for all classes
-    query = """
-    PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-    PREFIX owl: <http://www.w3.org/2002/07/owl#>
+SELECT DISTINCT ?instance ?type WHERE {
+    ?instance rdf:type/rdfs:subClassOf* ?type .
+    FILTER(?type != owl:NamedIndividual)
+}
+"""
+
+
+def types_of(g: Graph, inst):
+    """Yield an instance's types, walking subClassOf upward on demand (RDFS-9 at query time)."""
+    seen = set()
+    for cls in g.objects(inst, RDF.type):
+        for sup in g.transitive_objects(cls, RDFS.subClassOf):
+            if sup not in seen:
+                seen.add(sup)
+                yield sup
 
-    SELECT ?class WHERE {
-        ?class rdf:type owl:Class .
-    }
-    """
 
+def query_ontology(g: Graph):
+    """Query the ontology for its classes and typed instances."""
+    print("\n🔍 Querying ontology...")
+
+    # A single-pattern lookup needs no SPARQL engine: one index probe
     print("  Classes in ontology:")
-    for row in g.query(query):
-        class_uri = str(row[0]).split("#")[-1]
+    for cls in g.subjects(RDF.type, OWL.Class):
+        class_uri = str(cls).split("#")[-1]
         print(f"    - {class_uri}")
 
-    # Query for instances and their types
-    instance_query = """
-    PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-    PREFIX ex: <http://example.org/ontology#>
+    print("\n  Instances and their types:")
+    # Namespace check happens here rather than as a STRSTARTS FILTER, which
+    # would force string coercion of every rdf:type row inside the engine
+    ex_prefix = str(EX)
+    instances = dict.fromkeys(
+        row[0] for row in g.query(INSTANCES_QUERY) if str(row[0]).startswith(ex_prefix)
+    )
+    for instance in instances:
+        inst = str(instance).split("#")[-1]
+        for type_uri in types_of(g, instance):
+            if type_uri == OWL.NamedIndividual:
+                continue
+            typ = str(type_uri).split("#")[-1]
+            print(f"    - {inst} is a {typ}")
+
+
+def to_oxigraph(g: Graph):
+    """Bulk-load an rdflib graph into an in-memory pyoxigraph Store."""
+    store = pyoxigraph.Store()
+    store.load(g.serialize(format="nt", encoding="utf-8"), pyoxigraph.RdfFormat.N_TRIPLES)
+    return store
+
+
+def query_ontology_oxigraph(store):
+    """Run the query_ontology listings against a pyoxigraph Store."""
+    print("\n🔍 Querying ontology (oxigraph)...")
 
-    SELECT ?instance ?type WHERE {
-        ?instance rdf:type ?type .
-        FILTER(STRSTARTS(STR(?instance), "http://example.org/ontology#"))
-        FILTER(?type != <http://www.w3.org/2002/07/owl#NamedIndividual>)
-    }
-    """
+    print("  Classes in ontology:")
+    for row in store.query(
+        "SELECT ?class WHERE { ?class a <http://www.w3.org/2002/07/owl#Class> }"
+    ):
+        class_uri = row["class"].value.split("#")[-1]
+        print(f"    - {class_uri}")
 
     print("\n  Instances and their types:")
-    for row in g.query(instance_query):
-        inst = str(row[0]).split("#")[-1]
-        typ = str(row[1]).split("#")[-1]
+    ex_prefix = str(EX)
+    for row in store.query(OXIGRAPH_INSTANCE_TYPES_QUERY):
+        if not row["instance"].value.startswith(ex_prefix):
+            continue
+        inst = row["instance"].value.split("#")[-1]
+        typ = row["type"].value.split("#")[-1]
         print(f"    - {inst} is a {typ}")
 
 
-def serialize_ontology(g: Graph, format="turtle"):
-    """Serialize the ontology to different formats."""
+def serialize_ontology(g: Graph, format="nt"):
+    """Serialize the ontology to different formats.
+
+    Defaults to N-Triples, a line-per-triple writer with no prefix compaction;
+    pass ``format="turtle"`` for human-readable output.
+    """
     print(f"\n📄 Serializing ontology to {format} format...")
 
     serialized = g.serialize(format=format)
@@ -119,11 +331,19 @@ def main():
     # Create ontology
     g = create_sample_ontology()
 
-    # Apply reasoning
-    g = apply_reasoning(g)
-
-    # Query ontology
-    query_ontology(g)
+    # Inherited types are inferred at query time by types_of(), so the full
+    # closure from apply_reasoning() is not materialized for this demo
+
+    # Query ontology; set USE_OXIGRAPH=1 (with pyoxigraph installed) to run
+    # the queries on oxigraph's Rust store instead of rdflib
+    if os.environ.get("USE_OXIGRAPH", "0") == "1":
+        if OXIGRAPH_AVAILABLE:
+            query_ontology_oxigraph(to_oxigraph(g))
+        else:
+            print("Warning: pyoxigraph not installed. Querying with rdflib.")
+            query_ontology(g)
+    else:
+        query_ontology(g)
 
     # Serialize
     serialize_ontology(g)
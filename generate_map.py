@@ -1,14 +1,144 @@
 #!/usr/bin/env python3
 """
 Generate Oregon Trail map image
+
+Shapes are rasterized as boolean masks into a single NumPy array and handed to
+PIL once; PIL is only used for the text labels.
 """
 
+import functools
+import os
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+
+
+@functools.cache
+def _font_path():
+    """First candidate font file present on this machine, probed once."""
+    return next((p for p in FONT_CANDIDATES if os.path.exists(p)), None)
+
+
+def load_font(size):
+    path = _font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
 # Create image
 width, height = 1200, 600
-img = Image.new("RGB", (width, height), color="#2980b9")  # Ocean blue
-draw = ImageDraw.Draw(img)
+
+# Pixel-centre coordinates shared by every mask
+ys, xs = np.mgrid[0:height, 0:width] + 0.5
+
+
+def rgb(hex_color):
+    """'#rrggbb' -> (r, g, b)"""
+    return tuple(int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
+
+
+def window(x_min, y_min, x_max, y_max):
+    """Array slices covering a bounding box plus a 1px margin, clipped to the image."""
+    return (
+        slice(max(int(y_min) - 1, 0), min(int(y_max) + 2, height)),
+        slice(max(int(x_min) - 1, 0), min(int(x_max) + 2, width)),
+    )
+
+
+def polygon_mask(points):
+    """Even-odd fill of a polygon, evaluated for every pixel of its bbox at once."""
+    pts = np.asarray(points, dtype=np.float64)
+    x0, y0 = pts[:, 0], pts[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    win = window(x0.min(), y0.min(), x0.max(), y0.max())
+    wx, wy = xs[win], ys[win]
+    inside = np.zeros(wx.shape, dtype=bool)
+    for ax, ay, bx, by in zip(x0, y0, x1, y1, strict=True):
+        if ay == by:
+            continue
+        crosses = (ay <= wy) != (by <= wy)
+        x_hit = ax + (wy - ay) * (bx - ax) / (by - ay)
+        inside ^= crosses & (wx < x_hit)
+    return win, inside
+
+
+def polyline_mask(points, line_width):
+    """Pixels within line_width / 2 of any segment of the polyline."""
+    r = line_width / 2
+    px = [x for x, _ in points]
+    py = [y for _, y in points]
+    win = window(min(px) - r, min(py) - r, max(px) + r, max(py) + r)
+    wx, wy = xs[win], ys[win]
+    mask = np.zeros(wx.shape, dtype=bool)
+    for (ax, ay), (bx, by) in zip(points, points[1:], strict=False):
+        dx, dy = bx - ax, by - ay
+        t = np.clip(((wx - ax) * dx + (wy - ay) * dy) / (dx * dx + dy * dy), 0.0, 1.0)
+        mask |= (wx - (ax + t * dx)) ** 2 + (wy - (ay + t * dy)) ** 2 <= r * r
+    return win, mask
+
+
+def rect_mask(x_min, y_min, x_max, y_max):
+    win = window(x_min, y_min, x_max, y_max)
+    wx, wy = xs[win], ys[win]
+    return win, (wx >= x_min) & (wx <= x_max) & (wy >= y_min) & (wy <= y_max)
+
+
+def circle_mask(cx, cy, r):
+    win = window(cx - r, cy - r, cx + r, cy + r)
+    return win, (xs[win] - cx) ** 2 + (ys[win] - cy) ** 2 <= r * r
+
+
+def outline_of(mask):
+    """1px inner border of a mask (pixels with an outside 4-neighbour)."""
+    interior = mask.copy()
+    interior[1:, :] &= mask[:-1, :]
+    interior[:-1, :] &= mask[1:, :]
+    interior[:, 1:] &= mask[:, :-1]
+    interior[:, :-1] &= mask[:, 1:]
+    return mask & ~interior
+
+
+def paint(shape, fill, outline=None, canvas=None):
+    win, mask = shape
+    region = (arr if canvas is None else canvas)[win]
+    region[mask] = rgb(fill)
+    if outline:
+        region[outline_of(mask)] = rgb(outline)
+
+
+def prerender(w, h, layers):
+    """Paint (shape, fill, outline) layers drawn at (1, 1) into a small tile.
+
+    Returns the tile and its coverage mask so copies can be blitted with blit().
+    """
+    tile = np.zeros((h + 3, w + 3, 3), dtype=np.uint8)
+    covered = np.zeros((h + 3, w + 3), dtype=bool)
+    for shape, fill, outline in layers:
+        paint(shape, fill, outline, canvas=tile)
+        win, mask = shape
+        covered[win] |= mask
+    return tile, covered
+
+
+def blit(sprite, x, y):
+    """Copy a prerendered sprite so its drawing origin lands at (x, y)."""
+    tile, covered = sprite
+    h, w = covered.shape
+    region = arr[y - 1 : y - 1 + h, x - 1 : x - 1 + w]
+    region[covered] = tile[covered]
+
+
+arr = np.empty((height, width, 3), dtype=np.uint8)
+arr[:] = rgb("#2980b9")  # Ocean blue
 
 # US landmass (simplified)
 landmass = [
@@ -27,43 +157,47 @@ landmass = [
     (150, 450),
     (100, 150),  # South loop
 ]
-draw.polygon(landmass, fill="#76d35c", outline="#5a8a47")  # Plains green
+paint(polygon_mask(landmass), "#76d35c", outline="#5a8a47")  # Plains green
 
 # Terrain regions
 # Desert (southwest)
 desert = [(250, 450), (500, 470), (550, 530), (300, 520)]
-draw.polygon(desert, fill="#e6b058")  # Desert tan
+paint(polygon_mask(desert), "#e6b058")  # Desert tan
 
 # Mountains (Rockies - center-west)
+mw, mh = 40, 120
+mountain_sprite = prerender(
+    mw,
+    mh,
+    [
+        (polygon_mask([(1, 1 + mh), (1 + mw // 2, 1), (1 + mw, 1 + mh)]), "#95a5a6", "#7f8c8d"),
+        # Snow cap
+        (
+            polygon_mask(
+                [(1 + mw // 2, 1), (1 + mw * 0.35, 1 + mh * 0.4), (1 + mw * 0.65, 1 + mh * 0.4)]
+            ),
+            "#ecf0f1",
+            None,
+        ),
+    ],
+)
 for i in range(10):
-    mx = 550 + i * 45
-    my = 200 + (i % 3) * 30
-    mw = 40
-    mh = 120
-    mountain = [(mx, my + mh), (mx + mw // 2, my), (mx + mw, my + mh)]
-    draw.polygon(mountain, fill="#95a5a6", outline="#7f8c8d")
-    # Snow cap
-    snow = [(mx + mw // 2, my), (mx + mw * 0.35, my + mh * 0.4), (mx + mw * 0.65, my + mh * 0.4)]
-    draw.polygon(snow, fill="#ecf0f1")
+    blit(mountain_sprite, 550 + i * 45, 200 + (i % 3) * 30)
 
 # Forests (Pacific Northwest)
+forest_sprite = prerender(46, 71, [(rect_mask(1, 1, 47, 72), "#229954", "#1e7e4a")])
 for i in range(8):
-    fx = 900 + (i % 4) * 50
-    fy = 150 + (i // 4) * 80
-    draw.rectangle([fx, fy, fx + 45, fy + 70], fill="#229954", outline="#1e7e4a")
+    blit(forest_sprite, 900 + (i % 4) * 50, 150 + (i // 4) * 80)
 
 # Rivers
 # Missouri River
 missouri = [(350, 250), (420, 270), (480, 290), (530, 310)]
-draw.line(missouri, fill="#3498db", width=8)
-
 # Platte River
 platte = [(530, 310), (600, 320), (680, 325), (750, 330)]
-draw.line(platte, fill="#3498db", width=8)
-
 # Snake/Columbia River
 snake = [(750, 330), (820, 310), (900, 280), (980, 250), (1050, 220)]
-draw.line(snake, fill="#3498db", width=8)
+for river in (missouri, platte, snake):
+    paint(polyline_mask(river, 8), "#3498db")
 
 # The Oregon Trail (brown path from Independence, MO to Oregon City)
 # WESTWARD TRAVEL = RIGHT TO LEFT on map
@@ -85,9 +219,9 @@ trail_points = [
 ]
 
 # Draw trail as thick brown line
-draw.line(trail_points, fill="#8b4513", width=12)
+paint(polyline_mask(trail_points, 12), "#8b4513")
 # Add edge highlight
-draw.line(trail_points, fill="#d2b48c", width=6)
+paint(polyline_mask(trail_points, 6), "#d2b48c")
 
 # Add landmarks with circles
 landmarks = [
@@ -99,34 +233,41 @@ landmarks = [
     (280, 180, "Oregon City"),
 ]
 
-try:
-    font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 12)
-except Exception:
-    font = ImageFont.load_default()
-    small_font = ImageFont.load_default()
+for x, y, _name in landmarks:
+    # Fort marker
+    paint(circle_mask(x, y, 8.5), "#c0392b", outline="#000000")
+
+# Add compass rose (top right)
+compass_x, compass_y = width - 80, 40
+paint(polyline_mask([(compass_x, compass_y + 15), (compass_x, compass_y + 55)], 2), "#000000")
+paint(
+    polyline_mask([(compass_x - 30, compass_y + 35), (compass_x + 30, compass_y + 35)], 2),
+    "#000000",
+)
+
+img = Image.fromarray(arr)
+draw = ImageDraw.Draw(img)
+
+font = load_font(16)
+small_font = load_font(12)
+
+# Per-character advances, measured once; label widths are then plain sums
+advance = {ch: small_font.getlength(ch) for ch in set("".join(n for _, _, n in landmarks))}
 
 for x, y, name in landmarks:
-    # Fort marker
-    draw.ellipse([x - 8, y - 8, x + 8, y + 8], fill="#c0392b", outline="#000000")
     # Label
-    bbox = draw.textbbox((0, 0), name, font=small_font)
-    text_width = bbox[2] - bbox[0]
+    text_width = int(sum(advance[ch] for ch in name))
     draw.text((x - text_width // 2, y + 12), name, fill="#000000", font=small_font)
 
-# Add compass rose (top right)
-compass_x, compass_y = width - 80, 40
 draw.text((compass_x - 10, compass_y), "N", fill="#000000", font=font)
 draw.text((compass_x - 10, compass_y + 60), "S", fill="#000000", font=font)
 draw.text((compass_x - 40, compass_y + 30), "W", fill="#000000", font=font)
 draw.text((compass_x + 20, compass_y + 30), "E", fill="#000000", font=font)
-draw.line([(compass_x, compass_y + 15), (compass_x, compass_y + 55)], fill="#000000", width=2)
-draw.line(
-    [(compass_x - 30, compass_y + 35), (compass_x + 30, compass_y + 35)], fill="#000000", width=2
-)
 
-# Save
-img.save("assets/oregon_trail_map.png")
+# Save as indexed-colour PNG-8: the flat fills plus anti-aliased label edges
+# fit in 32 palette entries without visible loss
+img = img.quantize(colors=32, method=Image.Quantize.MEDIANCUT)
+img.save("assets/oregon_trail_map.png", optimize=True)
 print("✅ Map saved to assets/oregon_trail_map.png")
 print(f"   Size: {width}x{height}")
 print("   Trail runs WEST (right to left): Independence, MO → Oregon City")
@@ -1,17 +1,40 @@
 #!/usr/bin/env python3
 import os
 
-from dotenv import load_dotenv
+# models.list maximum; the SDK default of 50 costs several round trips
+PAGE_SIZE = 1000
+GENERATE_METHODS = frozenset({"generateContent"})
+GENERATIVE_LANGUAGE_SCOPE = "https://www.googleapis.com/auth/generative-language"
 
-load_dotenv()
 
-try:
-    import google.generativeai as genai
+def main():
+    from dotenv import load_dotenv
 
-    genai.configure(api_key=os.environ.get("GEMINI_API_KEY"))
-    print("Available models:")
-    for model in genai.list_models():
-        if "generateContent" in model.supported_generation_methods:
-            print(f"  - {model.name}")
-except Exception as e:
-    print(f"Error: {e}")
+    load_dotenv()
+
+    try:
+        import google.generativeai as genai
+
+        api_key = os.environ.get("GEMINI_API_KEY")
+        if api_key:
+            genai.configure(api_key=api_key)
+        else:
+            from google.auth.credentials import with_scopes_if_required
+
+            from conestoga._gcp import default_credentials
+
+            credentials, _ = default_credentials()
+            genai.configure(
+                credentials=with_scopes_if_required(credentials, [GENERATIVE_LANGUAGE_SCOPE])
+            )
+        print("Available models:")
+        # google.generativeai has no server-side filter for generation methods
+        for model in genai.list_models(page_size=PAGE_SIZE):
+            if not GENERATE_METHODS.isdisjoint(model.supported_generation_methods):
+                print(f"  - {model.name}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,20 +6,141 @@ Main CLI script for ingesting Teams message links.
 import argparse
 import asyncio
 import os
+import re
+import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from teams_link_ingestion.link_validator import TeamsLinkValidator, LinkType
-from teams_link_ingestion.classifier import ClassificationEngine
-from teams_link_ingestion.content_fetcher import TeamsContentFetcher, MessageContent, LinkContent
-from teams_link_ingestion.content_storage import ContentStorage
-from teams_link_ingestion.ontology_creator import OntologyEntityCreator
-from teams_link_ingestion.content_extractor import ContentExtractor
-from teams_link_ingestion.workflow_integration import WorkflowIntegration
+# The ingestion pipeline is imported where it is first used, so `--help` and
+# argument errors don't pay for loading it
+if TYPE_CHECKING:
+    from teams_link_ingestion.content_fetcher import TeamsContentFetcher
+    from teams_link_ingestion.content_storage import ContentStorage
+    from teams_link_ingestion.ontology_creator import OntologyEntityCreator
+    from teams_link_ingestion.workflow_integration import WorkflowIntegration
+
+# Maximum number of Executive Order pages fetched at once for a single link
+EO_FETCH_CONCURRENCY = 5
+
+# Batch files up to this size are read in one call rather than streamed
+BATCH_READ_ALL_MAX_BYTES = 16 * 1024 * 1024
+
+# Organizations checked for web verification, matched in one case-insensitive
+# scan of the original text (no lowercased copy of the content is made)
+ORG_PATTERN = re.compile(
+    r"(?P<uc>university of california|uc[ \-])"
+    r"|(?P<lbnl>lawrence berkeley|lbnl)"
+    r"|(?P<lanl>los alamos|lanl)"
+    r"|(?P<llnl>lawrence livermore|llnl)"
+    r"|(?P<doe>department of energy|doe)",
+    re.IGNORECASE
+)
+ORG_NAMES = {
+    "uc": "University of California",
+    "lbnl": "Lawrence Berkeley National Laboratory",
+    "lanl": "Los Alamos National Laboratory",
+    "llnl": "Lawrence Livermore National Laboratory",
+    "doe": "U.S. Department of Energy",
+}
+
+# Common 1Password reference formats for the Tavily key, tried in order
+TAVILY_OP_REFS = [
+    "op://Private/TAVILY_API_KEY/password",
+    "op://Private/Tavily API Key/password",
+    "op://Private/tavily-api-key/password",
+    "op://Private/TAVILY_API_KEY/credential"
+]
+
+
+async def _resolve_tavily_key_sdk(token: str) -> Optional[str]:
+    """
+    Resolve the Tavily key through the 1Password SDK.
+    
+    All candidate refs are tried against one authenticated client, so no `op`
+    process is spawned. Returns None if the SDK is not installed or no ref
+    resolves.
+    """
+    try:
+        from onepassword.client import Client
+    except ImportError:
+        return None
+    
+    try:
+        client = await Client.authenticate(
+            auth=token,
+            integration_name="Conestoga Teams Link Ingestion",
+            integration_version="v0.1.0"
+        )
+    except Exception:
+        return None
+    
+    for ref in TAVILY_OP_REFS:
+        try:
+            tavily_key = (await client.secrets.resolve(ref)).strip()
+        except Exception:
+            continue
+        if tavily_key:
+            return tavily_key
+    return None
+
+
+def _resolve_tavily_key_cli() -> Optional[str]:
+    """Resolve the Tavily key with the `op` CLI, one `op read` per candidate ref."""
+    for ref in TAVILY_OP_REFS:
+        try:
+            result = subprocess.run(
+                ["op", "read", ref],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=True
+            )
+        except OSError:
+            # op CLI missing or not executable - the remaining refs would fail the same way
+            return None
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            continue
+        tavily_key = result.stdout.strip()
+        if tavily_key:
+            return tavily_key
+    return None
+
+
+# Lookup of TAVILY_API_KEY (resolving to None after a miss), started by the
+# first caller; concurrent batch workers await the same task
+_tavily_key_cache: dict[str, asyncio.Task] = {}
+
+
+async def _resolve_tavily_key() -> Optional[str]:
+    """
+    Resolve TAVILY_API_KEY from the environment or 1Password, once per process.
+    
+    With OP_SERVICE_ACCOUNT_TOKEN set and the SDK installed, 1Password is read
+    in-process; otherwise the `op` CLI is used. A miss is cached too, so
+    1Password is never queried again after it fails.
+    """
+    lookup = _tavily_key_cache.get("key")
+    if lookup is None:
+        lookup = asyncio.ensure_future(_lookup_tavily_key())
+        _tavily_key_cache["key"] = lookup
+    return await asyncio.shield(lookup)
+
+
+async def _lookup_tavily_key() -> Optional[str]:
+    tavily_key = os.getenv("TAVILY_API_KEY")
+    if not tavily_key:
+        token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
+        if token:
+            tavily_key = await _resolve_tavily_key_sdk(token)
+        if not tavily_key:
+            tavily_key = await asyncio.to_thread(_resolve_tavily_key_cli)
+        if tavily_key:
+            print(f"✓ Found TAVILY_API_KEY in 1Password")
+    return tavily_key
 
 
 async def verify_with_web_search(content: str, classification) -> Optional[dict]:
@@ -29,45 +150,14 @@ async def verify_with_web_search(content: str, classification) -> Optional[dict]
     Returns:
         Dictionary with verification results and sources, or None if skipped
     """
-    import subprocess
-    
-    # Only verify if content mentions organizations or claims
-    org_keywords = ["university", "laboratory", "lab", "department", "energy", "doe", "uc ", "uc-"]
-    has_org_mention = any(kw.lower() in content.lower() for kw in org_keywords)
+    # Only verify if content mentions a known organization
+    found = {m.lastgroup for m in ORG_PATTERN.finditer(content)}
     
-    if not has_org_mention:
+    if not found:
         return None
     
-    # Check if Tavily API key is available - try multiple sources
-    tavily_key = os.getenv("TAVILY_API_KEY")
-    
-    # Try 1Password if not in environment
-    if not tavily_key:
-        try:
-            # Try common 1Password reference formats
-            for ref in [
-                "op://Private/TAVILY_API_KEY/password",
-                "op://Private/Tavily API Key/password",
-                "op://Private/tavily-api-key/password",
-                "op://Private/TAVILY_API_KEY/credential"
-            ]:
-                try:
-                    result = subprocess.run(
-                        ["op", "read", ref],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        check=True
-                    )
-                    tavily_key = result.stdout.strip()
-                    if tavily_key:
-                        print(f"✓ Found TAVILY_API_KEY in 1Password")
-                        break
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
-        except Exception:
-            # Best-effort 1Password lookup; ignore unexpected errors and fall back to other key sources.
-            pass
+    # Check if Tavily API key is available - environment first, then 1Password
+    tavily_key = await _resolve_tavily_key()
     
     if not tavily_key:
         return None
@@ -80,26 +170,14 @@ async def verify_with_web_search(content: str, classification) -> Optional[dict]
         sys.path.insert(0, str(repo_root))
         from repo_chat.web_search import search_tavily
         
-        # Extract key claims/organizations for verification
-        # Simple extraction: look for organization names
-        orgs = []
-        if "university of california" in content.lower() or "uc " in content.lower():
-            orgs.append("University of California")
-        if "lawrence berkeley" in content.lower() or "lbnl" in content.lower():
-            orgs.append("Lawrence Berkeley National Laboratory")
-        if "los alamos" in content.lower() or "lanl" in content.lower():
-            orgs.append("Los Alamos National Laboratory")
-        if "lawrence livermore" in content.lower() or "llnl" in content.lower():
-            orgs.append("Lawrence Livermore National Laboratory")
-        if "department of energy" in content.lower() or "doe" in content.lower():
-            orgs.append("U.S. Department of Energy")
-        
-        if not orgs:
-            return None
+        # Organization names for the query, in ORG_NAMES order
+        orgs = [name for key, name in ORG_NAMES.items() if key in found]
         
         # Search for verification
         query = f"{', '.join(orgs[:2])} national laboratories management"
-        sources_text, citations = search_tavily(
+        # search_tavily blocks on HTTP, so keep it off the event loop
+        sources_text, citations = await asyncio.to_thread(
+            search_tavily,
             query=query,
             api_key=tavily_key,
             max_results=3,
@@ -116,6 +194,44 @@ async def verify_with_web_search(content: str, classification) -> Optional[dict]
         return None
 
 
+def text_for_extraction(content) -> str:
+    """
+    Text to run extraction over for fetched content.
+    
+    Content types expose it as `text_for_extraction`; for fetcher versions that
+    predate it, LinkContent's `text_content` and MessageContent's `content`
+    are read directly.
+    """
+    text = getattr(content, "text_for_extraction", None)
+    if text is not None:
+        return text
+    if hasattr(content, "text_content"):
+        return content.text_content or ""
+    if hasattr(content, "content"):
+        return content.content
+    return str(content)
+
+
+def integrate_workflows(workflow) -> None:
+    """Refresh the viewer graph and run SHACL validation, logging any failures."""
+    print("\nIntegrating with workflows...")
+    
+    try:
+        workflow.refresh_viewer_graph()
+        print("✓ Viewer graph refreshed")
+    except Exception as e:
+        print(f"⚠ Warning: Failed to refresh viewer graph: {e}")
+    
+    try:
+        is_valid, errors = workflow.validate_shacl()
+        if is_valid:
+            print("✓ SHACL validation passed")
+        else:
+            print(f"⚠ Warning: SHACL validation issues: {errors}")
+    except Exception as e:
+        print(f"⚠ Warning: Failed to validate SHACL: {e}")
+
+
 def get_repo_root() -> Path:
     """Get repository root directory."""
     script_dir = Path(__file__).parent
@@ -129,17 +245,22 @@ def review_classification(classification, link_info) -> bool:
     Returns:
         True if user confirms, False if rejects
     """
-    print("\n" + "="*60)
-    print("CLASSIFICATION REVIEW")
-    print("="*60)
-    print(f"Link: {link_info.url}")
-    print(f"\nOntology Target: {classification.ontology_target.value}")
-    print(f"  Confidence: {classification.ontology_confidence:.2f}")
-    print(f"\nContent Type: {classification.content_type.value}")
-    print(f"  Confidence: {classification.content_confidence:.2f}")
-    print(f"\nOverall Confidence: {classification.confidence:.2f}")
-    print(f"\nRationale: {classification.rationale}")
-    print("="*60)
+    rule = "=" * 60
+    # Written in one call so the block can't interleave with other output
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "CLASSIFICATION REVIEW\n"
+        f"{rule}\n"
+        f"Link: {link_info.url}\n"
+        f"\nOntology Target: {classification.ontology_target.value}\n"
+        f"  Confidence: {classification.ontology_confidence:.2f}\n"
+        f"\nContent Type: {classification.content_type.value}\n"
+        f"  Confidence: {classification.content_confidence:.2f}\n"
+        f"\nOverall Confidence: {classification.confidence:.2f}\n"
+        f"\nRationale: {classification.rationale}\n"
+        f"{rule}\n"
+    )
+    sys.stdout.flush()
     
     while True:
         response = input("\nConfirm classification? (y/n/modify): ").strip().lower()
@@ -158,7 +279,13 @@ def review_classification(classification, link_info) -> bool:
 async def ingest_link(link_url: str, 
                      access_token: Optional[str] = None,
                      auto_confirm: bool = False,
-                     repo_root: Optional[Path] = None) -> dict:
+                     repo_root: Optional[Path] = None,
+                     fetcher: Optional["TeamsContentFetcher"] = None,
+                     storage: Optional["ContentStorage"] = None,
+                     creator: Optional["OntologyEntityCreator"] = None,
+                     workflow: Optional["WorkflowIntegration"] = None,
+                     defer_workflow: bool = False,
+                     web_verify: bool = False) -> dict:
     """
     Ingest a Teams message link.
     
@@ -167,12 +294,34 @@ async def ingest_link(link_url: str,
         access_token: Microsoft Graph API access token
         auto_confirm: Auto-confirm classification without review
         repo_root: Repository root directory
+        fetcher: Shared content fetcher; left open for the caller to close
+        storage: Shared content storage
+        creator: Shared ontology entity creator
+        workflow: Shared workflow integration
+        defer_workflow: Skip the viewer refresh / SHACL step so the caller
+            can run it once after a batch
+        web_verify: Verify organization mentions with a web search, run
+            concurrently with URL extraction
         
     Returns:
         Processing result dictionary
     """
+    from teams_link_ingestion.link_validator import TeamsLinkValidator, LinkType
+    from teams_link_ingestion.classifier import ClassificationEngine
+    from teams_link_ingestion.content_fetcher import TeamsContentFetcher
+    from teams_link_ingestion.content_storage import ContentStorage
+    from teams_link_ingestion.ontology_creator import OntologyEntityCreator
+    from teams_link_ingestion.content_extractor import ContentExtractor
+    from teams_link_ingestion.workflow_integration import WorkflowIntegration
+    
     if repo_root is None:
         repo_root = get_repo_root()
+    if storage is None:
+        storage = ContentStorage(repo_root)
+    if creator is None:
+        creator = OntologyEntityCreator(repo_root)
+    if workflow is None:
+        workflow = WorkflowIntegration(repo_root)
     
     # Step 1: Validate link
     print(f"Validating link: {link_url}")
@@ -185,7 +334,6 @@ async def ingest_link(link_url: str,
     
     # Step 1.5: Check for duplicate
     print("\nChecking for existing document...")
-    creator = OntologyEntityCreator(repo_root)
     existing_doc_uri = creator.find_existing_document_by_link(link_url)
     if existing_doc_uri:
         print(f"⚠ Found existing document: {existing_doc_uri}")
@@ -217,11 +365,15 @@ async def ingest_link(link_url: str,
     
     # Step 4: Fetch content
     print("\nFetching content...")
-    fetcher = TeamsContentFetcher(access_token=access_token)
+    owns_fetcher = fetcher is None
+    if owns_fetcher:
+        fetcher = TeamsContentFetcher(access_token=access_token)
     
     try:
         if link_info.link_type == LinkType.MESSAGE:
             if not link_info.message_id or not link_info.thread_id:
+                if owns_fetcher:
+                    await fetcher.close()
                 return {"success": False, "error": "Missing message_id or thread_id"}
             content = await fetcher.fetch_message(link_info.message_id, link_info.thread_id)
             print(f"✓ Message fetched: {len(content.content)} chars")
@@ -229,7 +381,8 @@ async def ingest_link(link_url: str,
             content = await fetcher.fetch_shared_link(link_url)
             print(f"✓ Link content fetched: {len(content.content)} bytes")
     except Exception as e:
-        await fetcher.close()
+        if owns_fetcher:
+            await fetcher.close()
         return {"success": False, "error": f"Failed to fetch content: {e}"}
     
     # Step 5: Re-classify with actual content for better accuracy
@@ -239,71 +392,89 @@ async def ingest_link(link_url: str,
     #     print(f"✓ Improved classification confidence: {classification.confidence:.2f} → {updated_classification.confidence:.2f}")
     #     classification = updated_classification
     
-    # Step 6: Web search verification (if content mentions organizations/claims)
-    print("\nSkipping web search verification...")
-    # web_verification = None
-    # try:
-    #     web_verification = await verify_with_web_search(actual_content, classification)
-    #     if web_verification:
-    #         print(f"✓ Web verification: Found {len(web_verification.get('sources', []))} sources")
-    # except Exception as e:
-    #     print(f"⚠ Web verification skipped: {e}")
-    web_verification = None
-    
-    # Step 6.5: Extract URLs and process Executive Orders
-    print("\nExtracting URLs from content...")
+    # Step 6 / 6.5: Web search verification and URL extraction. They are
+    # independent (network-bound vs CPU-bound), so they run concurrently
     extractor = ContentExtractor()
     
     # Get text content for URL extraction
-    if isinstance(content, MessageContent):
-        content_text = content.content
-    elif isinstance(content, LinkContent):
-        content_text = content.text_content or ""
+    content_text = text_for_extraction(content)
+    
+    async def extract_urls() -> list:
+        # Empty bodies (e.g. a link whose page yielded no text) skip the regex pass
+        if not content_text:
+            return []
+        return await asyncio.to_thread(extractor.extract_urls, content_text)
+    
+    if web_verify:
+        print("\nVerifying with web search and extracting URLs...")
+        web_verification, urls = await asyncio.gather(
+            verify_with_web_search(content_text, classification),
+            extract_urls(),
+            return_exceptions=True
+        )
+        if isinstance(web_verification, BaseException):
+            print(f"⚠ Web verification skipped: {web_verification}")
+            web_verification = None
+        elif web_verification:
+            print(f"✓ Web verification: Found {len(web_verification.get('sources', []))} sources")
+        if isinstance(urls, BaseException):
+            raise urls
     else:
-        content_text = str(content)
+        print("\nSkipping web search verification...")
+        web_verification = None
+        print("\nExtracting URLs from content...")
+        urls = await extract_urls()
     
-    urls = extractor.extract_urls(content_text)
     print(f"✓ Found {len(urls)} URLs")
     
     # Process Executive Orders
     eo_documents = []
-    # Reuse existing fetcher if available, otherwise create new one
-    if 'fetcher' not in locals() or fetcher is None:
-        fetcher = TeamsContentFetcher(access_token=access_token)
+    
+    # Ordered dedup so an EO linked several times is fetched and stored once
+    eo_urls = list(dict.fromkeys(url for url in urls if extractor.is_executive_order_url(url)))
+    eo_semaphore = asyncio.Semaphore(EO_FETCH_CONCURRENCY)
+    
+    async def fetch_eo(url: str):
+        async with eo_semaphore:
+            print(f"\nProcessing Executive Order: {url}")
+            return await fetcher.fetch_executive_order(url)
     
     try:
-        for url in urls:
-            if extractor.is_executive_order_url(url):
-                print(f"\nProcessing Executive Order: {url}")
-                try:
-                    eo_content = await fetcher.fetch_executive_order(url)
-                    print(f"✓ EO fetched: {eo_content.title}")
-                    
-                    # Store EO content
-                    storage = ContentStorage(repo_root)
-                    eo_storage_result = storage.store_content(eo_content, classification, web_verification)
-                    print(f"✓ EO stored: {eo_storage_result.file_path}")
-                    
-                    eo_documents.append({
-                        "content": eo_content,
-                        "storage_result": eo_storage_result
-                    })
-                except Exception as e:
-                    print(f"⚠ Warning: Failed to fetch EO from {url}: {e}")
+        # Fetch all EOs concurrently; failures come back as exceptions in order
+        eo_results = await asyncio.gather(
+            *(fetch_eo(url) for url in eo_urls),
+            return_exceptions=True
+        )
     finally:
-        await fetcher.close()
+        if owns_fetcher:
+            await fetcher.close()
+    
+    for url, eo_content in zip(eo_urls, eo_results, strict=True):
+        if isinstance(eo_content, BaseException):
+            print(f"⚠ Warning: Failed to fetch EO from {url}: {eo_content}")
+            continue
+        try:
+            print(f"✓ EO fetched: {eo_content.title}")
+            
+            # Store EO content
+            eo_storage_result = storage.store_content(eo_content, classification, web_verification)
+            print(f"✓ EO stored: {eo_storage_result.file_path}")
+            
+            eo_documents.append({
+                "content": eo_content,
+                "storage_result": eo_storage_result
+            })
+        except Exception as e:
+            print(f"⚠ Warning: Failed to store EO from {url}: {e}")
     
     # Step 7: Store Teams message content
     print("\nStoring Teams message content...")
-    storage = ContentStorage(repo_root)
     storage_result = storage.store_content(content, classification, web_verification)
     print(f"✓ Content stored: {storage_result.file_path}")
     print(f"  Checksum: {storage_result.checksum}")
     
     # Step 8: Create document entity
     print("\nCreating ontology entities...")
-    if 'creator' not in locals():
-        creator = OntologyEntityCreator(repo_root)
     
     message_info = None
     if hasattr(content, 'sender_name'):
@@ -389,23 +560,8 @@ async def ingest_link(link_url: str,
         print(f"✓ Created {len(task_uris)} task entities")
     
     # Step 11: Integrate with workflows
-    print("\nIntegrating with workflows...")
-    workflow = WorkflowIntegration(repo_root)
-    
-    try:
-        workflow.refresh_viewer_graph()
-        print("✓ Viewer graph refreshed")
-    except Exception as e:
-        print(f"⚠ Warning: Failed to refresh viewer graph: {e}")
-    
-    try:
-        is_valid, errors = workflow.validate_shacl()
-        if is_valid:
-            print("✓ SHACL validation passed")
-        else:
-            print(f"⚠ Warning: SHACL validation issues: {errors}")
-    except Exception as e:
-        print(f"⚠ Warning: Failed to validate SHACL: {e}")
+    if not defer_workflow:
+        integrate_workflows(workflow)
     
     return {
         "success": True,
@@ -420,6 +576,28 @@ async def ingest_link(link_url: str,
     }
 
 
+def iter_batch_links(path: Path):
+    """
+    Yield the non-blank lines of a batch file, stripped.
+    
+    Files up to BATCH_READ_ALL_MAX_BYTES are read and split in one call;
+    larger ones are streamed line by line to keep memory flat.
+    """
+    if path.stat().st_size <= BATCH_READ_ALL_MAX_BYTES:
+        lines = path.read_text().splitlines()
+    else:
+        lines = _stream_lines(path)
+    for line in lines:
+        link = line.strip()
+        if link:
+            yield link
+
+
+def _stream_lines(path: Path):
+    with open(path, 'r') as f:
+        yield from f
+
+
 async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -449,26 +627,105 @@ async def main():
         type=Path,
         help="Process multiple links from file (one URL per line)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Links ingested in parallel in batch mode (requires --auto-confirm; default: 4)"
+    )
+    parser.add_argument(
+        "--web-verify",
+        action="store_true",
+        help="Verify organization mentions with a Tavily web search"
+    )
     
     args = parser.parse_args()
     
     if args.batch:
-        # Batch processing
-        with open(args.batch, 'r') as f:
-            links = [line.strip() for line in f if line.strip()]
+        from teams_link_ingestion.content_fetcher import TeamsContentFetcher
+        from teams_link_ingestion.content_storage import ContentStorage
+        from teams_link_ingestion.ontology_creator import OntologyEntityCreator
+        from teams_link_ingestion.workflow_integration import WorkflowIntegration
         
-        print(f"Processing {len(links)} links...")
+        # Batch processing - links are streamed from the file as they are
+        # needed rather than read into memory up front
+        print(f"Processing links from {args.batch}...")
+
+        # One fetcher (and its HTTP connection pool), storage, creator and
+        # workflow for the whole batch instead of one of each per link
+        repo_root = args.repo_root or get_repo_root()
+        shared = {
+            "fetcher": TeamsContentFetcher(access_token=args.access_token),
+            "storage": ContentStorage(repo_root),
+            "creator": OntologyEntityCreator(repo_root),
+            "workflow": WorkflowIntegration(repo_root),
+        }
+
         results = []
-        for i, link in enumerate(links, 1):
-            print(f"\n[{i}/{len(links)}] Processing: {link}")
-            result = await ingest_link(
-                link,
-                access_token=args.access_token,
-                auto_confirm=args.auto_confirm,
-                repo_root=args.repo_root
-            )
-            results.append(result)
-        
+        try:
+            if args.auto_confirm:
+                # No interactive prompts, so links can be ingested concurrently:
+                # a producer feeds a bounded queue and `concurrency` workers
+                # pull links from it as they finish
+                concurrency = max(1, args.concurrency)
+                queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+                async def produce() -> None:
+                    # Workers would race to create the document for a
+                    # repeated link, so each link is queued only once
+                    seen = set()
+                    try:
+                        for i, link in enumerate(iter_batch_links(args.batch), 1):
+                            if link in seen:
+                                print(f"\n[{i}] Skipping duplicate: {link}")
+                                continue
+                            seen.add(link)
+                            await queue.put((i, link))
+                    finally:
+                        for _ in range(concurrency):
+                            await queue.put(None)
+
+                async def work() -> None:
+                    while (item := await queue.get()) is not None:
+                        i, link = item
+                        print(f"\n[{i}] Processing: {link}")
+                        try:
+                            result = await ingest_link(
+                                link,
+                                access_token=args.access_token,
+                                auto_confirm=True,
+                                repo_root=repo_root,
+                                defer_workflow=True,
+                                web_verify=args.web_verify,
+                                **shared
+                            )
+                        except Exception as e:
+                            result = {"success": False, "error": str(e)}
+                        results.append(result)
+
+                await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+            else:
+                # Serial so review_classification prompts don't interleave
+                for i, link in enumerate(iter_batch_links(args.batch), 1):
+                    print(f"\n[{i}] Processing: {link}")
+                    result = await ingest_link(
+                        link,
+                        access_token=args.access_token,
+                        auto_confirm=args.auto_confirm,
+                        repo_root=repo_root,
+                        defer_workflow=True,
+                        web_verify=args.web_verify,
+                        **shared
+                    )
+                    results.append(result)
+        finally:
+            await shared["fetcher"].close()
+
+        # Viewer refresh and SHACL validation cover the whole graph, so run
+        # them once for the batch rather than after every link
+        if any(r.get("success") for r in results):
+            integrate_workflows(shared["workflow"])
+
         # Summary
         print("\n" + "="*60)
         print("BATCH PROCESSING SUMMARY")
@@ -482,7 +739,8 @@ async def main():
             args.link,
             access_token=args.access_token,
             auto_confirm=args.auto_confirm,
-            repo_root=args.repo_root
+            repo_root=args.repo_root,
+            web_verify=args.web_verify
         )
         
         if result.get("success"):
@@ -4,8 +4,6 @@ import os
 from pathlib import Path
 import sys
 
-import pygame
-
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -36,11 +34,17 @@ def parse_args():
 def main():
     args = parse_args()
 
+    # Imported after argument parsing so --help doesn't pay for loading SDL
+    import pygame
+
     if args.headless:
         os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
     pygame.display.init()
-    pygame.init()
+    if not args.headless:
+        # Headless previews only need the display; skip probing audio,
+        # joystick and the other subsystems
+        pygame.init()
 
     size = (args.width, args.height)
     try:
@@ -57,7 +61,8 @@ def main():
         return 1
 
     map_img = pygame.image.load(map_path.as_posix())
-    scaled = pygame.transform.scale(map_img, size)
+    # Blit the asset directly when it is already the window size
+    scaled = map_img if map_img.get_size() == size else pygame.transform.scale(map_img, size)
     screen.blit(scaled, (0, 0))
     pygame.display.set_caption("Conestoga Map Preview")
     pygame.display.flip()
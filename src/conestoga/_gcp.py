@@ -0,0 +1,20 @@
+"""Shared Google Cloud credentials for the CLI tools and examples."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def default_credentials():
+    """
+    Resolve Application Default Credentials once per process.
+
+    Every Google client built from the result reuses the same credential
+    object, so the ADC file read / metadata-server probe and token refreshes
+    are not repeated per client.
+
+    Returns:
+        (credentials, project_id) as returned by google.auth.default()
+    """
+    import google.auth
+
+    return google.auth.default()
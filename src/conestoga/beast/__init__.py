@@ -3,26 +3,41 @@ Beast Components Module
 
 Provides Beast messaging integration with HACP governance, observability,
 and semantic alignment for the Eudorus platform.
+
+Exports are resolved lazily, so importing one submodule (e.g.
+``conestoga.beast.envelope``) does not load Redis, OpenTelemetry and rdflib
+for the others.
 """
 
-from conestoga.beast.adapter import BeastAdapter
-from conestoga.beast.envelope import (
-    BeastEnvelope,
-    validate_envelope,
-    create_envelope,
-    EnvelopeValidationError,
-)
-from conestoga.beast.observability import ObservabilityStack
-from conestoga.beast.semantics import SemanticAlignmentLayer, BEAST, EUDORUS
-
-__all__ = [
-    "BeastAdapter",
-    "BeastEnvelope",
-    "validate_envelope",
-    "create_envelope",
-    "EnvelopeValidationError",
-    "ObservabilityStack",
-    "SemanticAlignmentLayer",
-    "BEAST",
-    "EUDORUS",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "BeastAdapter": "adapter",
+    "run_async": "adapter",
+    "BeastEnvelope": "envelope",
+    "validate_envelope": "envelope",
+    "create_envelope": "envelope",
+    "EnvelopeValidationError": "envelope",
+    "ObservabilityStack": "observability",
+    "SemanticAlignmentLayer": "semantics",
+    "FastAlignmentLayer": "semantics",
+    "BEAST": "semantics",
+    "EUDORUS": "semantics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
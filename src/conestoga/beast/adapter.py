@@ -1,34 +1,262 @@
 import redis
+import redis.asyncio as aioredis
 import time
 import logging
 import threading
 import json
+import os
+import sys
 import asyncio
-import uuid
-from typing import Optional, Callable, Dict, Any
-
+import secrets
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Coroutine, Dict, Any, Union
+
+from conestoga.beast.envelope import (
+    MSGSPEC_AVAILABLE,
+    EnvelopeValidationError,
+    create_envelope,
+    decode_envelope,
+    decode_msgpack,
+    encode_msgpack,
+    validate_envelope,
+)
 from conestoga.hacp.interceptor import HACPInterceptor, HACPViolationError
 
+# orjson is used for the per-message (de)serialization when installed; its
+# decode errors subclass json.JSONDecodeError, so error handling is shared
+try:
+    import orjson
+
+    _json_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# libuv-based event loop, used by run_async() when installed
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# False on free-threaded builds (PEP 703) run with the GIL disabled, where
+# handling messages on several threads actually runs them in parallel
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Messages the shared async subscriber queues per adapter before reading pauses
+ADAPTER_QUEUE_SIZE = 256
+
+# Messages read by start() that may wait for a free handler thread, per thread
+HANDLER_BACKLOG_PER_WORKER = 64
+
+# Hosts for which a local UNIX socket is preferred over TCP when it exists.
+# Only the server on the default port is assumed to listen on that socket.
+LOCAL_REDIS_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+DEFAULT_REDIS_PORT = 6379
+DEFAULT_REDIS_UNIX_SOCKET = "/var/run/redis/redis.sock"
+
+# Wire format name -> (encode, decode) for published messages
+WIRE_FORMATS = {
+    "json": (_json_dumps, _json_loads),
+    "msgpack": (encode_msgpack, decode_msgpack),
+}
+
+
+def run_async(main: Coroutine):
+    """
+    asyncio.run() for applications built on the async adapter API.
+
+    Runs on uvloop when it is installed, which speeds up the socket-heavy
+    Redis pubsub traffic; the loop policy of the caller is left untouched.
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+class _SharedSubscriber:
+    """
+    One Redis pubsub connection shared by every async adapter in the process
+    (per event loop and Redis server); messages are routed to adapters by channel.
+    """
+
+    def __init__(self, connection_kwargs: dict):
+        self.redis_client = aioredis.Redis(**connection_kwargs)
+        self.pubsub = self.redis_client.pubsub()
+        self.routes: Dict[str, list] = {}  # channel -> adapters subscribed to it
+        self.task: Optional[asyncio.Task] = None
+        # adapter -> (its bounded message queue, the task handling it in order)
+        self.inboxes: Dict["BeastAdapter", tuple] = {}
+
+    async def add(self, adapter: "BeastAdapter", channels: list):
+        new_channels = [channel for channel in channels if channel not in self.routes]
+        for channel in channels:
+            self.routes.setdefault(channel, []).append(adapter)
+        if new_channels:
+            await self.pubsub.subscribe(*new_channels)
+        if adapter not in self.inboxes:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=ADAPTER_QUEUE_SIZE)
+            self.inboxes[adapter] = (queue, asyncio.create_task(self._consume(adapter, queue)))
+        if self.task is None:
+            self.task = asyncio.create_task(self._route())
+
+    async def remove(self, adapter: "BeastAdapter") -> bool:
+        """Unroutes an adapter; returns True once no adapters are left."""
+        unused = []
+        for channel, adapters in self.routes.items():
+            if adapter in adapters:
+                adapters.remove(adapter)
+            if not adapters:
+                unused.append(channel)
+        for channel in unused:
+            del self.routes[channel]
+        inbox = self.inboxes.pop(adapter, None)
+        if inbox is not None:
+            # Let the adapter finish the messages already queued for it
+            queue, consumer = inbox
+            await queue.put(None)
+            await consumer
+        if self.routes:
+            if unused:
+                await self.pubsub.unsubscribe(*unused)
+            return False
+
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                # Task cancellation is expected when the last adapter stops.
+                logging.debug("Shared subscribe task cancelled (expected during shutdown).")
+        await self.pubsub.aclose()
+        await self.redis_client.aclose()
+        return True
+
+    async def _route(self):
+        try:
+            async for message in self.pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                # Each adapter handles its messages in order from its own
+                # queue, so a slow handler does not hold up the other adapters
+                # until its queue fills
+                for adapter in list(self.routes.get(channel, ())):
+                    inbox = self.inboxes.get(adapter)
+                    if inbox is not None:
+                        await inbox[0].put(message["data"])
+        except Exception as e:
+            logging.error(f"Error in async subscribe loop: {e}")
+
+    @staticmethod
+    async def _consume(adapter: "BeastAdapter", queue: asyncio.Queue):
+        while (raw_message := await queue.get()) is not None:
+            await adapter._async_handle_message(raw_message)
+
 
 class BeastAdapter:
+    # (event loop, *connection settings) -> shared subscriber
+    _shared_subscribers: Dict[tuple, _SharedSubscriber] = {}
+    # Connection settings -> pool used by connect(); adapters in one process
+    # share connections instead of each opening its own
+    _connection_pools: Dict[tuple, redis.ConnectionPool] = {}
+    _connection_pools_lock = threading.Lock()
+
     def __init__(
         self,
         agent_id: str,
         redis_host: str = "localhost",
-        redis_port: int = 6379,
+        redis_port: int = DEFAULT_REDIS_PORT,
         observability_stack=None,
         hacp_interceptor=None,
+        wire_format: str = "json",
+        unix_socket_path: Optional[str] = None,
+        handler_workers: Optional[int] = None,
     ):
+        """
+        Args:
+            wire_format: "json" (default) or "msgpack". MessagePack needs
+                msgspec and must match the format used by the other agents.
+            unix_socket_path: Connect over this UNIX socket instead of TCP.
+                When unset, redis_host is local and redis_port is the default,
+                the standard Redis socket path is used if it exists.
+            handler_workers: Threads handling messages received by start().
+                Defaults to one per CPU when the GIL is disabled (e.g.
+                python3.13t with PYTHON_GIL=0) and to 0 otherwise, which
+                handles messages in order on the subscriber thread.
+        """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: {wire_format!r}")
+        if wire_format == "msgpack" and not MSGSPEC_AVAILABLE:
+            raise ValueError("The 'msgpack' wire format requires msgspec")
+
         self.agent_id = agent_id
         self.redis_host = redis_host
         self.redis_port = redis_port
+        if (
+            unix_socket_path is None
+            and redis_host in LOCAL_REDIS_HOSTS
+            and redis_port == DEFAULT_REDIS_PORT
+        ):
+            if os.path.exists(DEFAULT_REDIS_UNIX_SOCKET):
+                unix_socket_path = DEFAULT_REDIS_UNIX_SOCKET
+        self.unix_socket_path = unix_socket_path
+        if handler_workers is None:
+            handler_workers = 0 if GIL_ENABLED else (os.cpu_count() or 1)
+        self.handler_workers = handler_workers
         self.redis_client = None
+        self.async_redis_client = None  # Used by the async_* methods
         self.is_connected = False
         self.observability = observability_stack
         self.hacp_interceptor = hacp_interceptor
         self.handlers = {}  # Initialize handlers dictionary
+        self._handlers_lock = threading.Lock()
+        # handler -> whether it is a coroutine function, decided at registration
+        self._coroutine_handlers: Dict[Callable, bool] = {}
         self.pending_replies: Dict[str, asyncio.Future] = {}  # For async reply handling
         self._subscribe_task: Optional[asyncio.Task] = None
+        self._shared_key: Optional[tuple] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._outbox: list = []  # (channel, body, future) awaiting the next flush
+        self._flush_tasks: set = set()
+        self.reply_channel = f"beast:agent:{agent_id}:replies"
+        self.wire_format = wire_format
+        self._encode, self._decode = WIRE_FORMATS[wire_format]
+
+    def _connection_kwargs(self) -> dict:
+        """
+        Redis client settings shared by the sync, async and pubsub clients.
+        """
+        if self.unix_socket_path:
+            address = {"unix_socket_path": self.unix_socket_path}
+        else:
+            address = {"host": self.redis_host, "port": self.redis_port}
+        # Responses are left as bytes: orjson and msgspec parse UTF-8 bytes
+        # directly, so decoding to str first would only add a copy
+        return {**address, "socket_connect_timeout": 5}
+
+    def _connection_pool(self) -> redis.ConnectionPool:
+        """
+        Returns the process-wide connection pool for this adapter's settings.
+        """
+        kwargs = self._connection_kwargs()
+        key = tuple(sorted(kwargs.items()))
+        with self._connection_pools_lock:
+            pool = self._connection_pools.get(key)
+            if pool is None:
+                if "unix_socket_path" in kwargs:
+                    kwargs["path"] = kwargs.pop("unix_socket_path")
+                    kwargs["connection_class"] = redis.UnixDomainSocketConnection
+                pool = redis.ConnectionPool(**kwargs)
+                self._connection_pools[key] = pool
+        return pool
 
     def connect(self):
         """
@@ -37,12 +265,7 @@ class BeastAdapter:
         retry_delay = 1
         while not self.is_connected:
             try:
-                self.redis_client = redis.Redis(
-                    host=self.redis_host,
-                    port=self.redis_port,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                )
+                self.redis_client = redis.Redis(connection_pool=self._connection_pool())
                 self.redis_client.ping()
                 self.is_connected = True
                 logging.info("BeastAdapter connected to Redis.")
@@ -84,7 +307,14 @@ class BeastAdapter:
         heartbeat_thread.start()
 
     def register_handler(self, message_type: str, handler):
-        self.handlers[message_type] = handler
+        self._mark_handler(handler)
+        with self._handlers_lock:
+            self.handlers[message_type] = handler
+
+    def _mark_handler(self, handler) -> bool:
+        is_coroutine = asyncio.iscoroutinefunction(handler)
+        self._coroutine_handlers[handler] = is_coroutine
+        return is_coroutine
 
     def _subscribe(self):
         """
@@ -94,28 +324,54 @@ class BeastAdapter:
         pubsub.subscribe(f"beast:agent:{self.agent_id}:inbox")
         pubsub.subscribe("beast:global:announcements")
 
-        for message in pubsub.listen():
-            if message["type"] == "message":
-                self._handle_message(message["data"])
+        if not self.handler_workers:
+            for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._handle_message(message["data"])
+            return
+
+        # This thread only reads; decoding, validation and dispatch fan out.
+        # Reading pauses while the backlog is full, so a burst of messages
+        # cannot queue without bound behind slow handlers
+        backlog = threading.BoundedSemaphore(self.handler_workers * HANDLER_BACKLOG_PER_WORKER)
+        with ThreadPoolExecutor(
+            max_workers=self.handler_workers, thread_name_prefix=f"beast-{self.agent_id}"
+        ) as pool:
+            for message in pubsub.listen():
+                if message["type"] == "message":
+                    backlog.acquire()
+                    future = pool.submit(self._handle_message, message["data"])
+                    future.add_done_callback(lambda _: backlog.release())
+
+    def _load_envelope(self, raw_message: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Decodes raw_message and validates it as an envelope.
 
-    def _handle_message(self, raw_message: str):
+        Uses msgspec's schema-validating decoder when available. Anything it
+        rejects is decoded again and run through validate_envelope, so decode
+        and validation errors are reported exactly as without msgspec.
+        """
+        if MSGSPEC_AVAILABLE:
+            try:
+                return decode_envelope(raw_message, self.wire_format)
+            except EnvelopeValidationError:
+                pass
+        message = self._decode(raw_message)
+        validate_envelope(message)
+        return message
+
+    def _handle_message(self, raw_message: Union[str, bytes]):
         """
         Deserializes and routes an incoming message.
         """
-        from conestoga.beast.envelope import validate_envelope, EnvelopeValidationError
-
         try:
-            message = json.loads(raw_message)
-
-            # Validate envelope format
+            # Decode and validate envelope format
             try:
-                validate_envelope(message)
+                message = self._load_envelope(raw_message)
             except EnvelopeValidationError as e:
                 logging.error(f"Envelope validation failed: {e}")
                 if self.observability:
-                    self.observability.messages_total.labels(
-                        type="invalid", direction="in"
-                    ).inc()
+                    self.observability.count_message("invalid", "in")
                 return  # Reject malformed message
 
             if self.hacp_interceptor:
@@ -126,32 +382,34 @@ class BeastAdapter:
                         self.observability.hacp_violations.inc()
                     return  # Block message due to HACP violation
 
+            message_type = (message.get("payload") or {}).get("type")
             if self.observability:
-                self.observability.messages_total.labels(
-                    type=message.get("payload", {}).get("type", "unknown"),
-                    direction="in",
-                ).inc()
+                self.observability.count_message(
+                    "unknown" if message_type is None else message_type, "in"
+                )
                 parent_context = self.observability.extract_trace_context(message)
                 with self.observability.get_tracer().start_as_current_span(
                     "handle_message", context=parent_context
                 ):
-                    self._dispatch_message(message)
+                    self._dispatch_message(message, message_type)
             else:
-                self._dispatch_message(message)
+                self._dispatch_message(message, message_type)
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, EnvelopeValidationError):
             logging.error("Failed to decode incoming message.")
         except Exception as e:
             logging.error(f"Error handling message: {e}")
 
-    def _dispatch_message(self, message):
-        message_type = message.get("payload", {}).get("type")
-        if message_type in self.handlers:
+    def _dispatch_message(self, message, message_type: Optional[str] = None):
+        if message_type is None:
+            message_type = (message.get("payload") or {}).get("type")
+        handler = self.handlers.get(message_type)
+        if handler is not None:
             if self.observability:
                 with self.observability.processing_duration.time():
-                    self.handlers[message_type](message)
+                    handler(message)
             else:
-                self.handlers[message_type](message)
+                handler(message)
         else:
             logging.warning(f"No handler for message type: {message_type}")
 
@@ -169,13 +427,13 @@ class BeastAdapter:
 
         if self.observability:
             message = self.observability.inject_trace_context(message)
-            self.observability.messages_total.labels(
-                type=message.get("payload", {}).get("type", "unknown"), direction="out"
-            ).inc()
+            self.observability.count_message(
+                message.get("payload", {}).get("type", "unknown"), "out"
+            )
 
         try:
             channel = "beast:global:messages"  # Default channel, could be dynamic based on message content
-            self.redis_client.publish(channel, json.dumps(message))
+            self.redis_client.publish(channel, self._encode(message))
         except redis.exceptions.ConnectionError:
             logging.error("Failed to send message due to connection error.")
         except Exception as e:
@@ -191,64 +449,139 @@ class BeastAdapter:
         subscribe_thread.start()
 
     # Async methods for async/await support
+    async def async_connect(self):
+        """
+        Async version of connect(), using a natively awaitable Redis client.
+
+        Also creates the async client for an adapter already connected with
+        connect(), since the two paths share is_connected.
+        """
+        retry_delay = 1
+        while not self.is_connected or self.async_redis_client is None:
+            client = aioredis.Redis(**self._connection_kwargs())
+            try:
+                await client.ping()
+                self.async_redis_client = client
+                self.is_connected = True
+                logging.info("BeastAdapter connected to Redis.")
+            except (
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+            ) as e:
+                await self._close_async_client(client)
+                logging.error(
+                    f"Redis connection failed: {e}. Retrying in {retry_delay} seconds."
+                )
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30)
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._async_heartbeat())
+
+    @staticmethod
+    async def _close_async_client(client):
+        """
+        Closes an async client that is being discarded, ignoring errors from
+        its already broken connection.
+        """
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except Exception as e:
+            logging.debug(f"Error closing Redis client: {e}")
+
+    async def _async_heartbeat(self):
+        """
+        Async version of the heartbeat thread started by connect().
+        """
+        while self.is_connected:
+            try:
+                await self.async_redis_client.publish("beast:global:heartbeat", self.agent_id)
+                if self.observability:
+                    self.observability.connection_status.set(1)
+                await asyncio.sleep(10)
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                if self.observability:
+                    self.observability.connection_status.set(0)
+                self.is_connected = False
+                logging.error("Heartbeat failed. Reconnecting...")
+                # Release the dead client's pool before async_connect replaces it
+                client, self.async_redis_client = self.async_redis_client, None
+                await self._close_async_client(client)
+                await asyncio.sleep(1)
+                await self.async_connect()
+            except Exception as e:
+                # Any other failure skips this beat rather than ending the task
+                logging.error(f"Heartbeat failed: {e}")
+                await asyncio.sleep(10)
+
     async def async_start(self):
         """
         Async version of start() for use in async contexts.
+
+        Subscriptions go through a pubsub connection shared with the other
+        async adapters in this process, rather than one connection each.
         """
-        await asyncio.to_thread(self.connect)
-        self._subscribe_task = asyncio.create_task(self._async_subscribe())
+        await self.async_connect()
+        connection_kwargs = self._connection_kwargs()
+        key = (asyncio.get_running_loop(), *sorted(connection_kwargs.items()))
+        subscriber = self._shared_subscribers.get(key)
+        if subscriber is None:
+            subscriber = _SharedSubscriber(connection_kwargs)
+            self._shared_subscribers[key] = subscriber
+        self._shared_key = key
+        await subscriber.add(
+            self,
+            [
+                f"beast:agent:{self.agent_id}:inbox",
+                self.reply_channel,
+                "beast:global:announcements",
+            ],
+        )
+        self._subscribe_task = subscriber.task
 
     async def async_stop(self):
         """
         Stops the adapter and closes connections.
         """
         self.is_connected = False
-        if self._subscribe_task:
-            self._subscribe_task.cancel()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
             try:
-                await self._subscribe_task
+                await self._heartbeat_task
             except asyncio.CancelledError:
                 # Task cancellation is expected when stopping the adapter.
-                logging.debug("Subscribe task cancelled during async_stop (expected during shutdown).")
-        if self.redis_client:
-            await asyncio.to_thread(self.redis_client.close)
-
-    async def _async_subscribe(self):
-        """
-        Async version of subscribe loop.
-        """
-        pubsub = await asyncio.to_thread(self.redis_client.pubsub)
-        await asyncio.to_thread(pubsub.subscribe, f"beast:agent:{self.agent_id}:inbox")
-        await asyncio.to_thread(pubsub.subscribe, "beast:global:announcements")
-
-        while self.is_connected:
-            try:
-                message = await asyncio.to_thread(pubsub.get_message, timeout=1.0)
-                if message and message["type"] == "message":
-                    await self._async_handle_message(message["data"])
+                logging.debug("Heartbeat task cancelled during async_stop.")
             except Exception as e:
-                if self.is_connected:
-                    logging.error(f"Error in async subscribe loop: {e}")
-                break
+                # A heartbeat that already failed must not abort the teardown
+                logging.error(f"Heartbeat task failed: {e}")
+            self._heartbeat_task = None
+        subscriber = self._shared_subscribers.get(self._shared_key)
+        if subscriber is not None and await subscriber.remove(self):
+            del self._shared_subscribers[self._shared_key]
+        self._shared_key = None
+        # Deliver fire-and-forget messages still queued or in flight
+        self._flush_outbox()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        if self.async_redis_client:
+            await self.async_redis_client.aclose()
+            self.async_redis_client = None
+        if self.redis_client:
+            self.redis_client.close()
 
-    async def _async_handle_message(self, raw_message: str):
+    async def _async_handle_message(self, raw_message: Union[str, bytes]):
         """
         Async version of message handler.
         """
-        from conestoga.beast.envelope import validate_envelope, EnvelopeValidationError
-
         try:
-            message = json.loads(raw_message)
-
-            # Validate envelope format
+            # Decode and validate envelope format
             try:
-                validate_envelope(message)
+                message = self._load_envelope(raw_message)
             except EnvelopeValidationError as e:
                 logging.error(f"Envelope validation failed: {e}")
                 if self.observability:
-                    self.observability.messages_total.labels(
-                        type="invalid", direction="in"
-                    ).inc()
+                    self.observability.count_message("invalid", "in")
                 return
 
             if self.hacp_interceptor:
@@ -259,63 +592,118 @@ class BeastAdapter:
                         self.observability.hacp_violations.inc()
                     return
 
+            payload = message.get("payload") or {}
+
             # Check if this is a reply to a pending request
-            correlation_id = message.get("payload", {}).get("correlation_id")
-            if correlation_id and correlation_id in self.pending_replies:
-                future = self.pending_replies.pop(correlation_id)
-                future.set_result(message.get("payload"))
-                return
+            correlation_id = payload.get("correlation_id")
+            if correlation_id:
+                future = self.pending_replies.pop(correlation_id, None)
+                if future is not None and not future.done():
+                    future.set_result(message.get("payload"))
+                    return
 
+            message_type = payload.get("type")
             if self.observability:
-                self.observability.messages_total.labels(
-                    type=message.get("payload", {}).get("type", "unknown"),
-                    direction="in",
-                ).inc()
+                self.observability.count_message(
+                    "unknown" if message_type is None else message_type, "in"
+                )
 
-            await self._async_dispatch_message(message)
+            await self._async_dispatch_message(message, message_type)
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, EnvelopeValidationError):
             logging.error("Failed to decode incoming message.")
         except Exception as e:
             logging.error(f"Error handling message: {e}")
 
-    async def _async_dispatch_message(self, message):
+    async def _async_dispatch_message(self, message, message_type: Optional[str] = None):
         """
         Async version of message dispatcher.
         """
-        message_type = message.get("payload", {}).get("type")
-        if message_type in self.handlers:
-            handler = self.handlers[message_type]
-            if asyncio.iscoroutinefunction(handler):
-                await handler(message.get("payload"))
+        if message_type is None:
+            message_type = (message.get("payload") or {}).get("type")
+        handler = self.handlers.get(message_type)
+        if handler is not None:
+            is_coroutine = self._coroutine_handlers.get(handler)
+            if is_coroutine is None:
+                # Handler assigned without register_handler; inspect it once
+                is_coroutine = self._mark_handler(handler)
+            payload = message.get("payload")
+            if is_coroutine:
+                await handler(payload)
             else:
-                await asyncio.to_thread(handler, message.get("payload"))
+                await asyncio.to_thread(handler, payload)
         else:
             logging.warning(f"No handler for message type: {message_type}")
 
     async def async_send_message(
-        self, target_agent: str, message_type: str, payload: dict
+        self,
+        target_agent: str,
+        message_type: str,
+        payload: dict,
+        fire_and_forget: bool = False,
     ) -> str:
         """
         Async version of send_message that returns a correlation ID.
-        """
-        from conestoga.beast.envelope import create_envelope
-        from datetime import datetime
 
-        correlation_id = str(uuid.uuid4())
+        The payload names this adapter's reply channel, so async_send_reply
+        on the receiving side delivers the reply there instead of the inbox.
+
+        With fire_and_forget, returns as soon as the message is queued rather
+        than after Redis acknowledges the publish; send failures are logged
+        instead of raised.
+        """
+        correlation_id = secrets.token_hex(16)
         payload["correlation_id"] = correlation_id
+        payload["reply_to"] = self.reply_channel
 
         # Create proper Beast envelope
         envelope = create_envelope(
             sender=self.agent_id,
             message_type=message_type,
             payload_data=payload,
-            message_id=str(uuid.uuid4()),
             metadata={"recipient": target_agent},
         )
 
-        message = envelope.to_dict()
+        await self._async_publish(
+            f"beast:agent:{target_agent}:inbox",
+            envelope.to_dict(),
+            message_type,
+            wait=not fire_and_forget,
+        )
+        return correlation_id
+
+    async def async_send_reply(
+        self, request: dict, message_type: str, payload: dict, fire_and_forget: bool = False
+    ):
+        """
+        Replies to a request payload received by an async handler.
 
+        The reply carries the request's correlation ID and is published on the
+        requester's reply channel. fire_and_forget is as for async_send_message.
+        """
+        reply_to = request.get("reply_to")
+        if not reply_to:
+            raise ValueError("Request payload has no reply channel")
+
+        envelope = create_envelope(
+            sender=self.agent_id,
+            message_type=message_type,
+            payload_data={**payload, "correlation_id": request.get("correlation_id")},
+        )
+
+        await self._async_publish(
+            reply_to, envelope.to_dict(), message_type, wait=not fire_and_forget
+        )
+
+    async def _async_publish(
+        self, channel: str, message: dict, message_type: str, wait: bool = True
+    ):
+        """
+        Applies outbound HACP / observability to a message and publishes it.
+
+        Unless wait is set, returns once the message is queued for the next
+        flush without awaiting the publish reply.
+        """
         if self.hacp_interceptor:
             try:
                 message = self.hacp_interceptor.intercept(message, "out")
@@ -326,16 +714,19 @@ class BeastAdapter:
 
         if self.observability:
             message = self.observability.inject_trace_context(message)
-            self.observability.messages_total.labels(
-                type=message_type, direction="out"
-            ).inc()
+            self.observability.count_message(message_type, "out")
+
+        # Publishes issued during the same event-loop tick are sent together
+        loop = asyncio.get_running_loop()
+        sent = loop.create_future() if wait else None
+        self._outbox.append((channel, self._encode(message), sent))
+        if len(self._outbox) == 1:
+            loop.call_soon(self._flush_outbox)
+        if sent is None:
+            return
 
         try:
-            channel = f"beast:agent:{target_agent}:inbox"
-            await asyncio.to_thread(
-                self.redis_client.publish, channel, json.dumps(message)
-            )
-            return correlation_id
+            await sent
         except redis.exceptions.ConnectionError:
             logging.error("Failed to send message due to connection error.")
             raise
@@ -343,24 +734,66 @@ class BeastAdapter:
             logging.error(f"Error sending message: {e}")
             raise
 
+    def _flush_outbox(self):
+        """
+        Starts sending every queued publish in one round trip.
+        """
+        if not self._outbox:
+            return
+        batch, self._outbox = self._outbox, []
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _async_client(self):
+        """
+        Returns the async client, creating it for adapters connected with connect().
+        """
+        if self.async_redis_client is None:
+            self.async_redis_client = aioredis.Redis(**self._connection_kwargs())
+        return self.async_redis_client
+
+    async def _send_batch(self, batch: list):
+        try:
+            client = self._async_client()
+            if len(batch) == 1:
+                channel, body, _ = batch[0]
+                await client.publish(channel, body)
+            else:
+                pipe = client.pipeline(transaction=False)
+                for channel, body, _ in batch:
+                    pipe.publish(channel, body)
+                await pipe.execute()
+        except Exception as e:
+            for _, _, sent in batch:
+                if sent is None:
+                    logging.error(f"Error sending message: {e}")
+                elif not sent.done():
+                    sent.set_exception(e)
+        else:
+            for _, _, sent in batch:
+                if sent is not None and not sent.done():
+                    sent.set_result(None)
+
     async def async_wait_for_reply(
         self, correlation_id: str, timeout: float = 30.0
     ) -> dict:
         """
         Waits for a reply with the given correlation ID.
+
+        The pending entry is removed however the wait ends (reply, timeout,
+        cancellation), so pending_replies only holds replies still awaited.
         """
-        future = asyncio.Future()
+        future = asyncio.get_running_loop().create_future()
         self.pending_replies[correlation_id] = future
 
         try:
-            result = await asyncio.wait_for(future, timeout=timeout)
-            return result
-        except asyncio.TimeoutError:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
             self.pending_replies.pop(correlation_id, None)
-            raise
 
     async def async_register_handler(self, message_type: str, handler: Callable):
         """
         Registers a handler for a specific message type.
         """
-        self.handlers[message_type] = handler
+        self.register_handler(message_type, handler)
@@ -5,9 +5,59 @@ Provides validation for Beast message envelopes to ensure conformance
 with the standard Beast message format.
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Union
+from datetime import UTC, datetime
 import logging
+import secrets
+import time
+
+# MessagePack framing is optional and needs msgspec; the codecs are stateless
+# and reused for every envelope
+try:
+    import msgspec
+
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+# (time.time(), formatted header timestamp) of the last envelope created;
+# envelopes created within TIMESTAMP_RESOLUTION seconds reuse the string
+TIMESTAMP_RESOLUTION = 0.001
+_timestamp_cache = (0.0, "")
+
+
+if MSGSPEC_AVAILABLE:
+    # Schema mirroring the checks in validate_envelope, so a well-formed
+    # envelope is type-checked in a single C call. Unknown fields are ignored,
+    # as they are by the Python checks.
+
+    class _TraceContextSchema(msgspec.Struct):
+        trace_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        span_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+
+    class _HeaderSchema(msgspec.Struct):
+        sender: str
+        timestamp: str
+        id: str
+        trace_context: Union[_TraceContextSchema, msgspec.UnsetType] = msgspec.UNSET
+
+    class _PayloadSchema(msgspec.Struct):
+        type: str
+
+    class _EnvelopeSchema(msgspec.Struct):
+        header: _HeaderSchema
+        payload: _PayloadSchema
+        metadata: Union[Dict[str, Any], msgspec.UnsetType] = msgspec.UNSET
+
+    # Decoders producing the dict handed to handlers, which keeps fields the
+    # schema does not declare; the schema is checked on that dict afterwards
+    _envelope_decoders = {
+        "json": msgspec.json.Decoder(),
+        "msgpack": _msgpack_decoder,
+    }
 
 
 class EnvelopeValidationError(Exception):
@@ -69,6 +119,78 @@ class BeastEnvelope:
             metadata=data.get("metadata"),
         )
 
+    def get_timestamp(self) -> datetime:
+        """Header timestamp as a datetime (timezone-aware when it has an offset)."""
+        return parse_timestamp(self.header["timestamp"])
+
+    def to_msgpack(self) -> bytes:
+        """Serialize envelope to MessagePack bytes."""
+        return encode_msgpack(self.to_dict())
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "BeastEnvelope":
+        """Create envelope from MessagePack bytes, with validation."""
+        return cls.from_dict(decode_msgpack(data))
+
+
+def encode_msgpack(message: Dict[str, Any]) -> bytes:
+    """
+    Encodes an envelope dictionary as MessagePack.
+
+    Raises:
+        RuntimeError: If msgspec is not installed
+    """
+    if not MSGSPEC_AVAILABLE:
+        raise RuntimeError("MessagePack envelopes require msgspec")
+    return _msgpack_encoder.encode(message)
+
+
+def decode_msgpack(data: bytes) -> Any:
+    """
+    Decodes MessagePack bytes into an (unvalidated) envelope dictionary.
+
+    Raises:
+        RuntimeError: If msgspec is not installed
+        EnvelopeValidationError: If the bytes are not valid MessagePack
+    """
+    if not MSGSPEC_AVAILABLE:
+        raise RuntimeError("MessagePack envelopes require msgspec")
+    try:
+        return _msgpack_decoder.decode(data)
+    except msgspec.DecodeError as e:
+        raise EnvelopeValidationError(f"Invalid MessagePack envelope: {e}") from e
+
+
+def decode_envelope(data: Union[str, bytes], wire_format: str = "json") -> Dict[str, Any]:
+    """
+    Decodes and validates a raw envelope in one step.
+
+    The data is parsed once, and the resulting dict is checked against the
+    schema by msgspec in C rather than by the Python checks. Any failure is
+    reported without detail; callers wanting the precise reason can fall
+    back to decoding and validate_envelope.
+
+    Args:
+        data: Envelope encoded as JSON (str or bytes) or MessagePack (bytes)
+        wire_format: "json" or "msgpack"
+
+    Returns:
+        The envelope dictionary
+
+    Raises:
+        RuntimeError: If msgspec is not installed
+        EnvelopeValidationError: If the data is malformed or not a valid envelope
+    """
+    if not MSGSPEC_AVAILABLE:
+        raise RuntimeError("Schema-based envelope decoding requires msgspec")
+    try:
+        envelope = _envelope_decoders[wire_format].decode(data)
+        schema = msgspec.convert(envelope, _EnvelopeSchema)
+    except (msgspec.DecodeError, msgspec.ValidationError) as e:
+        raise EnvelopeValidationError(f"Invalid envelope: {e}") from e
+    _validate_timestamp(schema.header.timestamp)
+    return envelope
+
 
 def validate_envelope(envelope: Dict[str, Any]) -> None:
     """
@@ -80,6 +202,17 @@ def validate_envelope(envelope: Dict[str, Any]) -> None:
     Raises:
         EnvelopeValidationError: If validation fails
     """
+    if MSGSPEC_AVAILABLE:
+        try:
+            msgspec.convert(envelope, _EnvelopeSchema)
+        except msgspec.ValidationError:
+            # Fall through to the checks below for a precise error message
+            pass
+        else:
+            _validate_timestamp(envelope["header"]["timestamp"])
+            logging.debug(f"Envelope validation passed for message ID: {envelope['header']['id']}")
+            return
+
     # Validate top-level structure
     if not isinstance(envelope, dict):
         raise EnvelopeValidationError("Envelope must be a dictionary")
@@ -101,12 +234,7 @@ def validate_envelope(envelope: Dict[str, Any]) -> None:
             raise EnvelopeValidationError(f"Header field '{field}' must be a string")
 
     # Validate timestamp format
-    try:
-        datetime.fromisoformat(header["timestamp"].replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        raise EnvelopeValidationError(
-            f"Invalid timestamp format: {header.get('timestamp')}"
-        )
+    _validate_timestamp(header["timestamp"])
 
     # Validate trace_context if present
     if "trace_context" in header:
@@ -141,6 +269,35 @@ def validate_envelope(envelope: Dict[str, Any]) -> None:
     logging.debug(f"Envelope validation passed for message ID: {header['id']}")
 
 
+def _validate_timestamp(timestamp: str) -> None:
+    """Raises EnvelopeValidationError unless timestamp is ISO-8601."""
+    try:
+        parse_timestamp(timestamp)
+    except (TypeError, ValueError):
+        raise EnvelopeValidationError(f"Invalid timestamp format: {timestamp}")
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parses an envelope timestamp.
+
+    datetime.fromisoformat accepts a trailing "Z" since Python 3.11, so the
+    string is parsed as-is, without building a "+00:00" copy first.
+    """
+    return datetime.fromisoformat(timestamp)
+
+
+def _current_timestamp() -> str:
+    """Current UTC time as ISO-8601 with a "Z" suffix, reformatted only when stale."""
+    global _timestamp_cache
+    now = time.time()
+    cached_at, timestamp = _timestamp_cache
+    if not 0 <= now - cached_at < TIMESTAMP_RESOLUTION:
+        timestamp = datetime.fromtimestamp(now, UTC).isoformat().replace("+00:00", "Z")
+        _timestamp_cache = (now, timestamp)
+    return timestamp
+
+
 def create_envelope(
     sender: str,
     message_type: str,
@@ -155,20 +312,18 @@ def create_envelope(
         sender: Agent ID of the sender
         message_type: Type of the message
         payload_data: Additional payload data beyond type
-        message_id: Optional message ID (generated if not provided)
+        message_id: Optional message ID (random 32-digit hex if not provided)
         metadata: Optional metadata dictionary
 
     Returns:
         BeastEnvelope: A validated envelope
     """
-    import uuid
-
     if message_id is None:
-        message_id = str(uuid.uuid4())
+        message_id = secrets.token_hex(16)
 
     header = {
         "sender": sender,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _current_timestamp(),
         "id": message_id,
     }
 
@@ -1,17 +1,32 @@
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from prometheus_client import Counter, Histogram, Gauge, start_http_server
 
+# Fraction of root traces that are recorded; children follow their parent's decision
+DEFAULT_TRACE_SAMPLE_RATIO = 0.01
+
+
 class ObservabilityStack:
-    def __init__(self, service_name: str, jaeger_host: str, jaeger_port: int, metrics_port: int):
+    def __init__(
+        self,
+        service_name: str,
+        jaeger_host: str,
+        jaeger_port: int,
+        metrics_port: int,
+        trace_sample_ratio: float = DEFAULT_TRACE_SAMPLE_RATIO,
+    ):
         self.service_name = service_name
+        self.trace_sample_ratio = trace_sample_ratio
         self._setup_tracer(jaeger_host, jaeger_port)
         self._setup_metrics(metrics_port)
 
     def _setup_tracer(self, host: str, port: int):
-        trace.set_tracer_provider(TracerProvider())
+        trace.set_tracer_provider(
+            TracerProvider(sampler=ParentBasedTraceIdRatio(self.trace_sample_ratio))
+        )
         otlp_exporter = OTLPSpanExporter(
             endpoint=f"http://{host}:{port}",
         )
@@ -26,6 +41,15 @@ class ObservabilityStack:
         self.processing_duration = Histogram('beast_processing_duration_seconds', 'Message processing duration')
         self.connection_status = Gauge('beast_connection_status', 'Beast connection status')
         self.hacp_violations = Counter('hacp_violations_total', 'Total HACP violations')
+        # (type, direction) -> messages_total child, so labels() runs once per pair
+        self._message_counters = {}
+
+    def count_message(self, message_type: str, direction: str):
+        counter = self._message_counters.get((message_type, direction))
+        if counter is None:
+            counter = self.messages_total.labels(type=message_type, direction=direction)
+            self._message_counters[(message_type, direction)] = counter
+        counter.inc()
 
     def get_tracer(self):
         return self.tracer
@@ -34,6 +58,9 @@ class ObservabilityStack:
         # This is a simplified injection. In a real scenario, we'd use W3C trace context format.
         with self.tracer.start_as_current_span("send_message") as span:
             ctx = span.get_span_context()
+            if not ctx.trace_flags.sampled:
+                # Unsampled spans are never exported; don't propagate them either
+                return message
             message.setdefault("header", {})["trace_context"] = {
                 "trace_id": format(ctx.trace_id, 'x'),
                 "span_id": format(ctx.span_id, 'x'),
@@ -5,16 +5,134 @@ Provides semantic interoperability between Beast concepts and Eudorus ontology.
 Maps Beast Agent, Task, and Validation entities to RDF/OWL representations.
 """
 
-from typing import Dict, Any, Optional, List
-from rdflib import Graph, Namespace, Literal, URIRef
+from typing import IO, Dict, Any, Optional, List, Tuple, Union
+from rdflib import Graph, Namespace, Literal, URIRef, plugin
 from rdflib.namespace import RDF, RDFS, OWL
+from rdflib.parser import Parser
+from rdflib.plugin import PluginException
+from rdflib.serializer import Serializer
+import functools
 import logging
 
+# Rust-backed rdflib store (pyoxigraph), registered with rdflib as "Oxigraph"
+try:
+    import oxrdflib  # noqa: F401
+
+    OXRDFLIB_AVAILABLE = True
+except ImportError:
+    OXRDFLIB_AVAILABLE = False
+
+# rdflib format -> oxrdflib's Rust parser for it, used when registered. These
+# parsers type plain literals as xsd:string, like the Oxigraph store does, so
+# they are only used for graphs on that store; in rdflib's own store those
+# literals would not match the plain ones created by the layer.
+_NATIVE_PARSERS: Dict[str, str] = {}
+if OXRDFLIB_AVAILABLE:
+    try:
+        plugin.get("ox-turtle", Parser)
+        _NATIVE_PARSERS = {
+            "turtle": "ox-turtle",
+            "ttl": "ox-turtle",
+            "nt": "ox-ntriples",
+            "ntriples": "ox-ntriples",
+            "xml": "ox-xml",
+        }
+    except PluginException:
+        logging.debug("oxrdflib parsers not registered; using rdflib's parsers.")
+
+# oxrdflib's Rust Turtle serializer when registered. Like the native parsers it
+# is only used on the Oxigraph store: for rdflib's store it writes every bound
+# prefix and one ungrouped triple per line, roughly doubling the output.
+_TURTLE_SERIALIZER = "turtle"
+if OXRDFLIB_AVAILABLE:
+    try:
+        plugin.get("ox-turtle", Serializer)
+        _TURTLE_SERIALIZER = "ox-turtle"
+    except PluginException:
+        logging.debug("oxrdflib serializers not registered; using rdflib's serializer.")
 
 # Define Beast semantics namespace
 BEAST = Namespace("http://nkllon.com/ontology/beast#")
 EUDORUS = Namespace("http://nkllon.com/ontology/eudorus#")
 
+# Terms used per entity, resolved once instead of per namespace attribute access
+_RDF_TYPE = RDF.type
+_RDFS_LABEL = RDFS.label
+_BEAST_AGENT = BEAST.Agent
+_BEAST_TASK = BEAST.Task
+_BEAST_VALIDATION = BEAST.Validation
+_BEAST_EXECUTES = BEAST.executesTask
+_BEAST_HAS_VAL = BEAST.hasValidation
+_BEAST_HAS_MONITOR = BEAST.hasMonitor
+_BEAST_RESULT = BEAST.result
+
+
+@functools.lru_cache(maxsize=1024)
+def _beast_prop(key: str) -> URIRef:
+    """BEAST[key], built once per property key seen in entity properties."""
+    return BEAST[key]
+
+
+# Core class and property declarations added to every new layer's graph
+_CORE_TRIPLES = (
+    # Beast Agent class
+    (BEAST.Agent, RDF.type, OWL.Class),
+    (BEAST.Agent, RDFS.label, Literal("Beast Agent")),
+    (
+        BEAST.Agent,
+        RDFS.comment,
+        Literal("An autonomous agent participating in the Beast network"),
+    ),
+    # Beast Task class
+    (BEAST.Task, RDF.type, OWL.Class),
+    (BEAST.Task, RDFS.label, Literal("Beast Task")),
+    (
+        BEAST.Task,
+        RDFS.comment,
+        Literal("A unit of work assigned to or executed by an agent"),
+    ),
+    # Beast Validation class
+    (BEAST.Validation, RDF.type, OWL.Class),
+    (BEAST.Validation, RDFS.label, Literal("Beast Validation")),
+    (
+        BEAST.Validation,
+        RDFS.comment,
+        Literal("A validation check or test result for a task or agent"),
+    ),
+    # Observability classes
+    (EUDORUS.PrometheusExporter, RDF.type, OWL.Class),
+    (EUDORUS.PrometheusExporter, RDFS.label, Literal("Prometheus Exporter")),
+    (
+        EUDORUS.PrometheusExporter,
+        RDFS.comment,
+        Literal("Exports metrics in Prometheus format"),
+    ),
+    (EUDORUS.JaegerTracer, RDF.type, OWL.Class),
+    (EUDORUS.JaegerTracer, RDFS.label, Literal("Jaeger Tracer")),
+    (
+        EUDORUS.JaegerTracer,
+        RDFS.comment,
+        Literal("Distributed tracing component using Jaeger"),
+    ),
+    (EUDORUS.ObservatoryConnector, RDF.type, OWL.Class),
+    (EUDORUS.ObservatoryConnector, RDFS.label, Literal("Observatory Connector")),
+    (
+        EUDORUS.ObservatoryConnector,
+        RDFS.comment,
+        Literal("Connects agents to the Observatory monitoring system"),
+    ),
+    # Properties
+    (BEAST.hasMonitor, RDF.type, OWL.ObjectProperty),
+    (BEAST.hasMonitor, RDFS.domain, BEAST.Agent),
+    (BEAST.hasMonitor, RDFS.range, EUDORUS.ObservatoryConnector),
+    (BEAST.executesTask, RDF.type, OWL.ObjectProperty),
+    (BEAST.executesTask, RDFS.domain, BEAST.Agent),
+    (BEAST.executesTask, RDFS.range, BEAST.Task),
+    (BEAST.hasValidation, RDF.type, OWL.ObjectProperty),
+    (BEAST.hasValidation, RDFS.domain, BEAST.Task),
+    (BEAST.hasValidation, RDFS.range, BEAST.Validation),
+)
+
 
 class SemanticAlignmentLayer:
     """
@@ -27,14 +145,38 @@ class SemanticAlignmentLayer:
     - Define observability monitoring classes
     """
 
-    def __init__(self, ontology_path: Optional[str] = None):
+    # Monitor type accepted by link_agent_to_monitor -> its Eudorus class
+    _MONITOR_CLASSES = {
+        "prometheus": EUDORUS.PrometheusExporter,
+        "jaeger": EUDORUS.JaegerTracer,
+        "observatory": EUDORUS.ObservatoryConnector,
+    }
+
+    # Parser overrides for load_ontology / process_rdf_payload (see _NATIVE_PARSERS)
+    _parser_formats: Dict[str, str] = {}
+    # Serializer used by export_as_turtle (see _TURTLE_SERIALIZER)
+    _turtle_serializer = "turtle"
+
+    def __init__(self, ontology_path: Optional[str] = None, store: str = "default"):
         """
         Initialize the semantic alignment layer.
 
         Args:
             ontology_path: Optional path to load existing ontology
+            store: "default" for rdflib's in-memory store, or "oxigraph" for
+                the pyoxigraph store (needs oxrdflib), which scales better to
+                large graphs and answers SPARQL with oxigraph's native engine
         """
-        self.graph = Graph()
+        if store == "oxigraph":
+            if not OXRDFLIB_AVAILABLE:
+                raise ValueError("The 'oxigraph' store requires oxrdflib")
+            self.graph = Graph(store="Oxigraph")
+            self._parser_formats = _NATIVE_PARSERS
+            self._turtle_serializer = _TURTLE_SERIALIZER
+        elif store == "default":
+            self.graph = Graph()
+        else:
+            raise ValueError(f"Unknown store: {store!r}")
         self._initialize_namespaces()
         self._define_core_classes()
 
@@ -51,97 +193,21 @@ class SemanticAlignmentLayer:
 
     def _define_core_classes(self):
         """Define core Beast and Eudorus ontology classes."""
-        # Beast Agent class
-        self.graph.add((BEAST.Agent, RDF.type, OWL.Class))
-        self.graph.add((BEAST.Agent, RDFS.label, Literal("Beast Agent")))
-        self.graph.add(
-            (
-                BEAST.Agent,
-                RDFS.comment,
-                Literal("An autonomous agent participating in the Beast network"),
-            )
-        )
-
-        # Beast Task class
-        self.graph.add((BEAST.Task, RDF.type, OWL.Class))
-        self.graph.add((BEAST.Task, RDFS.label, Literal("Beast Task")))
-        self.graph.add(
-            (
-                BEAST.Task,
-                RDFS.comment,
-                Literal("A unit of work assigned to or executed by an agent"),
-            )
-        )
-
-        # Beast Validation class
-        self.graph.add((BEAST.Validation, RDF.type, OWL.Class))
-        self.graph.add((BEAST.Validation, RDFS.label, Literal("Beast Validation")))
-        self.graph.add(
-            (
-                BEAST.Validation,
-                RDFS.comment,
-                Literal("A validation check or test result for a task or agent"),
-            )
-        )
-
-        # Observability classes
-        self.graph.add((EUDORUS.PrometheusExporter, RDF.type, OWL.Class))
-        self.graph.add(
-            (EUDORUS.PrometheusExporter, RDFS.label, Literal("Prometheus Exporter"))
-        )
-        self.graph.add(
-            (
-                EUDORUS.PrometheusExporter,
-                RDFS.comment,
-                Literal("Exports metrics in Prometheus format"),
-            )
-        )
-
-        self.graph.add((EUDORUS.JaegerTracer, RDF.type, OWL.Class))
-        self.graph.add((EUDORUS.JaegerTracer, RDFS.label, Literal("Jaeger Tracer")))
-        self.graph.add(
-            (
-                EUDORUS.JaegerTracer,
-                RDFS.comment,
-                Literal("Distributed tracing component using Jaeger"),
-            )
-        )
-
-        self.graph.add((EUDORUS.ObservatoryConnector, RDF.type, OWL.Class))
-        self.graph.add(
-            (EUDORUS.ObservatoryConnector, RDFS.label, Literal("Observatory Connector"))
-        )
-        self.graph.add(
-            (
-                EUDORUS.ObservatoryConnector,
-                RDFS.comment,
-                Literal("Connects agents to the Observatory monitoring system"),
-            )
-        )
-
-        # Properties
-        self.graph.add((BEAST.hasMonitor, RDF.type, OWL.ObjectProperty))
-        self.graph.add((BEAST.hasMonitor, RDFS.domain, BEAST.Agent))
-        self.graph.add((BEAST.hasMonitor, RDFS.range, EUDORUS.ObservatoryConnector))
-
-        self.graph.add((BEAST.executesTask, RDF.type, OWL.ObjectProperty))
-        self.graph.add((BEAST.executesTask, RDFS.domain, BEAST.Agent))
-        self.graph.add((BEAST.executesTask, RDFS.range, BEAST.Task))
-
-        self.graph.add((BEAST.hasValidation, RDF.type, OWL.ObjectProperty))
-        self.graph.add((BEAST.hasValidation, RDFS.domain, BEAST.Task))
-        self.graph.add((BEAST.hasValidation, RDFS.range, BEAST.Validation))
+        self.graph.addN((s, p, o, self.graph) for s, p, o in _CORE_TRIPLES)
 
     def load_ontology(self, path: str, format: str = "turtle"):
         """
         Load an existing ontology file.
 
+        On the oxigraph store, Turtle, N-Triples and RDF/XML are read with
+        oxrdflib's Rust parsers.
+
         Args:
             path: Path to the ontology file
             format: RDF format (turtle, xml, n3, etc.)
         """
         try:
-            self.graph.parse(path, format=format)
+            self.graph.parse(path, format=self._parser_formats.get(format, format))
             logging.info(f"Loaded ontology from {path}")
         except Exception as e:
             logging.error(f"Failed to load ontology from {path}: {e}")
@@ -176,16 +242,47 @@ class SemanticAlignmentLayer:
             URIRef: The agent's URI reference
         """
         agent_uri = BEAST[f"agent/{agent_id}"]
-        self.graph.add((agent_uri, RDF.type, BEAST.Agent))
-        self.graph.add((agent_uri, RDFS.label, Literal(agent_id)))
+        self.graph.addN(self._agent_quads(agent_uri, agent_id, properties))
 
-        if properties:
-            for key, value in properties.items():
-                self.graph.add((agent_uri, BEAST[key], Literal(value)))
-
-        logging.debug(f"Created agent entity: {agent_id}")
+        logging.debug("Created agent entity: %s", agent_id)
         return agent_uri
 
+    def create_agents_bulk(
+        self, agents: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[URIRef]:
+        """
+        Create many agent entities with a single store insert.
+
+        Args:
+            agents: (agent_id, properties) pairs, as for create_agent
+
+        Returns:
+            List[URIRef]: The agents' URI references, in input order
+        """
+        agent_uris = [BEAST[f"agent/{agent_id}"] for agent_id, _ in agents]
+        quads = []
+        for agent_uri, (agent_id, properties) in zip(agent_uris, agents, strict=True):
+            quads.extend(self._agent_quads(agent_uri, agent_id, properties))
+        self.graph.addN(quads)
+
+        logging.debug("Created %d agent entities", len(agent_uris))
+        return agent_uris
+
+    def _agent_quads(
+        self, agent_uri: URIRef, agent_id: str, properties: Optional[Dict[str, Any]]
+    ) -> list:
+        graph = self.graph
+        quads = [
+            (agent_uri, _RDF_TYPE, _BEAST_AGENT, graph),
+            (agent_uri, _RDFS_LABEL, Literal(agent_id), graph),
+        ]
+        if properties:
+            quads.extend(
+                (agent_uri, _beast_prop(key), Literal(value), graph)
+                for key, value in properties.items()
+            )
+        return quads
+
     def create_task(
         self,
         task_id: str,
@@ -204,15 +301,20 @@ class SemanticAlignmentLayer:
             URIRef: The task's URI reference
         """
         task_uri = BEAST[f"task/{task_id}"]
-        self.graph.add((task_uri, RDF.type, BEAST.Task))
-        self.graph.add((task_uri, RDFS.label, Literal(task_id)))
-        self.graph.add((agent_uri, BEAST.executesTask, task_uri))
-
+        graph = self.graph
+        quads = [
+            (task_uri, _RDF_TYPE, _BEAST_TASK, graph),
+            (task_uri, _RDFS_LABEL, Literal(task_id), graph),
+            (agent_uri, _BEAST_EXECUTES, task_uri, graph),
+        ]
         if properties:
-            for key, value in properties.items():
-                self.graph.add((task_uri, BEAST[key], Literal(value)))
+            quads.extend(
+                (task_uri, _beast_prop(key), Literal(value), graph)
+                for key, value in properties.items()
+            )
+        graph.addN(quads)
 
-        logging.debug(f"Created task entity: {task_id} for agent {agent_uri}")
+        logging.debug("Created task entity: %s for agent %s", task_id, agent_uri)
         return task_uri
 
     def create_validation(
@@ -235,16 +337,21 @@ class SemanticAlignmentLayer:
             URIRef: The validation's URI reference
         """
         validation_uri = BEAST[f"validation/{validation_id}"]
-        self.graph.add((validation_uri, RDF.type, BEAST.Validation))
-        self.graph.add((validation_uri, RDFS.label, Literal(validation_id)))
-        self.graph.add((task_uri, BEAST.hasValidation, validation_uri))
-        self.graph.add((validation_uri, BEAST.result, Literal(result)))
-
+        graph = self.graph
+        quads = [
+            (validation_uri, _RDF_TYPE, _BEAST_VALIDATION, graph),
+            (validation_uri, _RDFS_LABEL, Literal(validation_id), graph),
+            (task_uri, _BEAST_HAS_VAL, validation_uri, graph),
+            (validation_uri, _BEAST_RESULT, Literal(result), graph),
+        ]
         if properties:
-            for key, value in properties.items():
-                self.graph.add((validation_uri, BEAST[key], Literal(value)))
+            quads.extend(
+                (validation_uri, _beast_prop(key), Literal(value), graph)
+                for key, value in properties.items()
+            )
+        graph.addN(quads)
 
-        logging.debug(f"Created validation entity: {validation_id} for task {task_uri}")
+        logging.debug("Created validation entity: %s for task %s", validation_id, task_uri)
         return validation_uri
 
     def link_agent_to_monitor(self, agent_uri: URIRef, monitor_type: str) -> URIRef:
@@ -258,38 +365,43 @@ class SemanticAlignmentLayer:
         Returns:
             URIRef: The monitor's URI reference
         """
-        monitor_class_map = {
-            "prometheus": EUDORUS.PrometheusExporter,
-            "jaeger": EUDORUS.JaegerTracer,
-            "observatory": EUDORUS.ObservatoryConnector,
-        }
-
-        monitor_class = monitor_class_map.get(monitor_type.lower())
+        monitor_class = self._MONITOR_CLASSES.get(monitor_type.lower())
         if not monitor_class:
             raise ValueError(f"Unknown monitor type: {monitor_type}")
 
-        monitor_uri = EUDORUS[f"monitor/{monitor_type}/{agent_uri.split('/')[-1]}"]
-        self.graph.add((monitor_uri, RDF.type, monitor_class))
-        self.graph.add((agent_uri, BEAST.hasMonitor, monitor_uri))
+        agent_tail = agent_uri.rpartition("/")[2]
+        monitor_uri = EUDORUS[f"monitor/{monitor_type}/{agent_tail}"]
+        self.graph.add((monitor_uri, _RDF_TYPE, monitor_class))
+        self.graph.add((agent_uri, _BEAST_HAS_MONITOR, monitor_uri))
 
-        logging.debug(f"Linked agent {agent_uri} to {monitor_type} monitor")
+        logging.debug("Linked agent %s to %s monitor", agent_uri, monitor_type)
         return monitor_uri
 
-    def process_rdf_payload(self, rdf_content: str, format: str = "turtle") -> int:
+    def process_rdf_payload(
+        self, rdf_content: Union[str, bytes, IO[bytes]], format: str = "turtle"
+    ) -> int:
         """
         Process an RDF/Turtle payload and merge it into the knowledge graph.
 
+        Parsed as in load_ontology. Large payloads can be passed as a binary
+        file-like object, which the parser reads from directly instead of
+        holding the whole payload in memory as a string.
+
         Args:
-            rdf_content: RDF content as string
+            rdf_content: RDF content as string, bytes or binary stream
             format: RDF format (turtle, xml, n3, etc.)
 
         Returns:
             int: Number of triples added
         """
         initial_size = len(self.graph)
+        format = self._parser_formats.get(format, format)
 
         try:
-            self.graph.parse(data=rdf_content, format=format)
+            if isinstance(rdf_content, (str, bytes)):
+                self.graph.parse(data=rdf_content, format=format)
+            else:
+                self.graph.parse(source=rdf_content, format=format)
             triples_added = len(self.graph) - initial_size
             logging.info(f"Processed RDF payload: {triples_added} triples added")
             return triples_added
@@ -301,10 +413,12 @@ class SemanticAlignmentLayer:
         """
         Export the current knowledge graph as Turtle format.
 
+        Serialized by oxrdflib's Rust serializer for the oxigraph store.
+
         Returns:
             str: RDF graph serialized as Turtle
         """
-        return self.graph.serialize(format="turtle")
+        return self.graph.serialize(format=self._turtle_serializer)
 
     def query_agents(self) -> List[str]:
         """
@@ -313,19 +427,14 @@ class SemanticAlignmentLayer:
         Returns:
             List[str]: List of agent IDs
         """
-        query = """
-        SELECT ?agent ?label
-        WHERE {
-            ?agent rdf:type beast:Agent .
-            ?agent rdfs:label ?label .
-        }
-        """
-        results = self.graph.query(query)
-        agents = []
-        for row in results:
-            if hasattr(row, "label"):
-                agents.append(str(row.label))
-        return agents
+        # Both patterns are single index lookups, so the store is walked
+        # directly rather than through the SPARQL engine
+        graph = self.graph
+        return [
+            str(label)
+            for agent in graph.subjects(_RDF_TYPE, _BEAST_AGENT)
+            for label in graph.objects(agent, _RDFS_LABEL)
+        ]
 
     def query_agent_tasks(self, agent_id: str) -> List[str]:
         """
@@ -338,16 +447,133 @@ class SemanticAlignmentLayer:
             List[str]: List of task IDs
         """
         agent_uri = BEAST[f"agent/{agent_id}"]
-        query = f"""
-        SELECT ?task ?label
-        WHERE {{
-            <{agent_uri}> beast:executesTask ?task .
-            ?task rdfs:label ?label .
-        }}
+        graph = self.graph
+        return [
+            str(label)
+            for task in graph.objects(agent_uri, _BEAST_EXECUTES)
+            for label in graph.objects(task, _RDFS_LABEL)
+        ]
+
+
+class _TripleIndex:
+    """
+    In-memory triple set indexed by subject and by predicate/object.
+
+    Implements the part of the rdflib Graph API that SemanticAlignmentLayer
+    uses. Parsing and serialization go through a temporary rdflib Graph.
+    """
+
+    def __init__(self):
+        self._spo: Dict[Any, Dict[Any, set]] = {}
+        self._pos: Dict[Any, Dict[Any, set]] = {}
+        self._len = 0
+        self._namespaces: Dict[str, Any] = {}
+
+    def bind(self, prefix: str, namespace):
+        self._namespaces[prefix] = URIRef(str(namespace))
+
+    def namespaces(self):
+        return iter(self._namespaces.items())
+
+    def add(self, triple):
+        s, p, o = triple
+        objects = self._spo.setdefault(s, {}).setdefault(p, set())
+        if o not in objects:
+            objects.add(o)
+            self._pos.setdefault(p, {}).setdefault(o, set()).add(s)
+            self._len += 1
+
+    def addN(self, quads):
+        for s, p, o, _ in quads:
+            self.add((s, p, o))
+
+    def triples(self, pattern):
+        s, p, o = pattern
+        if s is not None:
+            by_predicate = self._spo.get(s, {})
+            predicates = [p] if p is not None else list(by_predicate)
+            for predicate in predicates:
+                for obj in by_predicate.get(predicate, ()):
+                    if o is None or obj == o:
+                        yield s, predicate, obj
+        elif p is not None:
+            by_object = self._pos.get(p, {})
+            objects = [o] if o is not None else list(by_object)
+            for obj in objects:
+                for subject in by_object.get(obj, ()):
+                    yield subject, p, obj
+        else:
+            for subject, by_predicate in self._spo.items():
+                for predicate, objects in by_predicate.items():
+                    for obj in objects:
+                        if o is None or obj == o:
+                            yield subject, predicate, obj
+
+    def subjects(self, predicate, object):
+        return iter(list(self._pos.get(predicate, {}).get(object, ())))
+
+    def objects(self, subject, predicate):
+        return iter(list(self._spo.get(subject, {}).get(predicate, ())))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return self.triples((None, None, None))
+
+    def __contains__(self, triple) -> bool:
+        return next(self.triples(triple), None) is not None
+
+    def parse(self, source=None, format: Optional[str] = None, data=None):
+        graph = Graph()
+        graph.parse(source=source, format=format, data=data)
+        for prefix, namespace in graph.namespaces():
+            self._namespaces.setdefault(prefix, namespace)
+        for triple in graph:
+            self.add(triple)
+        return self
+
+    def serialize(self, destination=None, format: str = "turtle"):
+        return self.to_graph().serialize(destination=destination, format=format)
+
+    def to_graph(self) -> Graph:
+        graph = Graph()
+        for prefix, namespace in self._namespaces.items():
+            graph.bind(prefix, namespace)
+        graph.addN((s, p, o, graph) for s, p, o in self)
+        return graph
+
+
+class FastAlignmentLayer(SemanticAlignmentLayer):
+    """
+    SemanticAlignmentLayer backed by plain dict indexes instead of an rdflib Graph.
+
+    For workloads that only create entities and list agents and tasks,
+    this skips rdflib's store and context handling. Loading, payload
+    processing and export still parse or serialize through rdflib.
+    self.graph supports only the operations the layer itself uses; call
+    to_rdflib_graph() for anything else, such as SPARQL.
+    """
+
+    def __init__(self, ontology_path: Optional[str] = None):
+        """
+        Initialize the fast alignment layer.
+
+        Args:
+            ontology_path: Optional path to load existing ontology
+        """
+        self.graph = _TripleIndex()
+        self._initialize_namespaces()
+        self._define_core_classes()
+
+        if ontology_path:
+            self.load_ontology(ontology_path)
+
+    def to_rdflib_graph(self) -> Graph:
+        """
+        Copy the knowledge graph into a new rdflib Graph.
+
+        Returns:
+            Graph: Graph holding every triple and namespace binding
         """
-        results = self.graph.query(query)
-        tasks = []
-        for row in results:
-            if hasattr(row, "label"):
-                tasks.append(str(row.label))
-        return tasks
+        return self.graph.to_graph()
@@ -5,11 +5,15 @@ and, if LangChain is available, defers to an injected LLM chain for scoring.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
-from typing import Callable, Iterable, List
+from typing import Callable, Iterable, Iterator, List, Union
 
 
 class AuditFinding:
+    __slots__ = ("message", "severity")
+
     def __init__(self, message: str, severity: str = "info"):
         self.message = message
         self.severity = severity
@@ -18,39 +22,171 @@ class AuditFinding:
         return f"AuditFinding(severity={self.severity}, message={self.message})"
 
 
+# Items longer than this many characters are flagged
+_LONG_ITEM_THRESHOLD = 500
+
+# Upper bound on concurrent LLM requests when a chain supports batching
+AUDIT_MAX_CONCURRENCY = 16
+
+# Items, or a zero-argument callable producing them only once the audit is enabled
+AuditItems = Union[Iterable[str], Callable[[], Iterable[str]]]
+
+
 def run_heuristic_audit(
-    items: Iterable[str],
+    items: AuditItems,
     llm_chain_factory: Callable[[], object] | None = None,
     enabled_env: str = "HEURISTIC_AUDIT",
 ) -> List[AuditFinding]:
-    """Run heuristic audit; if LangChain is present and enabled, use it to score items."""
-    if os.environ.get(enabled_env, "0") != "1":
+    """Run heuristic audit; if LangChain is present and enabled, use it to score items.
+
+    Collects the findings of iter_heuristic_audit, which takes the same arguments.
+    """
+    return list(iter_heuristic_audit(items, llm_chain_factory, enabled_env))
+
+
+def iter_heuristic_audit(
+    items: AuditItems,
+    llm_chain_factory: Callable[[], object] | None = None,
+    enabled_env: str = "HEURISTIC_AUDIT",
+) -> Iterator[AuditFinding]:
+    """Yield audit findings as they are found, before later items are scored.
+
+    Chains with a LangChain ``batch`` method score all items concurrently,
+    after the heuristic findings; other chains are invoked once per item.
+
+    ``items`` may be a callable returning the items, so that callers whose
+    items are costly to collect skip that work while the audit is disabled.
+    """
+    if not _audit_enabled(enabled_env):
+        return
+    if callable(items):
+        items = items()
+
+    chain = _make_chain(llm_chain_factory)
+    if chain is None:
+        yield from _heuristic_findings(items)
+        return
+
+    if hasattr(chain, "batch"):
+        items = list(items)
+        yield from _heuristic_findings(items)
+        try:
+            results = chain.batch(  # type: ignore[attr-defined]
+                items,
+                config={"max_concurrency": AUDIT_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+        except Exception:
+            # If LangChain path fails, stay silent to avoid test fragility.
+            results = []
+        yield from _llm_notes(results)
+        return
+
+    # One pass over items, so generators are audited by the LLM as well
+    for idx, item in enumerate(items):
+        yield from _heuristic_findings((item,), start=idx)
+
+        if chain is not None:
+            try:
+                # Expect chain to provide a simple invoke method
+                result = chain.invoke(item)  # type: ignore[call-arg]
+            except Exception:
+                # Stop consulting the LLM after a failure, as before.
+                chain = None
+                continue
+            yield from _llm_notes([result], start=idx)
+
+
+async def run_heuristic_audit_async(
+    items: AuditItems,
+    llm_chain_factory: Callable[[], object] | None = None,
+    enabled_env: str = "HEURISTIC_AUDIT",
+) -> List[AuditFinding]:
+    """Async run_heuristic_audit; scores items concurrently with the chain's ``abatch``.
+
+    Chains without ``abatch`` are awaited once per item through ``ainvoke``,
+    or through ``invoke`` on a worker thread, as iter_heuristic_audit does.
+    """
+    if not _audit_enabled(enabled_env):
         return []
+    if callable(items):
+        items = items()
 
     findings: list[AuditFinding] = []
-    # Basic heuristics: flag empty entries and long entries as potential issues.
-    for idx, item in enumerate(items):
-        if not item or not item.strip():
-            findings.append(AuditFinding(f"Item {idx} is empty", "warning"))
-        if len(item) > 500:
-            findings.append(AuditFinding(f"Item {idx} is very long", "info"))
+    chain = _make_chain(llm_chain_factory)
+
+    items = list(items)
+    findings.extend(_heuristic_findings(items))
 
-    # Optional LangChain path
-    if llm_chain_factory:
+    if chain is None:
+        return findings
+
+    if hasattr(chain, "abatch"):
         try:
-            chain = llm_chain_factory()
-            # Expect chain to provide a simple invoke method
-            for idx, item in enumerate(items):
-                result = chain.invoke(item)  # type: ignore[call-arg]
-                if isinstance(result, str) and result.strip():
-                    findings.append(AuditFinding(f"LLM note for item {idx}: {result}", "info"))
+            results = await chain.abatch(  # type: ignore[attr-defined]
+                items,
+                config={"max_concurrency": AUDIT_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
         except Exception:
             # If LangChain path fails, stay silent to avoid test fragility.
-            pass
+            results = []
+        findings.extend(_llm_notes(results))
+        return findings
+
+    for idx, item in enumerate(items):
+        try:
+            if hasattr(chain, "ainvoke"):
+                result = await chain.ainvoke(item)  # type: ignore[attr-defined]
+            else:
+                result = await asyncio.to_thread(chain.invoke, item)  # type: ignore[attr-defined]
+        except Exception:
+            # Stop consulting the LLM after a failure, as the sync path does.
+            break
+        findings.extend(_llm_notes([result], start=idx))
 
     return findings
 
 
+@functools.cache
+def _audit_enabled(enabled_env: str) -> bool:
+    # Read once per flag name; call reset_audit_cache() after changing it
+    return os.environ.get(enabled_env, "0") == "1"
+
+
+def reset_audit_cache() -> None:
+    """Re-read the audit enable flags from the environment on the next audit."""
+    _audit_enabled.cache_clear()
+
+
+def _make_chain(llm_chain_factory: Callable[[], object] | None) -> object | None:
+    if not llm_chain_factory:
+        return None
+    try:
+        return llm_chain_factory()
+    except Exception:
+        # If LangChain path fails, stay silent to avoid test fragility.
+        return None
+
+
+def _heuristic_findings(items: Iterable[str], start: int = 0) -> Iterator[AuditFinding]:
+    # Basic heuristics: flag empty entries and long entries as potential issues.
+    # isspace() matches "not item.strip()" without copying the item.
+    long_threshold = _LONG_ITEM_THRESHOLD
+    for idx, item in enumerate(items, start):
+        if not item or item.isspace():
+            yield AuditFinding(f"Item {idx} is empty", "warning")
+        if len(item) > long_threshold:
+            yield AuditFinding(f"Item {idx} is very long", "info")
+
+
+def _llm_notes(results: Iterable[object], start: int = 0) -> Iterator[AuditFinding]:
+    # Failed items come back as exceptions from batch calls and are skipped
+    for idx, result in enumerate(results, start):
+        if isinstance(result, str) and result.strip():
+            yield AuditFinding(f"LLM note for item {idx}: {result}", "info")
+
+
 def default_langchain_chain():
     """Provide a minimal LangChain LLM chain if installed; otherwise raise ImportError."""
     from langchain_core.prompts import ChatPromptTemplate
@@ -4,9 +4,13 @@ Implements Requirements 5.1-5.6, 6.1-6.4, 8.1, 9.3, 13.1
 """
 
 import random
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Iterable
+
+# Shared generator for skill rolls when the caller does not supply one
+_RNG = random.Random()
 
 
 class EffectType(Enum):
@@ -25,7 +29,57 @@ class EffectType(Enum):
     QUEUE_FOLLOWUP = "queue_followup"
 
 
-@dataclass
+def _has_item(prereq: "Prerequisite", game_state) -> bool:
+    return game_state.has_item(prereq.target, prereq.value or 1)
+
+
+def _min_resource(prereq: "Prerequisite", game_state) -> bool:
+    return getattr(game_state, prereq.target, 0) >= (prereq.value or 0)
+
+
+def _flag_set(prereq: "Prerequisite", game_state) -> bool:
+    return game_state.flags.get(prereq.target, False)
+
+
+def _skill_check(prereq: "Prerequisite", game_state) -> bool:
+    return game_state.party_skill_max.get(prereq.target, 0) >= (prereq.value or 0)
+
+
+def _always_met(prereq: "Prerequisite", game_state) -> bool:
+    return True
+
+
+def _has_item_reason(prereq: "Prerequisite") -> str:
+    return f"Requires: {prereq.target} x{prereq.value or 1}"
+
+
+def _min_resource_reason(prereq: "Prerequisite") -> str:
+    return f"Requires: {prereq.target} >= {prereq.value}"
+
+
+def _flag_set_reason(prereq: "Prerequisite") -> str:
+    return f"Requires: {prereq.target}"
+
+
+def _skill_check_reason(prereq: "Prerequisite") -> str:
+    return f"Requires: {prereq.target} skill >= {prereq.value}"
+
+
+def _default_reason(prereq: "Prerequisite") -> str:
+    return "Requirements not met"
+
+
+# Prerequisite type -> (check, lock reason); unknown types are always met
+_PREREQ_DISPATCH: dict[str, tuple[Callable, Callable]] = {
+    "has_item": (_has_item, _has_item_reason),
+    "min_resource": (_min_resource, _min_resource_reason),
+    "flag_set": (_flag_set, _flag_set_reason),
+    "skill_check": (_skill_check, _skill_check_reason),
+}
+_NO_PREREQ = (_always_met, _default_reason)
+
+
+@dataclass(slots=True)
 class Prerequisite:
     """Requirement for a choice to be available"""
 
@@ -33,32 +87,78 @@ class Prerequisite:
     target: str | None = None
     value: int | None = None
 
+    def __post_init__(self):
+        # Targets come from a small vocabulary and key flag/attribute lookups
+        if isinstance(self.target, str):
+            self.target = sys.intern(self.target)
+
     def is_met(self, game_state) -> bool:
-        if self.type == "has_item":
-            return game_state.has_item(self.target, self.value or 1)
-        elif self.type == "min_resource":
-            return getattr(game_state, self.target, 0) >= (self.value or 0)
-        elif self.type == "flag_set":
-            return game_state.flags.get(self.target, False)
-        elif self.type == "skill_check":
-            return any(
-                getattr(m, f"skill_{self.target}", 0) >= (self.value or 0) for m in game_state.party
-            )
-        return True
+        return _PREREQ_DISPATCH.get(self.type, _NO_PREREQ)[0](self, game_state)
 
     def get_reason(self) -> str:
-        if self.type == "has_item":
-            return f"Requires: {self.target} x{self.value or 1}"
-        elif self.type == "min_resource":
-            return f"Requires: {self.target} >= {self.value}"
-        elif self.type == "flag_set":
-            return f"Requires: {self.target}"
-        elif self.type == "skill_check":
-            return f"Requires: {self.target} skill >= {self.value}"
-        return "Requirements not met"
-
-
-@dataclass
+        return _PREREQ_DISPATCH.get(self.type, _NO_PREREQ)[1](self)
+
+
+def _add_item(effect: "Effect", game_state) -> bool:
+    game_state.add_item(effect.target, effect.value or 1)
+    return True
+
+
+def _remove_item(effect: "Effect", game_state) -> bool:
+    return game_state.remove_item(effect.target, effect.value or 1)
+
+
+def _modify_resource(effect: "Effect", game_state) -> bool:
+    game_state.modify_resource(effect.target, effect.value or 0)
+    return True
+
+
+def _set_flag(effect: "Effect", game_state) -> bool:
+    game_state.set_flag(effect.target)
+    return True
+
+
+def _clear_flag(effect: "Effect", game_state) -> bool:
+    game_state.clear_flag(effect.target)
+    return True
+
+
+def _damage_wagon(effect: "Effect", game_state) -> bool:
+    game_state.wagon_health = max(0, game_state.wagon_health - (effect.value or 10))
+    game_state.version += 1
+    return True
+
+
+def _repair_wagon(effect: "Effect", game_state) -> bool:
+    game_state.wagon_health = min(100, game_state.wagon_health + (effect.value or 10))
+    game_state.version += 1
+    return True
+
+
+def _log_journal(effect: "Effect", game_state) -> bool:
+    if effect.target:
+        game_state.run_history_summary.append(effect.target)
+    return True
+
+
+def _no_effect(effect: "Effect", game_state) -> bool:
+    return True
+
+
+# Operation -> handler; whitelisted operations without one are no-ops
+_EFFECT_HANDLERS: dict[EffectType, Callable] = {
+    EffectType.ADD_ITEM: _add_item,
+    EffectType.REMOVE_ITEM: _remove_item,
+    EffectType.MODIFY_RESOURCE: _modify_resource,
+    EffectType.SET_FLAG: _set_flag,
+    EffectType.CLEAR_FLAG: _clear_flag,
+    EffectType.DAMAGE_WAGON: _damage_wagon,
+    EffectType.REPAIR_WAGON: _repair_wagon,
+    EffectType.LOG_JOURNAL: _log_journal,
+}
+
+
+@dataclass(slots=True)
 class Effect:
     """State mutation effect"""
 
@@ -66,32 +166,19 @@ class Effect:
     target: str | None = None
     value: Any | None = None
 
+    def __post_init__(self):
+        if isinstance(self.target, str):
+            self.target = sys.intern(self.target)
+
     def apply(self, game_state) -> bool:
         try:
-            if self.operation == EffectType.ADD_ITEM:
-                game_state.add_item(self.target, self.value or 1)
-            elif self.operation == EffectType.REMOVE_ITEM:
-                return game_state.remove_item(self.target, self.value or 1)
-            elif self.operation == EffectType.MODIFY_RESOURCE:
-                game_state.modify_resource(self.target, self.value or 0)
-            elif self.operation == EffectType.SET_FLAG:
-                game_state.flags[self.target] = True
-            elif self.operation == EffectType.CLEAR_FLAG:
-                game_state.flags.pop(self.target, None)
-            elif self.operation == EffectType.DAMAGE_WAGON:
-                game_state.wagon_health = max(0, game_state.wagon_health - (self.value or 10))
-            elif self.operation == EffectType.REPAIR_WAGON:
-                game_state.wagon_health = min(100, game_state.wagon_health + (self.value or 10))
-            elif self.operation == EffectType.LOG_JOURNAL:
-                if self.target:
-                    game_state.run_history_summary.append(self.target)
-            return True
+            return _EFFECT_HANDLERS.get(self.operation, _no_effect)(self, game_state)
         except Exception as e:
             print(f"Effect application failed: {e}")
             return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Choice:
     """Player choice option"""
 
@@ -100,16 +187,32 @@ class Choice:
     prerequisites: list[Prerequisite] = field(default_factory=list)
 
     def is_available(self, game_state) -> bool:
-        return all(p.is_met(game_state) for p in self.prerequisites)
+        # The UI asks every frame while the state is unchanged, so results are
+        # cached on the state until its cache_key() changes
+        cache = getattr(game_state, "availability_cache", None)
+        if cache is None:
+            return all(p.is_met(game_state) for p in self.prerequisites)
+        key = game_state.cache_key()
+        if game_state.availability_key != key:
+            cache.clear()
+            game_state.availability_key = key
+        cached = cache.get(id(self))
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        available = all(p.is_met(game_state) for p in self.prerequisites)
+        cache[id(self)] = (self, available)
+        return available
 
     def get_lock_reason(self, game_state) -> str | None:
+        if self.is_available(game_state):
+            return None
         for p in self.prerequisites:
             if not p.is_met(game_state):
                 return p.get_reason()
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Outcome:
     """Result of a choice"""
 
@@ -120,7 +223,7 @@ class Outcome:
     failure_text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDraft:
     """LLM-generated event draft"""
 
@@ -163,20 +266,49 @@ class EventDraft:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class EventResolution:
     """Resolution of a choice"""
 
     choice_id: str
     outcome: Outcome
 
-    def apply(self, game_state, rng_seed: int | None = None) -> str:
-        if self.outcome.success_required:
-            skill = self.outcome.success_required.get("skill")
-            dc = self.outcome.success_required.get("dc", 10)
-
-            rng = random.Random(rng_seed) if rng_seed else random
-            party_skill = max(getattr(m, f"skill_{skill}", 0) for m in game_state.party)
+    def __post_init__(self):
+        if isinstance(self.choice_id, str):
+            self.choice_id = sys.intern(self.choice_id)
+
+    def apply(self, game_state, rng: random.Random | None = None) -> str:
+        """
+        Apply the outcome to game_state and return the narrative text.
+
+        Skill rolls draw from rng; pass a seeded random.Random for a
+        deterministic replay. None uses the module's shared generator.
+        """
+        return self._apply(game_state, self._success_check(), rng or _RNG)
+
+    def apply_batch(self, game_states: Iterable, rng: random.Random | None = None) -> list[str]:
+        """
+        Apply the resolution to many game states, e.g. for balance sweeps.
+
+        The skill check is prepared once and every roll draws from the same
+        generator, so the results match calling apply on each state in turn
+        with that generator.
+        """
+        check = self._success_check()
+        rng = rng or _RNG
+        return [self._apply(game_state, check, rng) for game_state in game_states]
+
+    def _success_check(self) -> tuple[str, int] | None:
+        """(skill name, DC) when the outcome needs a skill roll."""
+        if not self.outcome.success_required:
+            return None
+        required = self.outcome.success_required
+        return required.get("skill"), required.get("dc", 10)
+
+    def _apply(self, game_state, check: tuple[str, int] | None, rng: random.Random) -> str:
+        if check is not None:
+            skill, dc = check
+            party_skill = game_state.party_skill_max.get(skill, 0)
             roll = rng.randint(1, 20)
             success = (roll + party_skill) >= dc
 
@@ -191,186 +323,194 @@ class EventResolution:
         return result_text or "The journey continues..."
 
 
-class FallbackDeck:
-    """Local deterministic event deck"""
-
-    def __init__(self):
-        self.events = self._create_fallback_events()
-        self.resolutions = self._create_resolutions()
-
-    def _create_fallback_events(self) -> list[EventDraft]:
-        return [
-            EventDraft(
-                event_id="fallback_river_crossing",
-                title="River Crossing",
-                narrative="You reach a shallow river. The water is cold but the current is gentle.",
-                choices=[
-                    Choice(id="ford", text="Ford the river carefully"),
-                    Choice(
-                        id="use_rope",
-                        text="Use rope to secure the wagon",
-                        prerequisites=[Prerequisite(type="has_item", target="itm_rope", value=1)],
-                    ),
-                ],
-            ),
-            EventDraft(
-                event_id="fallback_hunting",
-                title="Wildlife Spotted",
-                narrative="Deer tracks cross your path. A hunting party could gather fresh meat.",
-                choices=[
-                    Choice(
-                        id="hunt",
-                        text="Hunt for food",
-                        prerequisites=[Prerequisite(type="has_item", target="itm_rifle", value=1)],
-                    ),
-                    Choice(id="continue", text="Continue on the trail"),
-                ],
-            ),
-            EventDraft(
-                event_id="fallback_trader",
-                title="Traveling Trader",
-                narrative="A lone trader offers to sell supplies. His prices are fair.",
-                choices=[
-                    Choice(
-                        id="buy_food",
-                        text="Buy food (20 coins)",
-                        prerequisites=[Prerequisite(type="min_resource", target="money", value=20)],
-                    ),
-                    Choice(
-                        id="buy_medicine",
-                        text="Buy medicine (30 coins)",
-                        prerequisites=[Prerequisite(type="min_resource", target="money", value=30)],
-                    ),
-                    Choice(id="decline", text="Decline and move on"),
-                ],
-            ),
-            EventDraft(
-                event_id="fallback_rest",
-                title="Rest Stop",
-                narrative="The party is weary. A day of rest might improve morale.",
-                choices=[
-                    Choice(id="rest", text="Rest for a day"),
-                    Choice(id="push_on", text="Push on despite fatigue"),
-                ],
-            ),
-            EventDraft(
-                event_id="fallback_weather",
-                title="Storm Clouds",
-                narrative="Dark clouds gather on the horizon. A storm is approaching.",
-                choices=[
-                    Choice(id="seek_shelter", text="Seek shelter and wait it out"),
-                    Choice(id="continue_travel", text="Continue traveling through the storm"),
-                ],
-            ),
-        ]
-
-    def _create_resolutions(self) -> dict[str, dict[str, EventResolution]]:
-        return {
-            "fallback_river_crossing": {
-                "ford": EventResolution(
-                    choice_id="ford",
-                    outcome=Outcome(
-                        text="You ford the river safely. The wagon gets wet but no damage is done.",
-                        effects=[Effect(EffectType.MODIFY_RESOURCE, "water", 10)],
-                    ),
+def _create_fallback_events() -> list[EventDraft]:
+    return [
+        EventDraft(
+            event_id="fallback_river_crossing",
+            title="River Crossing",
+            narrative="You reach a shallow river. The water is cold but the current is gentle.",
+            choices=[
+                Choice(id="ford", text="Ford the river carefully"),
+                Choice(
+                    id="use_rope",
+                    text="Use rope to secure the wagon",
+                    prerequisites=[Prerequisite(type="has_item", target="itm_rope", value=1)],
+                ),
+            ],
+        ),
+        EventDraft(
+            event_id="fallback_hunting",
+            title="Wildlife Spotted",
+            narrative="Deer tracks cross your path. A hunting party could gather fresh meat.",
+            choices=[
+                Choice(
+                    id="hunt",
+                    text="Hunt for food",
+                    prerequisites=[Prerequisite(type="has_item", target="itm_rifle", value=1)],
+                ),
+                Choice(id="continue", text="Continue on the trail"),
+            ],
+        ),
+        EventDraft(
+            event_id="fallback_trader",
+            title="Traveling Trader",
+            narrative="A lone trader offers to sell supplies. His prices are fair.",
+            choices=[
+                Choice(
+                    id="buy_food",
+                    text="Buy food (20 coins)",
+                    prerequisites=[Prerequisite(type="min_resource", target="money", value=20)],
+                ),
+                Choice(
+                    id="buy_medicine",
+                    text="Buy medicine (30 coins)",
+                    prerequisites=[Prerequisite(type="min_resource", target="money", value=30)],
                 ),
-                "use_rope": EventResolution(
-                    choice_id="use_rope",
-                    outcome=Outcome(
-                        text="Using the rope, you secure the wagon and cross without incident.",
-                        effects=[
-                            Effect(EffectType.REMOVE_ITEM, "itm_rope", 1),
-                            Effect(EffectType.MODIFY_RESOURCE, "water", 15),
-                        ],
-                    ),
+                Choice(id="decline", text="Decline and move on"),
+            ],
+        ),
+        EventDraft(
+            event_id="fallback_rest",
+            title="Rest Stop",
+            narrative="The party is weary. A day of rest might improve morale.",
+            choices=[
+                Choice(id="rest", text="Rest for a day"),
+                Choice(id="push_on", text="Push on despite fatigue"),
+            ],
+        ),
+        EventDraft(
+            event_id="fallback_weather",
+            title="Storm Clouds",
+            narrative="Dark clouds gather on the horizon. A storm is approaching.",
+            choices=[
+                Choice(id="seek_shelter", text="Seek shelter and wait it out"),
+                Choice(id="continue_travel", text="Continue traveling through the storm"),
+            ],
+        ),
+    ]
+
+
+def _create_resolutions() -> dict[str, dict[str, EventResolution]]:
+    return {
+        "fallback_river_crossing": {
+            "ford": EventResolution(
+                choice_id="ford",
+                outcome=Outcome(
+                    text="You ford the river safely. The wagon gets wet but no damage is done.",
+                    effects=[Effect(EffectType.MODIFY_RESOURCE, "water", 10)],
                 ),
-            },
-            "fallback_hunting": {
-                "hunt": EventResolution(
-                    choice_id="hunt",
-                    outcome=Outcome(
-                        text="",
-                        success_required={"skill": "hunter", "dc": 12},
-                        success_text="Your hunters bring down a deer! Fresh meat for the party.",
-                        failure_text="The hunting party returns empty-handed.",
-                        effects=[
-                            Effect(EffectType.MODIFY_RESOURCE, "ammo", -3),
-                            Effect(EffectType.MODIFY_RESOURCE, "food", 40),
-                        ],
-                    ),
+            ),
+            "use_rope": EventResolution(
+                choice_id="use_rope",
+                outcome=Outcome(
+                    text="Using the rope, you secure the wagon and cross without incident.",
+                    effects=[
+                        Effect(EffectType.REMOVE_ITEM, "itm_rope", 1),
+                        Effect(EffectType.MODIFY_RESOURCE, "water", 15),
+                    ],
                 ),
-                "continue": EventResolution(
-                    choice_id="continue",
-                    outcome=Outcome(
-                        text="You continue down the trail, leaving the wildlife undisturbed.",
-                        effects=[],
-                    ),
+            ),
+        },
+        "fallback_hunting": {
+            "hunt": EventResolution(
+                choice_id="hunt",
+                outcome=Outcome(
+                    text="",
+                    success_required={"skill": "hunter", "dc": 12},
+                    success_text="Your hunters bring down a deer! Fresh meat for the party.",
+                    failure_text="The hunting party returns empty-handed.",
+                    effects=[
+                        Effect(EffectType.MODIFY_RESOURCE, "ammo", -3),
+                        Effect(EffectType.MODIFY_RESOURCE, "food", 40),
+                    ],
                 ),
-            },
-            "fallback_trader": {
-                "buy_food": EventResolution(
-                    choice_id="buy_food",
-                    outcome=Outcome(
-                        text="You purchase food supplies from the trader.",
-                        effects=[
-                            Effect(EffectType.MODIFY_RESOURCE, "money", -20),
-                            Effect(EffectType.MODIFY_RESOURCE, "food", 50),
-                        ],
-                    ),
+            ),
+            "continue": EventResolution(
+                choice_id="continue",
+                outcome=Outcome(
+                    text="You continue down the trail, leaving the wildlife undisturbed.",
+                    effects=[],
+                ),
+            ),
+        },
+        "fallback_trader": {
+            "buy_food": EventResolution(
+                choice_id="buy_food",
+                outcome=Outcome(
+                    text="You purchase food supplies from the trader.",
+                    effects=[
+                        Effect(EffectType.MODIFY_RESOURCE, "money", -20),
+                        Effect(EffectType.MODIFY_RESOURCE, "food", 50),
+                    ],
                 ),
-                "buy_medicine": EventResolution(
-                    choice_id="buy_medicine",
-                    outcome=Outcome(
-                        text="You purchase medicine from the trader.",
-                        effects=[
-                            Effect(EffectType.MODIFY_RESOURCE, "money", -30),
-                            Effect(EffectType.ADD_ITEM, "itm_medicine", 2),
-                        ],
-                    ),
+            ),
+            "buy_medicine": EventResolution(
+                choice_id="buy_medicine",
+                outcome=Outcome(
+                    text="You purchase medicine from the trader.",
+                    effects=[
+                        Effect(EffectType.MODIFY_RESOURCE, "money", -30),
+                        Effect(EffectType.ADD_ITEM, "itm_medicine", 2),
+                    ],
                 ),
-                "decline": EventResolution(
-                    choice_id="decline",
-                    outcome=Outcome(
-                        text="You thank the trader and continue on your way.", effects=[]
-                    ),
+            ),
+            "decline": EventResolution(
+                choice_id="decline",
+                outcome=Outcome(
+                    text="You thank the trader and continue on your way.", effects=[]
                 ),
-            },
-            "fallback_rest": {
-                "rest": EventResolution(
-                    choice_id="rest",
-                    outcome=Outcome(
-                        text="The party rests and recovers. Morale improves.",
-                        effects=[
-                            Effect(EffectType.MODIFY_RESOURCE, "food", -8),
-                            Effect(EffectType.LOG_JOURNAL, "Took a rest day to recover."),
-                        ],
-                    ),
+            ),
+        },
+        "fallback_rest": {
+            "rest": EventResolution(
+                choice_id="rest",
+                outcome=Outcome(
+                    text="The party rests and recovers. Morale improves.",
+                    effects=[
+                        Effect(EffectType.MODIFY_RESOURCE, "food", -8),
+                        Effect(EffectType.LOG_JOURNAL, "Took a rest day to recover."),
+                    ],
                 ),
-                "push_on": EventResolution(
-                    choice_id="push_on",
-                    outcome=Outcome(
-                        text="You push the party onward. They're tired but making progress.",
-                        effects=[],
-                    ),
+            ),
+            "push_on": EventResolution(
+                choice_id="push_on",
+                outcome=Outcome(
+                    text="You push the party onward. They're tired but making progress.",
+                    effects=[],
                 ),
-            },
-            "fallback_weather": {
-                "seek_shelter": EventResolution(
-                    choice_id="seek_shelter",
-                    outcome=Outcome(
-                        text="You find shelter and wait out the storm. No damage to the wagon.",
-                        effects=[Effect(EffectType.MODIFY_RESOURCE, "food", -4)],
-                    ),
+            ),
+        },
+        "fallback_weather": {
+            "seek_shelter": EventResolution(
+                choice_id="seek_shelter",
+                outcome=Outcome(
+                    text="You find shelter and wait out the storm. No damage to the wagon.",
+                    effects=[Effect(EffectType.MODIFY_RESOURCE, "food", -4)],
                 ),
-                "continue_travel": EventResolution(
-                    choice_id="continue_travel",
-                    outcome=Outcome(
-                        text="You travel through the storm. The wagon takes minor damage.",
-                        effects=[Effect(EffectType.DAMAGE_WAGON, None, 15)],
-                    ),
+            ),
+            "continue_travel": EventResolution(
+                choice_id="continue_travel",
+                outcome=Outcome(
+                    text="You travel through the storm. The wagon takes minor damage.",
+                    effects=[Effect(EffectType.DAMAGE_WAGON, None, 15)],
                 ),
-            },
-        }
+            ),
+        },
+    }
+
+
+# Built once at import; decks only read them
+_FALLBACK_EVENTS: tuple[EventDraft, ...] = tuple(_create_fallback_events())
+_FALLBACK_RESOLUTIONS: dict[str, dict[str, EventResolution]] = _create_resolutions()
+
+
+class FallbackDeck:
+    """Local deterministic event deck"""
+
+    def __init__(self):
+        # Every deck shares the same prebuilt, read-only events and resolutions
+        self.events = _FALLBACK_EVENTS
+        self.resolutions = _FALLBACK_RESOLUTIONS
 
     def get_random_event(self, game_state) -> EventDraft:
         return random.choice(self.events)
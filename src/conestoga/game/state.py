@@ -21,6 +21,9 @@ class WeatherType(Enum):
     SNOW = "snow"
 
 
+KNOWN_SKILLS = ("hunter", "guide", "doctor")
+
+
 @dataclass
 class PartyMember:
     """A member of the traveling party"""
@@ -88,6 +91,19 @@ class GameState:
     run_history_summary: list[str] = field(default_factory=list)
     is_game_over: bool = False
     victory: bool = False
+    # Bumped by every mutation made through these methods and event effects, so
+    # caches of state-derived values (e.g. choice availability) can key on it.
+    # Mutate through the methods (or bump version after a direct write);
+    # cache_key() also catches the common direct writes, see there.
+    version: int = field(default=0, repr=False, compare=False)
+    # id(choice) -> (choice, available) as of availability_key; kept by
+    # Choice.is_available and cleared once cache_key() changes
+    availability_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    availability_key: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    # Best party member's level per skill, read by every skill check and roll
+    party_skill_max: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not self.party:
@@ -104,6 +120,43 @@ class GameState:
                 "itm_blanket": 4,
                 "itm_spare_clothes": 4,
             }
+        self.refresh_party_skills()
+
+    def refresh_party_skills(self):
+        """Recompute party_skill_max; call after changing the party or a member's skills."""
+        self.party_skill_max = {
+            name: max((getattr(m, f"skill_{name}", 0) for m in self.party), default=0)
+            for name in KNOWN_SKILLS
+        }
+        self.version += 1
+
+    def cache_key(self) -> tuple:
+        """
+        Key for caches of state-derived values.
+
+        Besides version it covers the resources and the number of flags and
+        items, so direct writes such as state.money = 0 or
+        state.flags["x"] = True still invalidate. Changing an existing flag
+        or item count directly is not seen; use the methods for those.
+        """
+        return (
+            self.version,
+            len(self.flags),
+            len(self.inventory),
+            self.food,
+            self.water,
+            self.ammo,
+            self.money,
+            self.wagon_health,
+        )
+
+    def set_flag(self, flag: str):
+        self.flags[flag] = True
+        self.version += 1
+
+    def clear_flag(self, flag: str):
+        self.flags.pop(flag, None)
+        self.version += 1
 
     def has_item(self, item_id: str, quantity: int = 1) -> bool:
         return self.inventory.get(item_id, 0) >= quantity
@@ -112,6 +165,7 @@ class GameState:
         if quantity < 0:
             raise ValueError("Cannot add negative quantity")
         self.inventory[item_id] = self.inventory.get(item_id, 0) + quantity
+        self.version += 1
 
     def remove_item(self, item_id: str, quantity: int = 1) -> bool:
         if quantity < 0:
@@ -121,6 +175,7 @@ class GameState:
         self.inventory[item_id] -= quantity
         if self.inventory[item_id] <= 0:
             del self.inventory[item_id]
+        self.version += 1
         return True
 
     def modify_resource(self, resource: str, delta: int):
@@ -130,10 +185,12 @@ class GameState:
         current = getattr(self, resource, 0)
         new_value = max(0, current + delta)
         setattr(self, resource, new_value)
+        self.version += 1
 
     def advance_day(self, miles: int = 15):
         self.day += 1
         self.miles_traveled += miles
+        self.version += 1
         self.modify_resource("food", -len(self.party) * 2)
         self.modify_resource("water", -len(self.party) * 1)
 
@@ -77,7 +77,7 @@ def demonstrate_rdf():
     print(f"  ✓ Created RDF graph with {len(g)} triples")
     print("\n  Sample triples:")
     for s, p, o in list(g)[:3]:
-        print(f"    {s.split('/')[-1]} -> {p.split('/')[-1]} -> {o}")
+        print(f"    {s.rpartition('/')[2]} -> {p.rpartition('/')[2]} -> {o}")
 
 
 if __name__ == "__main__":
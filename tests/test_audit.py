@@ -1,4 +1,21 @@
-from conestoga.game.audit import AuditFinding, run_heuristic_audit
+import pytest
+
+from conestoga.game.audit import (
+    AUDIT_MAX_CONCURRENCY,
+    AuditFinding,
+    iter_heuristic_audit,
+    reset_audit_cache,
+    run_heuristic_audit,
+    run_heuristic_audit_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_audit_flag():
+    # The enable flag is cached per process; re-read it for every test
+    reset_audit_cache()
+    yield
+    reset_audit_cache()
 
 
 class DummyChain:
@@ -10,6 +27,19 @@ class DummyChain:
         return f"checked:{len(item)}"
 
 
+class DummyBatchChain(DummyChain):
+    def __init__(self):
+        super().__init__()
+        self.configs = []
+
+    def batch(self, items, config=None, return_exceptions=False):
+        self.configs.append(config)
+        return [self.invoke(item) for item in items]
+
+    async def abatch(self, items, config=None, return_exceptions=False):
+        return self.batch(items, config=config, return_exceptions=return_exceptions)
+
+
 def test_heuristic_audit_runs_when_enabled(monkeypatch):
     monkeypatch.setenv("HEURISTIC_AUDIT", "1")
     findings = run_heuristic_audit(["", "ok", "x" * 501])
@@ -30,3 +60,73 @@ def test_heuristic_audit_disabled(monkeypatch):
     monkeypatch.delenv("HEURISTIC_AUDIT", raising=False)
     findings = run_heuristic_audit(["abc"])
     assert findings == []
+
+
+def test_heuristic_audit_lazy_items(monkeypatch):
+    calls = []
+
+    def produce_items():
+        calls.append(1)
+        return [""]
+
+    monkeypatch.delenv("HEURISTIC_AUDIT", raising=False)
+    assert run_heuristic_audit(produce_items) == []
+    assert calls == []
+
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    reset_audit_cache()
+    findings = run_heuristic_audit(produce_items)
+    assert calls == [1]
+    assert any("empty" in f.message for f in findings)
+
+
+def test_heuristic_audit_generator_reaches_langchain(monkeypatch):
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    chain = DummyChain()
+    findings = run_heuristic_audit((item for item in ["", "abc"]), llm_chain_factory=lambda: chain)
+    messages = [f.message for f in findings]
+    assert any("empty" in m for m in messages)
+    assert chain.seen == ["", "abc"]
+
+
+def test_heuristic_audit_batches_langchain(monkeypatch):
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    chain = DummyBatchChain()
+    findings = run_heuristic_audit(iter(["abc", "de"]), llm_chain_factory=lambda: chain)
+    messages = [f.message for f in findings]
+    assert messages == ["LLM note for item 0: checked:3", "LLM note for item 1: checked:2"]
+    assert chain.configs == [{"max_concurrency": AUDIT_MAX_CONCURRENCY}]
+
+
+@pytest.mark.asyncio
+async def test_heuristic_audit_async(monkeypatch):
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    chain = DummyBatchChain()
+    findings = await run_heuristic_audit_async(["", "abc"], llm_chain_factory=lambda: chain)
+    messages = [f.message for f in findings]
+    assert any("empty" in m for m in messages)
+    assert "LLM note for item 1: checked:3" in messages
+    assert chain.seen == ["", "abc"]
+
+
+@pytest.mark.asyncio
+async def test_heuristic_audit_async_invoke_only_chain(monkeypatch):
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    chain = DummyChain()
+    findings = await run_heuristic_audit_async(["", "abc"], llm_chain_factory=lambda: chain)
+    messages = [f.message for f in findings]
+    assert any("empty" in m for m in messages)
+    assert "LLM note for item 1: checked:3" in messages
+    assert chain.seen == ["", "abc"]
+
+
+def test_iter_heuristic_audit_yields_before_later_items(monkeypatch):
+    monkeypatch.setenv("HEURISTIC_AUDIT", "1")
+    chain = DummyChain()
+    findings = iter_heuristic_audit(["", "abc"], llm_chain_factory=lambda: chain)
+    assert next(findings).message == "Item 0 is empty"
+    assert chain.seen == []
+    assert [f.message for f in findings] == [
+        "LLM note for item 0: checked:0",
+        "LLM note for item 1: checked:3",
+    ]
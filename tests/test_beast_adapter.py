@@ -1,12 +1,33 @@
 """Tests for Beast adapter message handling and integration"""
 import pytest
 import json
+import redis
 import asyncio
-from unittest.mock import Mock, MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from conestoga.beast.adapter import BeastAdapter
 from conestoga.beast.envelope import create_envelope, EnvelopeValidationError
 
 
+async def _idle_listen():
+    """Pubsub listen() stand-in that never yields a message"""
+    await asyncio.Event().wait()
+    yield
+
+
+def make_async_redis():
+    """redis.asyncio client mock: awaitable commands, sync pubsub()/pipeline()"""
+    client = AsyncMock()
+    pubsub = AsyncMock()
+    pubsub.listen = Mock(side_effect=_idle_listen)
+    client.pubsub = Mock(return_value=pubsub)
+    pipe = Mock()
+    pipe.execute = AsyncMock()
+    client.pipeline = Mock(return_value=pipe)
+    return client
+
+
 class TestBeastAdapterInit:
     """Test Beast adapter initialization"""
 
@@ -39,6 +60,56 @@ class TestBeastAdapterInit:
 
         assert adapter.observability == mock_observability
 
+    @patch("conestoga.beast.adapter.redis.Redis")
+    def test_connect_unix_socket(self, mock_redis_class):
+        """Test connecting over an explicit UNIX socket"""
+        adapter = BeastAdapter(agent_id="test-agent", unix_socket_path="/tmp/redis.sock")
+        adapter.connect()
+
+        pool = mock_redis_class.call_args.kwargs["connection_pool"]
+        assert pool.connection_class is redis.UnixDomainSocketConnection
+        assert pool.connection_kwargs["path"] == "/tmp/redis.sock"
+        assert "host" not in pool.connection_kwargs
+
+    @patch("conestoga.beast.adapter.redis.Redis")
+    def test_connect_shares_connection_pool(self, mock_redis_class):
+        """Test that adapters with the same settings share one connection pool"""
+        first = BeastAdapter(agent_id="agent-1", redis_host="redis.example")
+        second = BeastAdapter(agent_id="agent-2", redis_host="redis.example")
+        other = BeastAdapter(agent_id="agent-3", redis_host="redis.example", redis_port=6380)
+
+        for adapter in (first, second, other):
+            adapter.connect()
+
+        pools = [call.kwargs["connection_pool"] for call in mock_redis_class.call_args_list]
+        assert pools[0] is pools[1]
+        assert pools[2] is not pools[0]
+        assert pools[2].connection_kwargs["port"] == 6380
+
+    @patch("conestoga.beast.adapter.redis.Redis")
+    def test_connect_keeps_responses_as_bytes(self, mock_redis_class):
+        """Test that received messages reach the decoder as bytes"""
+        adapter = BeastAdapter(agent_id="test-agent", redis_host="redis.example")
+        adapter.connect()
+
+        pool = mock_redis_class.call_args.kwargs["connection_pool"]
+        assert not pool.connection_kwargs.get("decode_responses")
+
+    @patch("conestoga.beast.adapter.os.path.exists", return_value=True)
+    def test_init_detects_local_unix_socket(self, mock_exists):
+        """Test that a local host picks up the standard socket when present"""
+        from conestoga.beast.adapter import DEFAULT_REDIS_UNIX_SOCKET
+
+        local = BeastAdapter(agent_id="test-agent")
+        remote = BeastAdapter(agent_id="test-agent", redis_host="redis.example")
+        other_port = BeastAdapter(agent_id="test-agent", redis_port=6380)
+
+        assert local.unix_socket_path == DEFAULT_REDIS_UNIX_SOCKET
+        assert remote.unix_socket_path is None
+        # A local server on another port is not the one behind the socket
+        assert other_port.unix_socket_path is None
+        assert other_port._connection_kwargs()["port"] == 6380
+
     def test_init_with_hacp(self):
         """Test initialization with HACP interceptor"""
         mock_hacp = Mock()
@@ -144,6 +215,38 @@ class TestBeastAdapterMessageHandling:
         # Handler should be called
         assert handler.call_count == 1
 
+    def test_handle_message_bytes(self):
+        """Test handling a message published as raw JSON bytes"""
+        adapter = BeastAdapter(agent_id="test-agent")
+        handler = Mock()
+        adapter.register_handler("test_message", handler)
+
+        envelope = create_envelope(
+            sender="agent-1", message_type="test_message", payload_data={"data": "test"}
+        )
+        adapter._handle_message(json.dumps(envelope.to_dict()).encode())
+
+        assert handler.call_count == 1
+
+    def test_handle_message_msgpack(self):
+        """Test handling a MessagePack frame with the msgpack wire format"""
+        pytest.importorskip("msgspec")
+        adapter = BeastAdapter(agent_id="test-agent", wire_format="msgpack")
+        handler = Mock()
+        adapter.register_handler("test_message", handler)
+
+        envelope = create_envelope(
+            sender="agent-1", message_type="test_message", payload_data={"data": "test"}
+        )
+        adapter._handle_message(envelope.to_msgpack())
+
+        assert handler.call_count == 1
+
+    def test_init_unknown_wire_format(self):
+        """Test that an unknown wire format is rejected"""
+        with pytest.raises(ValueError):
+            BeastAdapter(agent_id="test-agent", wire_format="xml")
+
     def test_handle_message_invalid_json(self):
         """Test handling invalid JSON logs error"""
         adapter = BeastAdapter(agent_id="test-agent")
@@ -169,7 +272,6 @@ class TestBeastAdapterMessageHandling:
     def test_handle_message_with_observability_metrics(self):
         """Test that message handling updates observability metrics"""
         mock_observability = Mock()
-        mock_observability.messages_total.labels.return_value.inc = Mock()
         mock_observability.extract_trace_context.return_value = None
         mock_observability.get_tracer.return_value.start_as_current_span = (
             MagicMock()
@@ -189,7 +291,7 @@ class TestBeastAdapterMessageHandling:
         adapter._handle_message(raw_message)
 
         # Verify metrics were incremented
-        mock_observability.messages_total.labels.assert_called()
+        mock_observability.count_message.assert_called()
 
     def test_handle_message_hacp_violation(self):
         """Test message handling blocks on HACP violation"""
@@ -285,7 +387,6 @@ class TestBeastAdapterSendMessage:
             "header": {"trace_context": {"trace_id": "123"}},
             "payload": {"type": "test"},
         }
-        mock_observability.messages_total.labels.return_value.inc = Mock()
 
         adapter = BeastAdapter(
             agent_id="test-agent", observability_stack=mock_observability
@@ -297,7 +398,7 @@ class TestBeastAdapterSendMessage:
 
         # Verify observability methods were called
         mock_observability.inject_trace_context.assert_called_once()
-        mock_observability.messages_total.labels.assert_called()
+        mock_observability.count_message.assert_called()
 
     @patch("conestoga.beast.adapter.redis.Redis")
     def test_send_message_hacp_violation(self, mock_redis_class):
@@ -380,15 +481,33 @@ class TestBeastAdapterAsync:
         # Should not raise
         await adapter._async_dispatch_message(message)
 
-    @patch("conestoga.beast.adapter.redis.Redis")
+    async def test_async_dispatch_checks_handler_once(self):
+        """Test that a registered handler is not re-inspected per message"""
+        calls = []
+
+        async def async_handler(payload):
+            calls.append(payload)
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_register_handler("test_message", async_handler)
+        message = {"payload": {"type": "test_message"}}
+
+        with patch("conestoga.beast.adapter.asyncio.iscoroutinefunction") as check:
+            await adapter._async_dispatch_message(message)
+            await adapter._async_dispatch_message(message)
+            check.assert_not_called()
+
+        assert len(calls) == 2
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
     async def test_async_send_message(self, mock_redis_class):
         """Test async message sending"""
-        mock_redis = Mock()
+        mock_redis = make_async_redis()
         mock_redis_class.return_value = mock_redis
         mock_redis.ping.return_value = True
 
         adapter = BeastAdapter(agent_id="test-agent")
-        adapter.connect()
+        await adapter.async_connect()
 
         correlation_id = await adapter.async_send_message(
             target_agent="agent-2", message_type="test", payload={"data": "value"}
@@ -403,27 +522,91 @@ class TestBeastAdapterAsync:
         assert len(message_calls) == 1
 
     @patch("conestoga.beast.adapter.redis.Redis")
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_message_after_sync_connect(
+        self, mock_async_redis_class, mock_redis_class
+    ):
+        """Test async sending from an adapter connected with connect()"""
+        mock_redis_class.return_value.ping.return_value = True
+        mock_async_redis = make_async_redis()
+        mock_async_redis_class.return_value = mock_async_redis
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        adapter.connect()
+        assert adapter.async_redis_client is None
+
+        await adapter.async_send_message(
+            target_agent="agent-2", message_type="test", payload={"data": "value"}
+        )
+
+        mock_async_redis.publish.assert_called_once()
+        assert mock_async_redis.publish.call_args[0][0] == "beast:agent:agent-2:inbox"
+
+        adapter.is_connected = False  # Stop the heartbeat thread
+
+    @patch("conestoga.beast.adapter.redis.Redis")
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_connect_after_sync_connect(
+        self, mock_async_redis_class, mock_redis_class
+    ):
+        """Test that async_connect creates the async client after connect()"""
+        mock_redis_class.return_value.ping.return_value = True
+        mock_async_redis = make_async_redis()
+        mock_async_redis_class.return_value = mock_async_redis
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        adapter.connect()
+        await adapter.async_connect()
+
+        assert adapter.async_redis_client is mock_async_redis
+        mock_async_redis.ping.assert_awaited_once()
+
+        await adapter.async_stop()
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
     async def test_async_wait_for_reply_timeout(self, mock_redis_class):
         """Test async wait for reply with timeout"""
-        mock_redis = Mock()
+        mock_redis = make_async_redis()
         mock_redis_class.return_value = mock_redis
         mock_redis.ping.return_value = True
 
         adapter = BeastAdapter(agent_id="test-agent")
-        adapter.connect()
+        await adapter.async_connect()
 
         with pytest.raises(asyncio.TimeoutError):
             await adapter.async_wait_for_reply("nonexistent-correlation-id", timeout=0.1)
+        assert adapter.pending_replies == {}
 
-    @patch("conestoga.beast.adapter.redis.Redis")
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_wait_for_reply_cancelled(self, mock_redis_class):
+        """Test that a cancelled wait for reply does not leave a pending entry"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+
+        wait_task = asyncio.create_task(
+            adapter.async_wait_for_reply("cancelled-correlation-id", timeout=10.0)
+        )
+        await asyncio.sleep(0)
+        assert "cancelled-correlation-id" in adapter.pending_replies
+
+        wait_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await wait_task
+        assert adapter.pending_replies == {}
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
     async def test_async_wait_for_reply_success(self, mock_redis_class):
         """Test async wait for reply receives response"""
-        mock_redis = Mock()
+        mock_redis = make_async_redis()
         mock_redis_class.return_value = mock_redis
         mock_redis.ping.return_value = True
 
         adapter = BeastAdapter(agent_id="test-agent")
-        adapter.connect()
+        await adapter.async_connect()
 
         correlation_id = "test-correlation-123"
 
@@ -454,7 +637,7 @@ class TestBeastAdapterAsync:
         assert result["correlation_id"] == correlation_id
         assert result["result"] == "success"
 
-    @patch("conestoga.beast.adapter.redis.Redis")
+    @patch("conestoga.beast.adapter.aioredis.Redis")
     async def test_async_handle_message_invalid_envelope(self, mock_redis_class):
         """Test async handling of invalid envelope"""
         adapter = BeastAdapter(agent_id="test-agent")
@@ -469,10 +652,10 @@ class TestBeastAdapterAsync:
                 for call in mock_logging.error.call_args_list
             )
 
-    @patch("conestoga.beast.adapter.redis.Redis")
+    @patch("conestoga.beast.adapter.aioredis.Redis")
     async def test_async_stop(self, mock_redis_class):
         """Test async adapter stop"""
-        mock_redis = Mock()
+        mock_redis = make_async_redis()
         mock_redis_class.return_value = mock_redis
         mock_redis.ping.return_value = True
         mock_redis.close.return_value = None
@@ -488,3 +671,435 @@ class TestBeastAdapterAsync:
 
         assert not adapter.is_connected
         assert adapter._subscribe_task.cancelled() or adapter._subscribe_task.done()
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_start_shares_subscriber(self, mock_redis_class):
+        """Test that async adapters share one pubsub connection"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+
+        adapter_a = BeastAdapter(agent_id="agent-a")
+        adapter_b = BeastAdapter(agent_id="agent-b")
+        await adapter_a.async_start()
+        await adapter_b.async_start()
+
+        assert adapter_a._shared_key == adapter_b._shared_key
+        mock_redis.pubsub.assert_called_once()
+        subscribed = [
+            channel
+            for call in mock_redis.pubsub.return_value.subscribe.call_args_list
+            for channel in call[0]
+        ]
+        assert "beast:agent:agent-a:replies" in subscribed
+        assert "beast:agent:agent-b:inbox" in subscribed
+        assert subscribed.count("beast:global:announcements") == 1
+
+        await adapter_a.async_stop()
+        await adapter_b.async_stop()
+
+        assert not BeastAdapter._shared_subscribers
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_reply(self, mock_redis_class):
+        """Test that replies go to the requester's reply channel"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+
+        requester = BeastAdapter(agent_id="agent-a")
+        responder = BeastAdapter(agent_id="agent-b")
+        await responder.async_connect()
+
+        request = {
+            "type": "question",
+            "correlation_id": "corr-1",
+            "reply_to": requester.reply_channel,
+        }
+        await responder.async_send_reply(request, "answer", {"result": 42})
+
+        reply_calls = [
+            call for call in mock_redis.publish.call_args_list
+            if call[0][0] == "beast:agent:agent-a:replies"
+        ]
+        assert len(reply_calls) == 1
+        payload = json.loads(reply_calls[0][0][1])["payload"]
+        assert payload["correlation_id"] == "corr-1"
+        assert payload["result"] == 42
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_message_pipelines_same_tick(self, mock_redis_class):
+        """Test that sends issued together go out in one pipeline"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+        pipe = mock_redis.pipeline.return_value
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+
+        await asyncio.gather(
+            *(
+                adapter.async_send_message(
+                    target_agent=f"agent-{i}", message_type="test", payload={}
+                )
+                for i in range(3)
+            )
+        )
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        channels = [call[0][0] for call in pipe.publish.call_args_list]
+        assert channels == [f"beast:agent:agent-{i}:inbox" for i in range(3)]
+        pipe.execute.assert_called_once()
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_message_pipeline_error(self, mock_redis_class):
+        """Test that a failed pipeline fails every send in it"""
+        import redis
+
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+        mock_redis.pipeline.return_value.execute.side_effect = (
+            redis.exceptions.ConnectionError("down")
+        )
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+
+        results = await asyncio.gather(
+            *(
+                adapter.async_send_message(
+                    target_agent="agent-2", message_type="test", payload={}
+                )
+                for _ in range(2)
+            ),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, redis.exceptions.ConnectionError) for r in results)
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_message_fire_and_forget(self, mock_redis_class):
+        """Test that a fire-and-forget send returns before the publish runs"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+
+        await adapter.async_send_message(
+            target_agent="agent-2", message_type="test", payload={}, fire_and_forget=True
+        )
+        mock_redis.publish.assert_not_called()
+
+        await adapter.async_stop()
+        mock_redis.publish.assert_called_once()
+        assert mock_redis.publish.call_args[0][0] == "beast:agent:agent-2:inbox"
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_send_message_fire_and_forget_error(self, mock_redis_class):
+        """Test that a failed fire-and-forget send is logged, not raised"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+        mock_redis.ping.return_value = True
+
+        async def publish(channel, body):
+            # Only the send fails; a failing heartbeat would reconnect in a loop
+            if channel != "beast:global:heartbeat":
+                raise redis.exceptions.ConnectionError("down")
+
+        mock_redis.publish.side_effect = publish
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+
+        with patch("conestoga.beast.adapter.logging") as mock_logging:
+            await adapter.async_send_message(
+                target_agent="agent-2", message_type="test", payload={}, fire_and_forget=True
+            )
+            await asyncio.gather(*adapter._flush_tasks)
+            await asyncio.sleep(0)
+            await asyncio.gather(*adapter._flush_tasks)
+
+        assert any("down" in str(call) for call in mock_logging.error.call_args_list)
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_heartbeat_reconnects(self, mock_redis_class):
+        """Test that a failed heartbeat closes the old client and backs off"""
+        failing = make_async_redis()
+        failing.publish.side_effect = redis.exceptions.ConnectionError("down")
+        unreachable = make_async_redis()
+        unreachable.ping.side_effect = redis.exceptions.ConnectionError("refused")
+        recovered = make_async_redis()
+        mock_redis_class.side_effect = [failing, unreachable, recovered]
+
+        real_sleep = asyncio.sleep
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        with patch("conestoga.beast.adapter.asyncio.sleep", fake_sleep):
+            await adapter.async_connect()
+            for _ in range(50):
+                if recovered.publish.await_count:
+                    break
+                await real_sleep(0)
+
+            assert adapter.async_redis_client is recovered
+            assert adapter.is_connected
+            failing.aclose.assert_awaited_once()
+            unreachable.aclose.assert_awaited_once()
+            # Slept before the first reconnect attempt and after the failed ping
+            assert delays[:2] == [1, 1]
+            recovered.publish.assert_awaited_with("beast:global:heartbeat", "test-agent")
+
+            await adapter.async_stop()
+
+    @pytest.mark.parametrize(
+        "error", [redis.exceptions.TimeoutError("slow"), RuntimeError("boom")]
+    )
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_heartbeat_publish_error(self, mock_redis_class, error):
+        """Test that a failing heartbeat keeps beating and stop still tears down"""
+        mock_redis = make_async_redis()
+        mock_redis.publish.side_effect = error
+        mock_redis_class.return_value = mock_redis
+
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            await real_sleep(0)
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        with patch("conestoga.beast.adapter.asyncio.sleep", fake_sleep):
+            await adapter.async_connect()
+            for _ in range(20):
+                await real_sleep(0)
+
+            assert mock_redis.publish.await_count > 1
+            assert not adapter._heartbeat_task.done()
+
+            await adapter.async_stop()
+
+        assert adapter.async_redis_client is None
+        assert adapter._heartbeat_task is None
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_async_stop_after_heartbeat_failed(self, mock_redis_class):
+        """Test that async_stop finishes when the heartbeat task has died"""
+        mock_redis = make_async_redis()
+        mock_redis_class.return_value = mock_redis
+
+        adapter = BeastAdapter(agent_id="test-agent")
+        await adapter.async_connect()
+        adapter._heartbeat_task.cancel()
+
+        async def failed():
+            raise RuntimeError("heartbeat died")
+
+        adapter._heartbeat_task = asyncio.create_task(failed())
+        await asyncio.sleep(0)
+
+        await adapter.async_stop()
+
+        mock_redis.aclose.assert_awaited_once()
+        assert adapter.async_redis_client is None
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_shared_subscriber_routes_by_channel(self, mock_redis_class):
+        """Test that the shared subscriber delivers to the channel's adapter"""
+        envelope = create_envelope(
+            sender="agent-x", message_type="test_message", payload_data={}
+        )
+        delivered = asyncio.Event()
+
+        async def listen():
+            yield {"type": "subscribe", "channel": "beast:agent:agent-b:inbox", "data": 1}
+            yield {
+                "type": "message",
+                "channel": "beast:agent:agent-b:inbox",
+                "data": json.dumps(envelope.to_dict()),
+            }
+            await asyncio.Event().wait()
+
+        mock_redis = make_async_redis()
+        mock_redis.pubsub.return_value.listen = Mock(side_effect=listen)
+        mock_redis_class.return_value = mock_redis
+
+        adapter_a = BeastAdapter(agent_id="agent-a")
+        adapter_b = BeastAdapter(agent_id="agent-b")
+        handler_a = Mock()
+        handler_b = Mock(side_effect=lambda payload: delivered.set())
+        adapter_a.register_handler("test_message", handler_a)
+        adapter_b.register_handler("test_message", handler_b)
+        await adapter_a.async_start()
+        await adapter_b.async_start()
+
+        await asyncio.wait_for(delivered.wait(), timeout=1.0)
+
+        handler_a.assert_not_called()
+        handler_b.assert_called_once()
+
+        await adapter_a.async_stop()
+        await adapter_b.async_stop()
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_shared_subscriber_slow_handler(self, mock_redis_class):
+        """Test that a slow adapter handler does not delay the other adapters"""
+        envelope = json.dumps(
+            create_envelope(sender="agent-x", message_type="test_message", payload_data={})
+            .to_dict()
+        )
+
+        async def listen():
+            for channel in ("beast:agent:agent-a:inbox", "beast:agent:agent-b:inbox"):
+                yield {"type": "message", "channel": channel, "data": envelope}
+            await asyncio.Event().wait()
+
+        mock_redis = make_async_redis()
+        mock_redis.pubsub.return_value.listen = Mock(side_effect=listen)
+        mock_redis_class.return_value = mock_redis
+
+        release = asyncio.Event()
+        delivered = asyncio.Event()
+
+        async def slow_handler(payload):
+            await release.wait()
+
+        async def fast_handler(payload):
+            delivered.set()
+
+        adapter_a = BeastAdapter(agent_id="agent-a")
+        adapter_b = BeastAdapter(agent_id="agent-b")
+        adapter_a.register_handler("test_message", slow_handler)
+        adapter_b.register_handler("test_message", fast_handler)
+        await adapter_a.async_start()
+        await adapter_b.async_start()
+
+        await asyncio.wait_for(delivered.wait(), timeout=1.0)
+
+        release.set()
+        await adapter_a.async_stop()
+        await adapter_b.async_stop()
+
+    @patch("conestoga.beast.adapter.aioredis.Redis")
+    async def test_shared_subscriber_keeps_adapter_order(self, mock_redis_class):
+        """Test that one adapter's messages are handled in arrival order"""
+
+        def raw(message_type):
+            return json.dumps(
+                create_envelope(
+                    sender="agent-x", message_type=message_type, payload_data={}
+                ).to_dict()
+            )
+
+        async def listen():
+            for message_type in ("slow", "fast"):
+                yield {
+                    "type": "message",
+                    "channel": "beast:agent:agent-a:inbox",
+                    "data": raw(message_type),
+                }
+            await asyncio.Event().wait()
+
+        mock_redis = make_async_redis()
+        mock_redis.pubsub.return_value.listen = Mock(side_effect=listen)
+        mock_redis_class.return_value = mock_redis
+
+        handled = []
+        done = asyncio.Event()
+
+        async def slow_handler(payload):
+            await asyncio.sleep(0.05)
+            handled.append("slow")
+
+        async def fast_handler(payload):
+            handled.append("fast")
+            done.set()
+
+        adapter = BeastAdapter(agent_id="agent-a")
+        adapter.register_handler("slow", slow_handler)
+        adapter.register_handler("fast", fast_handler)
+        await adapter.async_start()
+
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+        assert handled == ["slow", "fast"]
+
+        await adapter.async_stop()
+
+class TestBeastAdapterSubscribe:
+    """Test the threaded subscribe loop"""
+
+    @pytest.mark.parametrize("handler_workers", [0, 2])
+    def test_subscribe_handles_messages(self, handler_workers):
+        """Test that messages are handled inline or on worker threads"""
+        adapter = BeastAdapter(agent_id="test-agent", handler_workers=handler_workers)
+        handler = Mock()
+        adapter.register_handler("test_message", handler)
+
+        raw = json.dumps(
+            create_envelope(
+                sender="agent-1", message_type="test_message", payload_data={}
+            ).to_dict()
+        )
+        adapter.redis_client = Mock()
+        adapter.redis_client.pubsub.return_value.listen.return_value = [
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": raw},
+            {"type": "message", "data": raw},
+        ]
+
+        # Returns once listen() is exhausted and the worker pool has drained
+        adapter._subscribe()
+
+        assert handler.call_count == 2
+
+    def test_subscribe_bounds_worker_backlog(self):
+        """Test that reading waits while the worker backlog is full"""
+        adapter = BeastAdapter(agent_id="test-agent", handler_workers=1)
+        raw = json.dumps(
+            create_envelope(
+                sender="agent-1", message_type="test_message", payload_data={}
+            ).to_dict()
+        )
+        release = threading.Event()
+        queued = []
+        adapter.register_handler("test_message", lambda message: release.wait(5))
+
+        def listen():
+            for i in range(3):
+                queued.append(i)
+                yield {"type": "message", "data": raw}
+
+        adapter.redis_client = Mock()
+        adapter.redis_client.pubsub.return_value.listen.side_effect = listen
+
+        with patch("conestoga.beast.adapter.HANDLER_BACKLOG_PER_WORKER", 1):
+            reader = threading.Thread(target=adapter._subscribe)
+            reader.start()
+            time.sleep(0.1)
+            # One message being handled blocks the reader before the third
+            assert len(queued) == 2
+            release.set()
+            reader.join(timeout=5)
+
+        assert len(queued) == 3
+
+
+class TestRunAsync:
+    """Test the adapter application runner"""
+
+    def test_run_async_returns_result(self):
+        """Test that run_async runs a coroutine to completion"""
+        from conestoga.beast.adapter import run_async
+
+        async def main():
+            await asyncio.sleep(0)
+            return "done"
+
+        assert run_async(main()) == "done"
@@ -1,10 +1,14 @@
 """Tests for Beast envelope validation and creation"""
+import json
 import pytest
+from unittest.mock import patch
 from datetime import datetime
 from conestoga.beast.envelope import (
     BeastEnvelope,
     validate_envelope,
     create_envelope,
+    decode_envelope,
+    encode_msgpack,
     EnvelopeValidationError,
 )
 
@@ -278,6 +282,17 @@ class TestEnvelopeCreation:
         parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
         assert isinstance(parsed, datetime)
 
+    def test_create_envelope_reuses_recent_timestamp(self):
+        """Test that envelopes created within the resolution share a timestamp"""
+        with patch("conestoga.beast.envelope.time.time", side_effect=[1000.0, 1000.0005, 1001.0]):
+            first = create_envelope(sender="agent-1", message_type="a", payload_data={})
+            second = create_envelope(sender="agent-1", message_type="b", payload_data={})
+            third = create_envelope(sender="agent-1", message_type="c", payload_data={})
+
+        assert first.header["timestamp"] == "1970-01-01T00:16:40Z"
+        assert second.header["timestamp"] == first.header["timestamp"]
+        assert third.header["timestamp"] == "1970-01-01T00:16:41Z"
+
     def test_create_envelope_validates(self):
         """Test that created envelopes are automatically validated"""
         # This should not raise an exception
@@ -343,6 +358,18 @@ class TestBeastEnvelope:
         with pytest.raises(EnvelopeValidationError):
             BeastEnvelope.from_dict(invalid_data)
 
+    def test_get_timestamp(self):
+        """Test that the header timestamp parses as a UTC datetime"""
+        envelope = BeastEnvelope(
+            header={"sender": "agent-1", "timestamp": "2024-01-01T12:00:00Z", "id": "msg-1"},
+            payload={"type": "test"},
+        )
+
+        timestamp = envelope.get_timestamp()
+
+        assert timestamp.year == 2024
+        assert timestamp.utcoffset().total_seconds() == 0
+
     def test_envelope_roundtrip(self):
         """Test that to_dict and from_dict are inverses"""
         original = create_envelope(
@@ -358,3 +385,90 @@ class TestBeastEnvelope:
 
         # Should have the same content
         assert reconstructed.to_dict() == original.to_dict()
+
+
+class TestEnvelopeMsgpack:
+    """Test MessagePack envelope framing"""
+
+    @pytest.fixture(autouse=True)
+    def _require_msgspec(self):
+        pytest.importorskip("msgspec")
+
+    def test_msgpack_roundtrip(self):
+        """Test that to_msgpack and from_msgpack are inverses"""
+        original = create_envelope(
+            sender="agent-1",
+            message_type="test",
+            payload_data={"key": "value"},
+            metadata={"role": "worker"},
+        )
+
+        data = original.to_msgpack()
+
+        assert isinstance(data, bytes)
+        assert BeastEnvelope.from_msgpack(data).to_dict() == original.to_dict()
+
+    def test_from_msgpack_invalid_bytes(self):
+        """Test that undecodable bytes raise EnvelopeValidationError"""
+        with pytest.raises(EnvelopeValidationError):
+            BeastEnvelope.from_msgpack(b"\xc1")
+
+
+class TestDecodeEnvelope:
+    """Test schema-validating envelope decoding"""
+
+    @pytest.fixture(autouse=True)
+    def _require_msgspec(self):
+        pytest.importorskip("msgspec")
+
+    @pytest.mark.parametrize("wire_format", ["json", "msgpack"])
+    def test_decode_envelope_keeps_all_fields(self, wire_format):
+        """Test that decoding returns the full envelope, undeclared fields included"""
+        envelope = create_envelope(
+            sender="agent-1",
+            message_type="test",
+            payload_data={"key": "value"},
+            metadata={"role": "worker"},
+        ).to_dict()
+        envelope["header"]["extra"] = "kept"
+        data = json.dumps(envelope) if wire_format == "json" else encode_msgpack(envelope)
+
+        assert decode_envelope(data, wire_format) == envelope
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "not valid json",
+            json.dumps({"invalid": "envelope"}),
+            json.dumps({"header": {"sender": "a", "timestamp": "bad", "id": "1"},
+                        "payload": {"type": "test"}}),
+            json.dumps({"header": {"sender": "a", "timestamp": "2024-01-01T00:00:00Z",
+                                   "id": "1"},
+                        "payload": {"type": 7}}),
+            json.dumps(["not", "an", "object"]),
+        ],
+    )
+    def test_decode_envelope_rejects_invalid(self, data):
+        """Test that malformed data and invalid envelopes raise EnvelopeValidationError"""
+        with pytest.raises(EnvelopeValidationError):
+            decode_envelope(data)
+
+
+class TestPackageExports:
+    """Test the lazily resolved conestoga.beast exports"""
+
+    def test_exports_resolve_to_submodule_objects(self):
+        """Test that package-level names are the submodule objects"""
+        import conestoga.beast as beast
+        from conestoga.beast import envelope
+
+        assert beast.BeastEnvelope is envelope.BeastEnvelope
+        assert set(beast.__all__) <= set(dir(beast))
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError"""
+        import conestoga.beast as beast
+
+        assert not hasattr(beast, "NotAnExport")
+        with pytest.raises(AttributeError, match="NotAnExport"):
+            _ = beast.NotAnExport
@@ -78,6 +78,48 @@ class TestObservabilityStackInit:
         mock_prometheus_and_observability["http_server"].assert_called_once_with(9091)
 
 
+class TestTraceSampling:
+    """Test head-based trace sampling"""
+
+    def test_tracer_provider_uses_ratio_sampler(self, mock_prometheus_and_observability):
+        """Test the tracer provider samples a fraction of root traces"""
+        with patch("conestoga.beast.observability.TracerProvider") as mock_provider:
+            ObservabilityStack(
+                service_name="test-service",
+                jaeger_host="localhost",
+                jaeger_port=4317,
+                metrics_port=9090,
+                trace_sample_ratio=0.25,
+            )
+
+        sampler = mock_provider.call_args.kwargs["sampler"]
+        assert "TraceIdRatioBased{0.25}" in sampler.get_description()
+
+    def test_inject_skips_unsampled_span(self, mock_prometheus_and_observability):
+        """Test unsampled spans leave the message header untouched"""
+        mock_trace = mock_prometheus_and_observability["trace"]
+
+        mock_span_context = Mock()
+        mock_span_context.trace_flags.sampled = False
+
+        mock_span = MagicMock()
+        mock_span.__enter__.return_value = mock_span
+        mock_span.get_span_context.return_value = mock_span_context
+        mock_trace.get_tracer.return_value.start_as_current_span.return_value = mock_span
+
+        stack = ObservabilityStack(
+            service_name="test-service",
+            jaeger_host="localhost",
+            jaeger_port=4317,
+            metrics_port=9090,
+        )
+
+        message = {"header": {}, "payload": {"type": "test"}}
+        result = stack.inject_trace_context(message)
+
+        assert result["header"] == {}
+
+
 class TestObservabilityStackTracer:
     """Test tracer functionality"""
 
@@ -334,3 +376,25 @@ class TestObservabilityStackMetrics:
         assert any(
             call[0][0] == "hacp_violations_total" for call in mock_counter.call_args_list
         )
+
+
+class TestMessageCounting:
+    """Test cached per-label message counters"""
+
+    def test_count_message_reuses_label_child(self, mock_prometheus_and_observability):
+        """Test that labels() runs once per (type, direction) pair"""
+        stack = ObservabilityStack(
+            service_name="test-service",
+            jaeger_host="localhost",
+            jaeger_port=4317,
+            metrics_port=9090,
+        )
+
+        stack.count_message("ping", "in")
+        stack.count_message("ping", "in")
+        stack.count_message("ping", "out")
+
+        labels = stack.messages_total.labels
+        assert labels.call_count == 2
+        labels.assert_any_call(type="ping", direction="in")
+        assert labels.return_value.inc.call_count == 3
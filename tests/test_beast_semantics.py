@@ -1,8 +1,10 @@
 """Tests for Beast semantic alignment and ontology operations"""
+import io
 import pytest
 from rdflib import Graph, Literal, URIRef
 from rdflib.namespace import RDF, RDFS
 from conestoga.beast.semantics import (
+    FastAlignmentLayer,
     SemanticAlignmentLayer,
     BEAST,
     EUDORUS,
@@ -35,6 +37,20 @@ class TestSemanticAlignmentLayerInit:
         # Should contain the test entity
         assert (test_uri, RDF.type, BEAST.Agent) in layer.graph
 
+    def test_init_unknown_store(self):
+        """Test that an unknown store name is rejected"""
+        with pytest.raises(ValueError, match="Unknown store"):
+            SemanticAlignmentLayer(store="sqlite")
+
+    def test_init_oxigraph_store(self):
+        """Test that the oxigraph store holds the core classes"""
+        pytest.importorskip("oxrdflib")
+        layer = SemanticAlignmentLayer(store="oxigraph")
+
+        assert (BEAST.Agent, RDF.type, None) in layer.graph
+        layer.create_agent("test-agent")
+        assert layer.query_agents() == ["test-agent"]
+
     def test_namespaces_bound(self):
         """Test that namespaces are properly bound"""
         layer = SemanticAlignmentLayer()
@@ -130,6 +146,20 @@ class TestSemanticAlignmentLayerAgentOperations:
         # Should be different URIs
         assert agent1 != agent2
 
+    def test_create_agents_bulk(self):
+        """Test creating several agents in one call"""
+        layer = SemanticAlignmentLayer()
+
+        agent_uris = layer.create_agents_bulk(
+            [("agent-1", None), ("agent-2", {"version": "1.0"})]
+        )
+
+        assert agent_uris == [BEAST["agent/agent-1"], BEAST["agent/agent-2"]]
+        for agent_uri in agent_uris:
+            assert (agent_uri, RDF.type, BEAST.Agent) in layer.graph
+        assert (agent_uris[1], BEAST.version, Literal("1.0")) in layer.graph
+        assert sorted(layer.query_agents()) == ["agent-1", "agent-2"]
+
     def test_query_agents(self):
         """Test querying all agents"""
         layer = SemanticAlignmentLayer()
@@ -355,6 +385,35 @@ class TestSemanticAlignmentLayerRDFOperations:
         imported_uri = BEAST["agent/imported-agent"]
         assert (imported_uri, RDF.type, BEAST.Agent) in layer.graph
 
+    def test_process_rdf_payload_stream(self):
+        """Test processing an RDF payload read from a binary stream"""
+        layer = SemanticAlignmentLayer()
+
+        rdf_content = b"""
+@prefix beast: <http://nkllon.com/ontology/beast#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+<http://nkllon.com/ontology/beast#agent/streamed-agent> a beast:Agent ;
+    rdfs:label "Streamed Agent" .
+"""
+
+        triples_added = layer.process_rdf_payload(io.BytesIO(rdf_content), format="turtle")
+
+        assert triples_added == 2
+        assert (BEAST["agent/streamed-agent"], RDF.type, BEAST.Agent) in layer.graph
+
+    def test_process_rdf_payload_plain_literals(self):
+        """Test that parsed plain literals match those the layer creates"""
+        layer = SemanticAlignmentLayer()
+
+        layer.process_rdf_payload(
+            '<http://nkllon.com/ontology/beast#agent/a> '
+            '<http://www.w3.org/2000/01/rdf-schema#label> "a" .',
+            format="turtle",
+        )
+
+        assert (BEAST["agent/a"], RDFS.label, Literal("a")) in layer.graph
+
     def test_process_rdf_payload_invalid(self):
         """Test processing invalid RDF raises error"""
         layer = SemanticAlignmentLayer()
@@ -380,6 +439,15 @@ class TestSemanticAlignmentLayerRDFOperations:
         # Verify it contains our agent
         assert "export-test-agent" in turtle_output
 
+    def test_export_as_turtle_default_store_compact(self):
+        """Test that the default store exports with rdflib's grouped Turtle"""
+        layer = SemanticAlignmentLayer()
+        layer.create_agent(agent_id="export-test-agent")
+
+        turtle_output = layer.export_as_turtle()
+
+        assert turtle_output == layer.graph.serialize(format="turtle")
+
 
 class TestSemanticAlignmentLayerPersistence:
     """Test ontology loading and saving"""
@@ -438,3 +506,60 @@ class TestSemanticAlignmentLayerPersistence:
         assert (val_uri, RDF.type, BEAST.Validation) in layer2.graph
         assert (agent_uri, BEAST.executesTask, task_uri) in layer2.graph
         assert (task_uri, BEAST.hasValidation, val_uri) in layer2.graph
+
+
+class TestFastAlignmentLayer:
+    """Test the dict-indexed alignment layer"""
+
+    def test_core_classes_match_rdflib_layer(self):
+        """Test that both layers start from the same core ontology"""
+        fast = FastAlignmentLayer()
+
+        assert (BEAST.Agent, RDF.type, None) in fast.graph
+        assert set(fast.graph) == set(SemanticAlignmentLayer().graph)
+
+    def test_create_and_query(self):
+        """Test creating entities and listing agents and tasks"""
+        layer = FastAlignmentLayer()
+
+        agent_uri = layer.create_agent("agent-1", {"version": "1.0"})
+        layer.create_agent("agent-2")
+        task_uri = layer.create_task("task-1", agent_uri)
+        layer.create_validation("val-1", task_uri, result=True)
+        layer.link_agent_to_monitor(agent_uri, "prometheus")
+
+        assert sorted(layer.query_agents()) == ["agent-1", "agent-2"]
+        assert layer.query_agent_tasks("agent-1") == ["task-1"]
+        assert layer.query_agent_tasks("agent-2") == []
+        assert (agent_uri, BEAST.version, Literal("1.0")) in layer.graph
+
+    def test_process_rdf_payload(self):
+        """Test merging a Turtle payload"""
+        layer = FastAlignmentLayer()
+
+        triples_added = layer.process_rdf_payload(
+            """
+@prefix beast: <http://nkllon.com/ontology/beast#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+<http://nkllon.com/ontology/beast#agent/imported-agent> a beast:Agent ;
+    rdfs:label "Imported Agent" .
+""",
+            format="turtle",
+        )
+
+        assert triples_added == 2
+        assert layer.query_agents() == ["Imported Agent"]
+
+    def test_export_roundtrip(self):
+        """Test that exported Turtle loads into an equivalent rdflib layer"""
+        layer = FastAlignmentLayer()
+        layer.create_task("task-1", layer.create_agent("agent-1"))
+
+        graph = layer.to_rdflib_graph()
+        assert isinstance(graph, Graph)
+        assert len(graph) == len(layer.graph)
+
+        imported = SemanticAlignmentLayer()
+        imported.process_rdf_payload(layer.export_as_turtle())
+        assert set(imported.graph) == set(layer.graph)
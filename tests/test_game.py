@@ -1,11 +1,20 @@
 """Tests for Conestoga game systems"""
 
+import gc
+import pickle
+import random
+import sys
+import weakref
+from dataclasses import asdict
+
 from conestoga.game.events import (
     Choice,
     Effect,
     EffectType,
     EventDraft,
+    EventResolution,
     FallbackDeck,
+    Outcome,
     Prerequisite,
 )
 from conestoga.game.gemini_gateway import GeminiGateway
@@ -66,6 +75,63 @@ def test_prerequisites():
     assert prereq3.is_met(state)
 
 
+def test_prerequisite_flags_skills_and_reasons():
+    """Test flag and skill prerequisites and their lock reasons"""
+    state = GameState()
+
+    flag = Prerequisite(type="flag_set", target="met_trader")
+    assert not flag.is_met(state)
+    state.flags["met_trader"] = True
+    assert flag.is_met(state)
+
+    assert Prerequisite(type="skill_check", target="hunter", value=6).is_met(state)
+    strong_hunter = Prerequisite(type="skill_check", target="hunter", value=7)
+    assert not strong_hunter.is_met(state)
+    assert strong_hunter.get_reason() == "Requires: hunter skill >= 7"
+
+    unknown = Prerequisite(type="mystery")
+    assert unknown.is_met(state)
+    assert unknown.get_reason() == "Requirements not met"
+    assert unknown == Prerequisite(type="mystery")
+
+
+def test_choice_availability_cache_does_not_hold_state():
+    """Test that shared choices neither keep states alive nor carry the cache"""
+    choice = Choice(
+        id="ford",
+        text="Ford the river",
+        prerequisites=[Prerequisite(type="has_item", target="itm_rope", value=1)],
+    )
+    state = GameState()
+    assert not choice.is_available(state)
+
+    state_ref = weakref.ref(state)
+    del state
+    gc.collect()
+    assert state_ref() is None
+
+    assert pickle.loads(pickle.dumps(choice)) == choice
+    assert set(asdict(choice)) == {"id", "text", "prerequisites"}
+
+
+def test_prerequisite_pickles_as_plain_data():
+    """Test that prerequisites hold only their declared data"""
+    prereq = Prerequisite(type="has_item", target="itm_rope", value=1)
+    assert pickle.loads(pickle.dumps(prereq)) == prereq
+    assert asdict(prereq) == {"type": "has_item", "target": "itm_rope", "value": 1}
+
+
+def test_effect_pickles_as_plain_data():
+    """Test that effects hold only their declared data"""
+    effect = Effect(EffectType.ADD_ITEM, "itm_rope", 1)
+    assert pickle.loads(pickle.dumps(effect)) == effect
+    assert asdict(effect) == {
+        "operation": EffectType.ADD_ITEM,
+        "target": "itm_rope",
+        "value": 1,
+    }
+
+
 def test_effect_application():
     """Test effect application to game state"""
     state = GameState()
@@ -84,6 +150,20 @@ def test_effect_application():
     assert state.wagon_health == 80
 
 
+def test_effect_results():
+    """Test effect return values for failing and no-op operations"""
+    state = GameState()
+
+    assert not Effect(EffectType.REMOVE_ITEM, "itm_shovel", 1).apply(state)
+    assert not Effect(EffectType.MODIFY_RESOURCE, "gold", 5).apply(state)
+    assert Effect(EffectType.ADVANCE_TIME, None, 1).apply(state)
+
+    assert Effect(EffectType.SET_FLAG, "forded").apply(state)
+    assert state.flags["forded"]
+    assert Effect(EffectType.CLEAR_FLAG, "forded").apply(state)
+    assert "forded" not in state.flags
+
+
 def test_choice_availability():
     """Test that choices check prerequisites correctly"""
     state = GameState()
@@ -106,6 +186,57 @@ def test_choice_availability():
     assert not choice3.is_available(state)
 
 
+def test_choice_availability_follows_state_changes():
+    """Test that cached choice availability is refreshed when state changes"""
+    state = GameState()
+    choice = Choice(
+        id="c1",
+        text="Use shovel",
+        prerequisites=[Prerequisite(type="has_item", target="itm_shovel", value=1)],
+    )
+
+    assert not choice.is_available(state)
+    assert choice.get_lock_reason(state) == "Requires: itm_shovel x1"
+
+    Effect(EffectType.ADD_ITEM, "itm_shovel", 1).apply(state)
+    assert choice.is_available(state)
+    assert choice.get_lock_reason(state) is None
+
+    assert not choice.is_available(GameState())
+
+
+def test_choice_availability_follows_direct_writes():
+    """Test that direct writes to public state fields refresh cached availability"""
+    state = GameState()
+    flagged = Choice(
+        id="c1",
+        text="Greet the trader",
+        prerequisites=[Prerequisite(type="flag_set", target="met_trader")],
+    )
+    paid = Choice(
+        id="c2",
+        text="Pay the ferry",
+        prerequisites=[Prerequisite(type="min_resource", target="money", value=50)],
+    )
+    shovel = Choice(
+        id="c3",
+        text="Dig",
+        prerequisites=[Prerequisite(type="has_item", target="itm_shovel", value=1)],
+    )
+
+    assert not flagged.is_available(state)
+    assert paid.is_available(state)
+    assert not shovel.is_available(state)
+
+    state.flags["met_trader"] = True
+    state.money = 10
+    state.inventory["itm_shovel"] = 1
+
+    assert flagged.is_available(state)
+    assert not paid.is_available(state)
+    assert shovel.is_available(state)
+
+
 def test_event_validation():
     """Test event draft validation"""
     catalog = ItemCatalog()
@@ -140,6 +271,57 @@ def test_fallback_deck():
     assert len(errors) == 0
 
 
+def test_party_skill_max_tracks_party():
+    """Test that per-skill maxima follow party changes after a refresh"""
+    state = GameState()
+    assert state.party_skill_max == {"hunter": 6, "guide": 5, "doctor": 4}
+
+    state.party[0].skill_doctor = 9
+    version = state.version
+    state.refresh_party_skills()
+    assert state.party_skill_max["doctor"] == 9
+    assert state.version > version
+    assert Prerequisite(type="skill_check", target="doctor", value=9).is_met(state)
+
+
+def test_event_targets_are_interned():
+    """Test that effect and prerequisite targets share one string object"""
+    name = "".join(["mon", "ey"])
+    assert Effect(EffectType.MODIFY_RESOURCE, name, 5).target is sys.intern("money")
+    assert Prerequisite(type="min_resource", target=name, value=5).target is sys.intern("money")
+
+
+def test_resolution_apply_batch_matches_apply():
+    """Test that batch resolution gives the same results as single applies"""
+    resolution = EventResolution(
+        choice_id="hunt",
+        outcome=Outcome(
+            text="",
+            success_required={"skill": "hunter", "dc": 18},
+            success_text="success",
+            failure_text="failure",
+            effects=[Effect(EffectType.MODIFY_RESOURCE, "food", 10)],
+        ),
+    )
+    rng = random.Random(7)
+    expected_states = [GameState() for _ in range(20)]
+    expected = [resolution.apply(state, rng) for state in expected_states]
+
+    states = [GameState() for _ in range(20)]
+    assert resolution.apply_batch(states, random.Random(7)) == expected
+    assert {"success", "failure"} == set(expected)
+    assert [s.food for s in states] == [s.food for s in expected_states]
+
+
+def test_fallback_decks_share_content():
+    """Test that fallback decks reuse the prebuilt events and resolutions"""
+    first, second = FallbackDeck(), FallbackDeck()
+
+    assert first.events is second.events
+    assert first.resolutions is second.resolutions
+    assert first.get_resolution("fallback_rest", "rest").choice_id == "rest"
+
+
 def test_gemini_gateway_fallback():
     """Test that GeminiGateway falls back when no API key"""
     import os
@@ -0,0 +1,53 @@
+"""Tests for the Teams link ingestion CLI helpers"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "ingest_teams_link.py"
+
+
+@pytest.fixture
+def ingest(monkeypatch):
+    """A fresh copy of the script module, so its per-process caches start empty"""
+    spec = importlib.util.spec_from_file_location("ingest_teams_link", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+    return module
+
+
+@pytest.mark.asyncio
+async def test_tavily_key_resolved_once_for_concurrent_callers(ingest, monkeypatch):
+    calls = []
+
+    def resolve_cli():
+        calls.append(1)
+        return "tvly-key"
+
+    monkeypatch.setattr(ingest, "_resolve_tavily_key_cli", resolve_cli)
+
+    keys = await asyncio.gather(*(ingest._resolve_tavily_key() for _ in range(8)))
+
+    assert keys == ["tvly-key"] * 8
+    assert len(calls) == 1
+    assert await ingest._resolve_tavily_key() == "tvly-key"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_tavily_key_miss_is_cached(ingest, monkeypatch):
+    calls = []
+
+    def resolve_cli():
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(ingest, "_resolve_tavily_key_cli", resolve_cli)
+
+    assert await ingest._resolve_tavily_key() is None
+    assert await ingest._resolve_tavily_key() is None
+    assert len(calls) == 1